@@ -1,5 +1,6 @@
 import asyncio
 import time
+from collections.abc import Callable
 from datetime import timedelta
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.components import mqtt
@@ -17,14 +18,64 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.const import Platform
 
 from .const import (
+    ARCHIVE_DIR,
+    ARCHIVE_FLUSH_INTERVAL,
+    CONF_ADAPTIVE_RATE,
+    CONF_ALARM_HYSTERESIS,
+    CONF_ARCHIVE,
+    CONF_AVAILABILITY_HYSTERESIS,
+    CONF_BATTERY_THRESHOLD,
+    CONF_BROKER,
     CONF_DEVICE_NAME,
+    CONF_HTTP_HOST,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_PROBE_FILTER,
+    CONF_RATE_WINDOWS,
+    CONF_SET_BAND,
     CONF_TOPIC_PREFIX,
     DATA_COORDINATOR,
+    DATA_FLEET,
+    DATA_HTTP_SEMAPHORE,
     DATA_MQTT_UNSUBSCRIBE,
+    DEFAULT_ADAPTIVE_RATE,
+    DEFAULT_ALARM_HYSTERESIS,
+    DEFAULT_ARCHIVE,
+    DEFAULT_AVAILABILITY_HYSTERESIS,
+    DEFAULT_BATTERY_THRESHOLD,
+    DEFAULT_BROKER,
+    DEFAULT_HTTP_HOST,
+    DEFAULT_LONG_TERM_STATISTICS,
+    DEFAULT_PROBE_FILTER,
+    DEFAULT_RATE_WINDOWS,
+    DEFAULT_SET_BAND,
     DOMAIN,
+    DUTY_WINDOWS,
+    ETA_UPDATE_INTERVAL,
+    ETA_WINDOW_SECONDS,
+    EVENT_ALARM,
+    EVENT_BATTERY_LOW,
+    EVENT_CONNECTION,
+    EVENT_FIRE_OUT,
+    EVENT_LID_OPEN,
+    EVENT_PROBE,
+    EVENT_STALL,
+    EVENT_TARGET_REACHED,
+    FIRE_OUT_WINDOW_SECONDS,
+    HISTORY_CAPACITY,
+    HTTP_CHECK_INTERVAL,
+    LID_WINDOW_SECONDS,
+    RATE_FLAT_RATE,
+    RATE_NEAR_TARGET,
+    RATE_RAMP_MARGIN,
+    SIGNAL_CHANNEL_ALARM,
+    STALL_WINDOW_SECONDS,
+    STATISTICS_FLUSH_INTERVAL,
     TOPIC_STATUS_DATA,
     TOPIC_STATUS_SETTINGS,
     TOPIC_SET,
+    TOPIC_SET_CHANNELS,
+    TOPIC_SET_PITMASTER,
+    TOPIC_SET_SYSTEM,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,11 +99,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     topic_prefix = entry.data[CONF_TOPIC_PREFIX]
 
     # Create coordinator with explicit entry_id for storage
-    coordinator = WLANThermoDataCoordinator(hass, device_name, topic_prefix, entry.entry_id)
+    coordinator = WLANThermoDataCoordinator(
+        hass, device_name, topic_prefix, entry.entry_id, entry.options
+    )
     
     # Attempt to restore data immediately
     await coordinator.async_load_data()
     
+    # Devices on a separate broker share one connection per broker
+    if broker_url := entry.options.get(CONF_BROKER, DEFAULT_BROKER).strip():
+        coordinator.broker = await async_get_broker_pool(hass).async_acquire(broker_url)
+
     first_data_event = asyncio.Event()
 
     # Subscribe to MQTT topics
@@ -61,7 +118,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         """Handle new MQTT messages for status data."""
         try:
             payload = json.loads(msg.payload)
-            coordinator.async_set_data(payload)
+            coordinator.async_set_data(payload, message_time(msg))
             if not first_data_event.is_set():
                 first_data_event.set()
                 _LOGGER.debug("First data received, unblocking setup")
@@ -80,11 +137,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.error("Failed to decode MQTT settings payload: %s", msg.payload)
 
     # Subscribe
-    sub_data = await mqtt.async_subscribe(
-        hass, f"{topic_prefix}/{TOPIC_STATUS_DATA}", message_received_data, 0
+    sub_data = await coordinator.async_subscribe(
+        f"{topic_prefix}/{TOPIC_STATUS_DATA}", message_received_data
     )
-    sub_settings = await mqtt.async_subscribe(
-        hass, f"{topic_prefix}/{TOPIC_STATUS_SETTINGS}", message_received_settings, 0
+    sub_settings = await coordinator.async_subscribe(
+        f"{topic_prefix}/{TOPIC_STATUS_SETTINGS}", message_received_settings
     )
 
     # Setup offline detection (check every 30s)
@@ -94,11 +151,54 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator.check_offline()
 
     unsub_timer = async_track_time_interval(hass, check_offline_status, timedelta(seconds=30))
-    
+    unsubscribers = [sub_data, sub_settings, unsub_timer]
+
+    # Push completed long-term statistics hours in batches
+    if coordinator.statistics is not None:
+        @callback
+        def flush_statistics(_):
+            """Import completed statistics buckets."""
+            coordinator.statistics.async_flush(time.time())
+
+        unsubscribers.append(
+            async_track_time_interval(
+                hass, flush_statistics, timedelta(seconds=STATISTICS_FLUSH_INTERVAL)
+            )
+        )
+
+    # Write buffered archive rows in batches
+    if coordinator.archive is not None:
+        @callback
+        def flush_archive(_):
+            """Write buffered archive rows."""
+            coordinator.archive.async_flush()
+
+        unsubscribers.append(
+            async_track_time_interval(
+                hass, flush_archive, timedelta(seconds=ARCHIVE_FLUSH_INTERVAL)
+            )
+        )
+
+    # Poll the device's HTTP API while MQTT is stale
+    if coordinator.http is not None:
+        @callback
+        def check_transport(_):
+            """Switch between MQTT and HTTP by freshness."""
+            coordinator.http.async_check(time.time())
+
+        unsubscribers.append(
+            async_track_time_interval(
+                hass, check_transport, timedelta(seconds=HTTP_CHECK_INTERVAL)
+            )
+        )
+
     hass.data[DOMAIN][entry.entry_id] = {
         DATA_COORDINATOR: coordinator,
     }
-    hass.data[DOMAIN][entry.entry_id][DATA_MQTT_UNSUBSCRIBE] = [sub_data, sub_settings, unsub_timer]
+    hass.data[DOMAIN][entry.entry_id][DATA_MQTT_UNSUBSCRIBE] = unsubscribers
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    await async_setup_services(hass)
 
     # Send "get" command to trigger settings update from device
     # Many WLANThermo devices respond to {"get": "all"} or just an update on connection
@@ -106,45 +206,101 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         payload = json.dumps({"get": "all"})
         topic = f"{topic_prefix}/{TOPIC_SET}"
         _LOGGER.debug(f"Sending discovery command to {topic}: {payload}")
-        await mqtt.async_publish(hass, topic, payload)
+        await coordinator.async_mqtt_publish(topic, payload)
     except Exception as e:
         _LOGGER.warning(f"Could not send discovery command: {e}")
 
     # Force update by sending current time to set/system and set
-    # Strategy: Try multiple formats to hit the right one
+    # Strategy: Try both formats, later syncs learn the right one
     try:
-        ts = str(int(time.time()))
-        
-        # 1. Nesting: {"system": {"time": ...}} to .../set
-        payload_nested = json.dumps({"system": {"time": ts}})
-        topic_set = f"{topic_prefix}/{TOPIC_SET}"
-        await mqtt.async_publish(hass, topic_set, payload_nested)
-
-        # 2. Flat: {"time": ...} to .../set/system
-        payload_flat = json.dumps({"time": ts})
-        topic_system = f"{topic_prefix}/set/system"
-        await mqtt.async_publish(hass, topic_system, payload_flat)
-
-        _LOGGER.debug(f"Sent discovery shotgun: {payload_nested} to {topic_set} and {payload_flat} to {topic_system}")
+        await coordinator.async_send_time(TIME_SYNC_FORMATS)
+        coordinator.time_sync.sent(TIME_SYNC_FORMATS, time.time())
+        _LOGGER.debug(f"Sent discovery shotgun: current time in {TIME_SYNC_FORMATS} format")
     except Exception as e:
         _LOGGER.warning(f"Could not send time sync: {e}")
 
+    # Fetch the settings over HTTP instead of waiting for the "get" round trip
+    if coordinator.http is not None:
+        await coordinator.http.async_hydrate()
+
     # Initialize platforms immediately
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry."""
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        for unsub in entry_data[DATA_MQTT_UNSUBSCRIBE]:
+            unsub()
+        await entry_data[DATA_COORDINATOR].async_unload()
+        await async_unload_services(hass)
+    return unload_ok
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 # ...
 
     # ... (imports)
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
+
+from .alarm import ChannelAlarm
+from .archive import SessionArchive
+from .battery import BatteryMonitor
+from .broker_pool import BrokerConnection, async_get_broker_pool
+from .cadence import CadenceMonitor
+from .cook_summary import ChannelSummary
+from .duty_cycle import DutyCycleTracker
+from .eta import EtaTracker
+from .fleet import async_get_fleet
+from .http_transport import SOURCE_MQTT, HttpTransport
+from .latency import IngestLatency, message_time
+from .long_term_statistics import LongTermStatisticsAggregator
+from .pit_events import PitEventDetector
+from .probe_filter import ProbeFilter
+from .rate_control import (
+    ACTIVITY_FAST,
+    ACTIVITY_IDLE,
+    ACTIVITY_NORMAL,
+    TelemetryRateController,
+)
+from .services import async_setup_services, async_unload_services
+from .software_pid import SoftwarePitmaster
+from .stall import StallDetector
+from .streaming import SampleHistory
+from .time_sync import FORMAT_FLAT, FORMAT_NESTED, FORMATS as TIME_SYNC_FORMATS, TimeSync
 
 # ...
 
+
+def _parse_minutes(value: str, default: str) -> list[int]:
+    """Parse a comma separated list of minutes (e.g. "1, 5, 15")."""
+    try:
+        minutes = sorted({int(part) for part in str(value).split(",") if part.strip()})
+    except ValueError:
+        _LOGGER.warning(f"Invalid list of minutes '{value}', using '{default}'")
+        return _parse_minutes(default, default)
+    return [m for m in minutes if m > 0]
+
+
 class WLANThermoDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching WLANThermo data."""
 
     def __init__(
-        self, hass: HomeAssistant, device_name: str, topic_prefix: str, entry_id: str
+        self,
+        hass: HomeAssistant,
+        device_name: str,
+        topic_prefix: str,
+        entry_id: str,
+        options: dict[str, Any] | None = None,
     ) -> None:
         """Initialize."""
         super().__init__(
@@ -156,10 +312,103 @@ class WLANThermoDataCoordinator(DataUpdateCoordinator):
         self.topic_prefix = topic_prefix
         self.data: dict[str, Any] = {}
         self.last_update_time = 0.0
+        self.options = options or {}
         
         # Persistence
         self._store = Store(hass, 1, f"wlanthermo.{entry_id}")
 
+        # Long-term statistics (aggregated instead of per-sample recorder states)
+        self.statistics: LongTermStatisticsAggregator | None = None
+        if self.options.get(CONF_LONG_TERM_STATISTICS, DEFAULT_LONG_TERM_STATISTICS):
+            self.statistics = LongTermStatisticsAggregator(hass, device_name, topic_prefix)
+
+        # Cook sessions: a session starts with the first data after setup or
+        # after the device was offline
+        self.session_start: float | None = None
+        self.archive_directory = hass.config.path(ARCHIVE_DIR, slugify(topic_prefix))
+        self.archive: SessionArchive | None = None
+        if self.options.get(CONF_ARCHIVE, DEFAULT_ARCHIVE):
+            self.archive = SessionArchive(hass, self.archive_directory)
+
+        # Optional glitch filter stage in front of the channel temperatures
+        self.probe_filters: list[ProbeFilter] | None = None
+        if self.options.get(CONF_PROBE_FILTER, DEFAULT_PROBE_FILTER):
+            self.probe_filters = []
+        self._filter_hysteresis = int(
+            self.options.get(CONF_AVAILABILITY_HYSTERESIS, DEFAULT_AVAILABILITY_HYSTERESIS)
+        )
+
+        # Recent (timestamp, temp) samples per channel and rate-of-change windows
+        self.rate_windows = _parse_minutes(
+            self.options.get(CONF_RATE_WINDOWS, DEFAULT_RATE_WINDOWS), DEFAULT_RATE_WINDOWS
+        )
+        self.channel_history: list[SampleHistory] = []
+
+        # Time-to-target predictions (user targets override the alarm max)
+        self.eta = EtaTracker(ETA_UPDATE_INTERVAL)
+        self.eta_targets: dict[int, float] = {}
+
+        # Stall detection per channel
+        self.stalls: list[StallDetector] = []
+
+        # Lid-open / fire-out detection per pitmaster
+        self.pit_events: list[PitEventDetector] = []
+
+        # Actuator statistics per pitmaster for the current session
+        self.duty_cycles: list[DutyCycleTracker] = []
+
+        # HA-side alarm evaluation per channel
+        self.alarms: list[ChannelAlarm] = []
+        self.probe_connected: list[bool | None] = []  # None until first seen
+        self.targets_reached: set[int] = set()
+        self._alarm_hysteresis = self.options.get(CONF_ALARM_HYSTERESIS, DEFAULT_ALARM_HYSTERESIS)
+
+        # Running statistics per channel for the current session
+        self.summaries: list[ChannelSummary] = []
+        self._set_band = self.options.get(CONF_SET_BAND, DEFAULT_SET_BAND)
+
+        # Battery runtime of portable units
+        self.battery = BatteryMonitor()
+        self._battery_threshold = self.options.get(
+            CONF_BATTERY_THRESHOLD, DEFAULT_BATTERY_THRESHOLD
+        ) * 60
+
+        # Optional control of the device's MQTT publish interval
+        self.rate_control: TelemetryRateController | None = None
+        if self.options.get(CONF_ADAPTIVE_RATE, DEFAULT_ADAPTIVE_RATE):
+            self.rate_control = TelemetryRateController()
+        self._rate_store = Store(hass, 1, f"wlanthermo.{entry_id}.rate_control")
+
+        # Clock drift of the device and time sync scheduling
+        self.time_sync = TimeSync()
+
+        # Per-message latency from the device sample to the written states
+        self.latency = IngestLatency()
+
+        # Missed messages judged by the publish interval
+        self.cadence = CadenceMonitor()
+
+        # Shared connection to a separate broker, None for HA's MQTT integration
+        self.broker: BrokerConnection | None = None
+
+        # Optional HTTP fallback transport, used while MQTT is stale
+        self.last_mqtt_update = time.time()
+        self.http: HttpTransport | None = None
+        if host := self.options.get(CONF_HTTP_HOST, DEFAULT_HTTP_HOST).strip():
+            self.http = HttpTransport(hass, self, host)
+
+        # Running PID step test (one per device)
+        self.autotune_task: asyncio.Task | None = None
+
+        # HA-side control loops per pitmaster index
+        self.software_pitmasters: dict[int, SoftwarePitmaster] = {}
+        self._device_id: str | None = None
+
+        # Integration-wide aggregates
+        self._entry_id = entry_id
+        self.fleet = async_get_fleet(hass)
+        self.fleet.async_add_device(topic_prefix, device_name, entry_id)
+
     async def async_load_data(self) -> None:
         """Load data from storage."""
         try:
@@ -171,57 +420,613 @@ class WLANThermoDataCoordinator(DataUpdateCoordinator):
                 self.async_set_updated_data(self.data)
         except Exception as e:
             _LOGGER.warning(f"Error restoring data: {e}")
+        if self.statistics is not None:
+            await self.statistics.async_load()
+        if self.rate_control is not None and (stored := await self._rate_store.async_load()):
+            self.rate_control.restore(stored)
 
     @callback
-    def async_set_data(self, data: dict[str, Any]) -> None:
-        """Set data and notify listeners."""
-        self.last_update_time = time.time()
+    def async_set_data(
+        self,
+        data: dict[str, Any],
+        received: float | None = None,
+        source: str = SOURCE_MQTT,
+    ) -> None:
+        """Set data and notify listeners.
+
+        received is when the MQTT client got the message, if known. Polled
+        HTTP data doesn't count for the MQTT cadence.
+        """
+        now = time.time()
+        self.last_update_time = now
+        if source == SOURCE_MQTT:
+            self.last_mqtt_update = now
+            self.cadence.update(
+                now if received is None else received, self.publish_interval, self.offline_timeout
+            )
+        if self.probe_filters is not None and "channel" in data:
+            self._filter_channels(data["channel"])
+        was_offline = self.data.get("system", {}).get("online") is False
         self._merge_data(data)
         # Force online status if we receive data
         if "system" in self.data:
             self.data["system"]["online"] = True
+        if was_offline:
+            _LOGGER.info(f"WLANThermo {self.device_name} back online")
+            self.async_fire_event(EVENT_CONNECTION, {"type": "online"})
+
+        if self.session_start is None:
+            self._start_session(now)
+
+        if "channel" in data:
+            self._process_channels(now)
+            self._process_pitmasters(now)
+            if self.archive is not None:
+                self.archive.async_add_row(now, self.data)
+            if self.rate_control is not None:
+                self._process_rate(now)
+        if "pitmaster" in data:
+            self._process_duty_cycles(now)
+        if "system" in data:
+            self._process_battery(now)
+            self._process_time(data["system"], now if received is None else received)
+        self._update_fleet()
             
         self.async_set_updated_data(self.data)
+        self.latency.add(self._device_time(data.get("system")), received, now, time.time())
         
         # Save data occasionally (maybe just rely on settings for now to save IO?)
         # For now, let's NOT save on high-frequency data to protect SSDs/SD cards
         # unless specifically requested. We primarily need 'settings' persistent.
 
+    @callback
+    def _filter_channels(self, channels: list[dict[str, Any]]) -> None:
+        """Filter spikes and sentinel flips out of incoming temperatures."""
+        while len(self.probe_filters) < len(channels):
+            self.probe_filters.append(ProbeFilter(self._filter_hysteresis))
+        for idx, channel in enumerate(channels):
+            if "temp" in channel:
+                channel["temp"] = self.probe_filters[idx].filter(channel["temp"])
+
+    @callback
+    def _process_channels(self, now: float) -> None:
+        """Feed the current channel temperatures into the streaming consumers."""
+        channels = self.data.get("channel", [])
+        while len(self.channel_history) < len(channels):
+            self.channel_history.append(self._new_history())
+            self.stalls.append(StallDetector())
+            self.summaries.append(ChannelSummary())
+            self.alarms.append(ChannelAlarm())
+            self.probe_connected.append(None)
+
+        # Set temperatures of the channels controlled by an active pitmaster
+        set_temps = {
+            pm.get("channel"): pm.get("set")
+            for pm in self.data.get("pitmaster", {}).get("pm", [])
+            if pm.get("typ") != "off" and isinstance(pm.get("set"), (int, float))
+        }
+
+        for idx, channel in enumerate(channels):
+            temp = channel.get("temp")
+            history = self.channel_history[idx]
+            connected = temp is not None and temp != 999  # 999 = sensor not connected
+            if self.probe_connected[idx] is not None and self.probe_connected[idx] != connected:
+                self.async_fire_event(
+                    EVENT_PROBE,
+                    {
+                        "type": "connected" if connected else "disconnected",
+                        "channel": idx + 1,
+                    },
+                )
+            self.probe_connected[idx] = connected
+            alarm_min, alarm_max = channel.get("min"), channel.get("max")
+            if transition := self.alarms[idx].update(
+                float(temp) if connected else None,
+                alarm_min if isinstance(alarm_min, (int, float)) else None,
+                alarm_max if isinstance(alarm_max, (int, float)) else None,
+                self._alarm_hysteresis,
+                now,
+            ):
+                self._alarm_transition(idx, *transition, temp if connected else None)
+            self.summaries[idx].update(
+                float(temp) if connected else None,
+                channel.get("min"),
+                channel.get("max"),
+                set_temps.get(idx + 1),
+                self._set_band,
+                now,
+            )
+            if not connected:
+                self.targets_reached.discard(idx)
+                history.clear()
+                self.eta.clear(("channel", idx))
+                if self.stalls[idx].reset(now):
+                    self._fire_stall(idx, "end", None, now)
+                continue
+            history.add(now, float(temp))
+            target = self.eta_targets.get(idx) or channel.get("max")
+            self.eta.update(
+                ("channel", idx), history.window(ETA_WINDOW_SECONDS), float(temp), target, now
+            )
+            if isinstance(target, (int, float)):
+                self._check_target(idx, float(temp), target)
+            if transition := self.stalls[idx].update(
+                history.window(STALL_WINDOW_SECONDS), float(temp), now
+            ):
+                self._fire_stall(idx, transition, float(temp), now)
+            if self.statistics is not None:
+                self.statistics.async_add_sample(idx, temp, now)
+
+    @callback
+    def _process_pitmasters(self, now: float) -> None:
+        """Update the pitmaster predictions from their controlled channel."""
+        pms = self.data.get("pitmaster", {}).get("pm", [])
+        while len(self.pit_events) < len(pms):
+            self.pit_events.append(PitEventDetector())
+
+        for idx, pm in enumerate(pms):
+            history = self.pit_history(idx)
+            latest = history.latest() if history is not None else None
+            if latest is None or pm.get("typ") == "off":
+                self.eta.clear(("pitmaster", idx))
+                transitions = self.pit_events[idx].reset()
+            else:
+                self.eta.update(
+                    ("pitmaster", idx),
+                    history.window(ETA_WINDOW_SECONDS),
+                    latest[1],
+                    pm.get("set"),
+                    now,
+                )
+                transitions = self.pit_events[idx].update(
+                    history.window(LID_WINDOW_SECONDS),
+                    history.window(FIRE_OUT_WINDOW_SECONDS),
+                    latest[1],
+                    pm,
+                    now,
+                )
+
+            for detector, transition in transitions:
+                _LOGGER.info(f"WLANThermo {self.device_name} pitmaster {idx + 1} {detector} {transition}")
+                self.async_fire_event(
+                    EVENT_LID_OPEN if detector == "lid_open" else EVENT_FIRE_OUT,
+                    {
+                        "type": transition,
+                        "pitmaster": idx + 1,
+                        "temperature": None if latest is None else latest[1],
+                        "set": pm.get("set"),
+                        "value": pm.get("value"),
+                    },
+                )
+
+    @callback
+    def _process_duty_cycles(self, now: float) -> None:
+        """Update the actuator statistics from the pitmaster outputs."""
+        pms = self.data.get("pitmaster", {}).get("pm", [])
+        while len(self.duty_cycles) < len(pms):
+            self.duty_cycles.append(DutyCycleTracker(DUTY_WINDOWS))
+        for idx, pm in enumerate(pms):
+            value = pm.get("value")
+            if not isinstance(value, (int, float)):
+                value = None
+            self.duty_cycles[idx].update(value, pm.get("typ") != "off", now)
+
+    @callback
+    def _process_battery(self, now: float) -> None:
+        """Update the battery runtime and warn if it won't last."""
+        system = self.data.get("system", {})
+        soc = system.get("soc")
+        if not isinstance(soc, (int, float)):
+            return
+        # The cook ends when the last probe reaches its target
+        arrivals = [
+            eta.arrival
+            for idx in range(len(self.channel_history))
+            if (eta := self.eta.get(("channel", idx))) is not None and eta.arrival is not None
+        ]
+        cook_remaining = max(arrivals) - now if arrivals else None
+
+        reason = self.battery.update(
+            soc, bool(system.get("charge")), cook_remaining, self._battery_threshold, now
+        )
+        if reason is None:
+            return
+        runtime = self.battery.runtime
+        _LOGGER.warning(
+            f"WLANThermo {self.device_name} battery will last about {round(runtime / 60)} minutes"
+        )
+        self.async_fire_event(
+            EVENT_BATTERY_LOW,
+            {
+                "reason": reason,
+                "soc": soc,
+                "runtime_minutes": round(runtime / 60),
+                "cook_remaining_minutes": None if cook_remaining is None else round(cook_remaining / 60),
+                "confidence": self.battery.estimate.confidence,
+            },
+        )
+
+    @callback
+    def _process_rate(self, now: float) -> None:
+        """Adapt the device's publish interval to the current activity."""
+        interval = self.rate_control.update(self._telemetry_activity(), now)
+        if interval is None:
+            return
+        _LOGGER.debug(f"WLANThermo {self.device_name} publish interval -> {interval}s")
+        self.hass.async_create_task(self.async_set_publish_interval(interval))
+        self._rate_store.async_delay_save(self.rate_control.as_dict)
+
+    def _telemetry_activity(self) -> str:
+        """Classify how fast the device data is changing."""
+        if any(loop.running for loop in self.software_pitmasters.values()):
+            # Software control loops need fresh input
+            return ACTIVITY_FAST
+        idle = True
+        for idx, channel in enumerate(self.data.get("channel", [])):
+            if not self.probe_connected[idx]:
+                continue
+            temp = float(channel["temp"])
+            target = self.eta_targets.get(idx) or channel.get("max")
+            if (
+                isinstance(target, (int, float))
+                and idx not in self.targets_reached
+                and target - RATE_NEAR_TARGET <= temp < target
+            ):
+                return ACTIVITY_FAST
+            regression = self.channel_history[idx].window(ETA_WINDOW_SECONDS)
+            # A channel only counts as flat once half of the window is covered
+            slope = regression.slope if regression.span >= ETA_WINDOW_SECONDS / 2 else None
+            if slope is None or abs(slope * 60) > RATE_FLAT_RATE:
+                idle = False
+
+        for idx, pm in enumerate(self.data.get("pitmaster", {}).get("pm", [])):
+            if pm.get("typ") == "off":
+                continue
+            detector = self.pit_events[idx]
+            if detector.lid_open or detector.fire_out:
+                return ACTIVITY_FAST
+            history = self.pit_history(idx)
+            latest = history.latest() if history is not None else None
+            set_temp = pm.get("set")
+            if (
+                latest is None
+                or not isinstance(set_temp, (int, float))
+                or abs(latest[1] - set_temp) > RATE_RAMP_MARGIN
+            ):
+                return ACTIVITY_FAST
+        return ACTIVITY_IDLE if idle else ACTIVITY_NORMAL
+
+    async def async_set_publish_interval(self, interval: int) -> None:
+        """Set the MQTT publish interval of the device (iot.PMQint)."""
+        await self.async_publish(TOPIC_SET, {"iot": {"PMQint": interval}})
+        # Optimistic update, also stretches the offline timeout right away
+        self.data.setdefault("iot", {})["PMQint"] = interval
+
+    @staticmethod
+    def _device_time(system: dict[str, Any] | None) -> float | None:
+        """Return the device timestamp of a message (system.time), if any."""
+        try:
+            return float(system["time"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @callback
+    def _process_time(self, system: dict[str, Any], now: float) -> None:
+        """Measure the device clock drift and resync it if needed."""
+        if (device_time := self._device_time(system)) is None:
+            return
+        formats = self.time_sync.observe(device_time, now)
+        if formats is None:
+            return
+        _LOGGER.info(
+            f"WLANThermo {self.device_name} clock is {round(device_time - now)}s off, "
+            f"syncing ({', '.join(formats)})"
+        )
+        self.hass.async_create_task(self.async_send_time(formats))
+
+    async def async_send_time(self, formats: tuple[str, ...]) -> None:
+        """Send the current time to the device in the given payload formats."""
+        ts = str(int(time.time()))
+        if FORMAT_NESTED in formats:
+            await self.async_publish(TOPIC_SET, {"system": {"time": ts}})
+        if FORMAT_FLAT in formats:
+            await self.async_publish(TOPIC_SET_SYSTEM, {"time": ts})
+
+    @callback
+    def _update_fleet(self) -> None:
+        """Report this device's pits and online state to the fleet index."""
+        fleet = self.fleet
+        fleet.set_offline(self.topic_prefix, False)
+        for idx in range(len(self.data.get("pitmaster", {}).get("pm", []))):
+            history = self.pit_history(idx)
+            latest = history.latest() if history is not None else None
+            fleet.set_pit((self.topic_prefix, idx), None if latest is None else latest[1])
+        fleet.async_notify()
+
+    def pit_history(self, pm_idx: int) -> SampleHistory | None:
+        """Return the sample history of the channel a pitmaster controls."""
+        pms = self.data.get("pitmaster", {}).get("pm", [])
+        if pm_idx >= len(pms):
+            return None
+        channel = pms[pm_idx].get("channel")  # 1-based
+        if not isinstance(channel, int) or not 0 < channel <= len(self.channel_history):
+            return None
+        return self.channel_history[channel - 1]
+
+    @callback
+    def async_set_eta_target(self, channel_idx: int, target: float | None) -> None:
+        """Set the user target of a channel (None or 0 falls back to the alarm max)."""
+        if target:
+            self.eta_targets[channel_idx] = target
+        else:
+            self.eta_targets.pop(channel_idx, None)
+        # Recompute with the next message instead of waiting for the throttle
+        self.eta.clear(("channel", channel_idx))
+
+    @callback
+    def _check_target(self, channel_idx: int, temp: float, target: float) -> None:
+        """Fire an event when a channel reaches its target (once per crossing)."""
+        if channel_idx in self.targets_reached:
+            if temp < target - self._alarm_hysteresis:
+                self.targets_reached.discard(channel_idx)
+            return
+        if temp >= target:
+            self.targets_reached.add(channel_idx)
+            self.async_fire_event(
+                EVENT_TARGET_REACHED,
+                {"channel": channel_idx + 1, "target": target, "temperature": temp},
+            )
+
+    @callback
+    def _alarm_transition(
+        self, channel_idx: int, previous: str | None, new: str | None, temp: float | None
+    ) -> None:
+        """Publish an alarm state change to the event bus, fleet and binary sensor."""
+        channel = self.data["channel"][channel_idx]
+        _LOGGER.info(
+            f"WLANThermo {self.device_name} channel {channel_idx + 1} alarm {previous} -> {new}"
+        )
+        for transition, alarm in (("end", previous), ("start", new)):
+            if alarm is None:
+                continue
+            self.async_fire_event(
+                EVENT_ALARM,
+                {
+                    "type": transition,
+                    "alarm": alarm,
+                    "channel": channel_idx + 1,
+                    "temperature": temp,
+                    "limit": channel.get("max" if alarm == "high" else "min"),
+                },
+            )
+        self.fleet.set_alarm(
+            (self.topic_prefix, channel_idx),
+            f"{self.device_name} Channel {channel_idx + 1}",
+            new is not None,
+        )
+        async_dispatcher_send(
+            self.hass, SIGNAL_CHANNEL_ALARM.format(self.topic_prefix, channel_idx)
+        )
+
+    @callback
+    def _fire_stall(self, channel_idx: int, transition: str, temp: float | None, now: float) -> None:
+        """Fire a stall start/end event."""
+        stall = self.stalls[channel_idx]
+        duration = stall.duration(now)
+        _LOGGER.info(f"WLANThermo {self.device_name} channel {channel_idx + 1} stall {transition}")
+        self.async_fire_event(
+            EVENT_STALL,
+            {
+                "type": transition,
+                "channel": channel_idx + 1,
+                "temperature": temp,
+                "duration": None if duration is None else round(duration),
+            },
+        )
+
+    @property
+    def device_id(self) -> str | None:
+        """Return the device registry id of the main device."""
+        if self._device_id is None:
+            device = dr.async_get(self.hass).async_get_device(
+                identifiers={(DOMAIN, self.topic_prefix)}
+            )
+            if device is not None:
+                self._device_id = device.id
+        return self._device_id
+
+    @callback
+    def async_fire_event(self, event_type: str, data: dict[str, Any]) -> None:
+        """Fire an event on the bus, tagged with this device."""
+        self.hass.bus.async_fire(
+            event_type,
+            {
+                "device_id": self.device_id,
+                "device_name": self.device_name,
+                "topic_prefix": self.topic_prefix,
+                **data,
+            },
+        )
+
+    async def async_publish(self, topic: str, payload: Any) -> None:
+        """Publish a JSON payload to a topic below the device prefix."""
+        await self.async_mqtt_publish(f"{self.topic_prefix}/{topic}", json.dumps(payload))
+
+    async def async_mqtt_publish(self, topic: str, payload: str) -> None:
+        """Publish to the broker the device is connected to."""
+        if self.broker is not None:
+            self.broker.async_publish(topic, payload)
+        else:
+            await mqtt.async_publish(self.hass, topic, payload)
+
+    async def async_subscribe(self, topic: str, msg_callback) -> Callable[[], None]:
+        """Subscribe to a topic on the broker the device is connected to."""
+        if self.broker is not None:
+            return self.broker.async_subscribe(topic, msg_callback)
+        return await mqtt.async_subscribe(self.hass, topic, msg_callback, 0)
+
+    def _pitmaster_payload(self, pm_idx: int, **changes: Any) -> dict[str, Any]:
+        """Return the full payload object of a pitmaster with changed fields."""
+        pm_data = self.data["pitmaster"]["pm"][pm_idx]
+        return {
+            "id": pm_idx,
+            "channel": pm_data.get("channel", 1),
+            "pid": pm_data.get("pid", 0),
+            "value": pm_data.get("value", 0),
+            "set": pm_data.get("set", 0),
+            "typ": pm_data.get("typ", "off"),
+            **changes,
+        }
+
+    async def async_publish_pitmaster(self, pm_idx: int, **changes: Any) -> None:
+        """Write changed fields of a pitmaster with the full payload object."""
+        payload_obj = self._pitmaster_payload(pm_idx, **changes)
+        _LOGGER.debug(f"Writing Pitmaster {pm_idx}. Payload: {[payload_obj]}")
+        await self.async_publish(TOPIC_SET_PITMASTER, [payload_obj])
+
+        # Optimistic update
+        self.data["pitmaster"]["pm"][pm_idx].update(changes)
+        self.async_set_updated_data(self.data)
+
+    async def async_apply_changes(
+        self,
+        channels: dict[int, dict[str, Any]],
+        pitmasters: dict[int, dict[str, Any]],
+    ) -> None:
+        """Write changed channel and pitmaster fields in as few payloads as possible.
+
+        Each changed channel gets one set/channels payload with all of its
+        changed keys and all changed pitmasters go out as one set/pitmaster
+        list. The coordinator is updated once at the end.
+        """
+        for idx, changes in sorted(channels.items()):
+            await self.async_publish(TOPIC_SET_CHANNELS, {"number": idx + 1, **changes})
+        if pitmasters:
+            await self.async_publish(
+                TOPIC_SET_PITMASTER,
+                [
+                    self._pitmaster_payload(idx, **changes)
+                    for idx, changes in sorted(pitmasters.items())
+                ],
+            )
+
+        # Optimistic update
+        for idx, changes in channels.items():
+            self.data["channel"][idx].update(changes)
+        for idx, changes in pitmasters.items():
+            self.data["pitmaster"]["pm"][idx].update(changes)
+        self.async_set_updated_data(self.data)
+
+    def _new_history(self) -> SampleHistory:
+        """Create the sample history of a channel with all windows registered."""
+        history = SampleHistory(HISTORY_CAPACITY)
+        for minutes in self.rate_windows:
+            history.window(minutes * 60)
+        history.window(ETA_WINDOW_SECONDS)
+        history.window(STALL_WINDOW_SECONDS)
+        history.window(LID_WINDOW_SECONDS)
+        history.window(FIRE_OUT_WINDOW_SECONDS)
+        return history
+
+    def channel_rate(self, channel_idx: int, minutes: int) -> float | None:
+        """Return the temperature rate of change of a channel in °C/min."""
+        if channel_idx >= len(self.channel_history):
+            return None
+        regression = self.channel_history[channel_idx].window(minutes * 60)
+        # Wait until half of the window is covered to avoid noisy start values
+        if regression.span < minutes * 30:
+            return None
+        slope = regression.slope
+        return None if slope is None else slope * 60
+
+    @callback
+    def _start_session(self, now: float) -> None:
+        """Start a new cook session."""
+        self.session_start = now
+        for duty_cycle in self.duty_cycles:
+            duty_cycle.reset()
+        for summary in self.summaries:
+            summary.reset()
+        if self.archive is not None:
+            self.archive.async_start_session(now, self.data, self.device_name)
+
+    async def async_unload(self) -> None:
+        """Flush pending state when the config entry is unloaded."""
+        if self.autotune_task is not None:
+            self.autotune_task.cancel()
+        if self.http is not None:
+            await self.http.async_stop()
+        for loop in self.software_pitmasters.values():
+            await loop.async_stop()
+        rate_control = self.rate_control
+        if rate_control is not None and rate_control.interval != rate_control.base:
+            # Don't leave the device at an interval chosen here
+            await self.async_set_publish_interval(rate_control.base)
+            rate_control.interval = rate_control.base
+            await self._rate_store.async_save(rate_control.as_dict())
+        if self.statistics is not None:
+            await self.statistics.async_close(time.time())
+        if self.archive is not None:
+            await self.archive.async_close()
+        if self.broker is not None:
+            await async_get_broker_pool(self.hass).async_release(self.broker)
+        self.fleet.async_remove_device(self.topic_prefix, self._entry_id)
+        if not self.fleet.devices:
+            self.hass.data.pop(DATA_FLEET, None)
+            self.hass.data.pop(DATA_HTTP_SEMAPHORE, None)
+
     @callback
     def async_set_settings(self, settings: dict[str, Any]) -> None:
         """Set settings."""
         self.last_update_time = time.time()
         self._merge_data(settings)
+        interval = settings.get("iot", {}).get("PMQint")
+        if self.rate_control is not None and isinstance(interval, int):
+            if self.rate_control.set_reported(interval):
+                self._rate_store.async_delay_save(self.rate_control.as_dict)
         self.async_set_updated_data(self.data)
         
         # Persist settings when they change!
         self.hass.async_create_task(self._store.async_save(self.data))
         
+    @property
+    def publish_interval(self) -> int | None:
+        """Return the MQTT publish interval of the device (iot.PMQint)."""
+        try:
+            return int(self.data["iot"]["PMQint"])
+        except (KeyError, ValueError, TypeError):
+            return None
+
+    @property
+    def offline_timeout(self) -> int:
+        """Return the seconds without data after which the device is offline."""
+        # Determine timeout dynamically
+        # Default: 600s (safe fallback)
+        interval = self.publish_interval
+        if interval is None:
+            return 600
+        # Use 2.5x interval to be safe, but at least 60s
+        # Example: 30s -> 75s timeout
+        # Example: 300s -> 750s timeout
+        return max(60, interval * 2 + 15)
+
     @callback
     def check_offline(self) -> None:
         """Check if data is stale (offline)."""
         if self.last_update_time == 0.0:
             return
 
-        # Determine timeout dynamically
-        # Default: 600s (safe fallback)
-        timeout = 600
-        
-        # Try to read interval from settings (iot.PMQint)
-        if "iot" in self.data and "PMQint" in self.data["iot"]:
-            try:
-                interval = int(self.data["iot"]["PMQint"])
-                # Use 2.5x interval to be safe, but at least 60s
-                # Example: 30s -> 75s timeout
-                # Example: 300s -> 750s timeout
-                timeout = max(60, interval * 2 + 15)
-            except (ValueError, TypeError):
-                pass
-        
+        timeout = self.offline_timeout
         if time.time() - self.last_update_time > timeout:
             if "system" in self.data and self.data["system"].get("online") != False:
                 _LOGGER.warning(f"WLANThermo {self.device_name} offline (no data for >{timeout}s)")
                 self.data["system"]["online"] = False
+                self.session_start = None
+                self.fleet.set_offline(self.topic_prefix, True)
+                for idx in range(len(self.data.get("pitmaster", {}).get("pm", []))):
+                    self.fleet.set_pit((self.topic_prefix, idx), None)
+                self.fleet.async_notify()
+                self.async_fire_event(EVENT_CONNECTION, {"type": "offline"})
                 self.async_set_updated_data(self.data)
 
     # ... (rest of class)
@@ -272,6 +1077,12 @@ class WLANThermoDataCoordinator(DataUpdateCoordinator):
                 if key != "pm":
                     self.data["pitmaster"][key] = val
 
+        # IoT settings (publish interval)
+        if "iot" in new_data:
+            if "iot" not in self.data:
+                self.data["iot"] = {}
+            self.data["iot"].update(new_data["iot"])
+
         # PID Profiles (from settings)
         if "pid" in new_data:
             self.data["pid"] = new_data["pid"]
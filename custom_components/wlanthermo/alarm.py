@@ -0,0 +1,51 @@
+"""HA-side evaluation of the channel alarm limits."""
+from __future__ import annotations
+
+ALARM_HIGH = "high"
+ALARM_LOW = "low"
+
+
+class ChannelAlarm:
+    """Alarm state of one channel with hysteresis around its limits.
+
+    An alarm starts once the temperature leaves the min/max range and only
+    ends once it is back inside by the hysteresis, so a probe hovering at a
+    limit doesn't toggle. update() reports transitions only.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the alarm."""
+        self.state: str | None = None  # ALARM_HIGH, ALARM_LOW or None
+        self.since: float | None = None
+
+    def update(
+        self,
+        temp: float | None,
+        alarm_min: float | None,
+        alarm_max: float | None,
+        hysteresis: float,
+        now: float,
+    ) -> tuple[str | None, str | None] | None:
+        """Evaluate a temperature (None if disconnected).
+
+        Returns (previous, new) state on a transition, None otherwise.
+        """
+        state = self.state
+        if temp is None:
+            new = None
+        elif alarm_max is not None and (
+            temp > alarm_max or (state == ALARM_HIGH and temp > alarm_max - hysteresis)
+        ):
+            new = ALARM_HIGH
+        elif alarm_min is not None and (
+            temp < alarm_min or (state == ALARM_LOW and temp < alarm_min + hysteresis)
+        ):
+            new = ALARM_LOW
+        else:
+            new = None
+
+        if new == state:
+            return None
+        self.state = new
+        self.since = now if new is not None else None
+        return state, new
@@ -0,0 +1,321 @@
+"""Batch analytics over archived WLANThermo cook sessions.
+
+Each session file is loaded into NumPy arrays once and all metrics are
+computed with array operations. Sessions are independent, so they are fanned
+out over a process pool; the pool uses the spawn start method because
+forking the multi-threaded Home Assistant process is not safe.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import json
+import logging
+import multiprocessing
+import os
+from typing import Any
+
+import numpy as np
+
+from .archive import iter_session_rows, list_sessions, read_session_header
+from .const import (
+    ANALYTICS_RAMP_MARGIN,
+    ANALYTICS_RESAMPLE_SECONDS,
+    DUTY_MAX_GAP_SECONDS,
+    STALL_ENTER_RATE,
+    STALL_EXIT_RATE,
+    STALL_MAX_TEMP,
+    STALL_MIN_TEMP,
+    STALL_WINDOW_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionArrays:
+    """Samples of one archived session as arrays (rows are messages)."""
+
+    start: float
+    device: str
+    names: list[str]  # Channel names at session start, used as cut label
+    t: np.ndarray  # (rows,)
+    temps: np.ndarray  # (rows, channels), NaN while disconnected
+    value: np.ndarray  # (rows, pitmasters) output in %
+    set_temp: np.ndarray  # (rows, pitmasters)
+    auto: np.ndarray  # (rows, pitmasters) pitmaster in auto mode
+    pit_channel: np.ndarray  # (rows, pitmasters) 1-based, 0 if unknown
+
+
+def load_session(path: str) -> SessionArrays | None:
+    """Load a session file into arrays. Returns None for too short sessions."""
+    header = read_session_header(path)
+    t, temps, pms = [], [], []
+    for row in iter_session_rows(path):
+        t.append(row["t"])
+        temps.append(row.get("channel", []))
+        pms.append(row.get("pm", []))
+    if len(t) < 2:
+        return None
+
+    rows = len(t)
+    channels = max(len(row) for row in temps)
+    pitmasters = max(len(row) for row in pms)
+    temp_arr = np.full((rows, channels), np.nan)
+    value = np.full((rows, pitmasters), np.nan)
+    set_temp = np.full((rows, pitmasters), np.nan)
+    auto = np.zeros((rows, pitmasters), dtype=bool)
+    pit_channel = np.zeros((rows, pitmasters), dtype=int)
+    for i, (row_temps, row_pms) in enumerate(zip(temps, pms)):
+        temp_arr[i, : len(row_temps)] = np.array(row_temps, dtype=float)
+        for j, pm in enumerate(row_pms):
+            value[i, j] = _number(pm.get("value"))
+            set_temp[i, j] = _number(pm.get("set"))
+            auto[i, j] = pm.get("typ") == "auto"
+            channel = pm.get("channel")
+            pit_channel[i, j] = channel if isinstance(channel, int) else 0
+
+    return SessionArrays(
+        start=header.get("session", t[0]),
+        device=header.get("device", ""),
+        names=header.get("channels", []),
+        t=np.array(t, dtype=float),
+        temps=temp_arr,
+        value=value,
+        set_temp=set_temp,
+        auto=auto,
+        pit_channel=pit_channel,
+    )
+
+
+def _number(value: Any) -> float:
+    """Return a payload value as float (NaN if missing)."""
+    return float(value) if isinstance(value, (int, float)) else np.nan
+
+
+def _durations(t: np.ndarray) -> np.ndarray:
+    """Return how long each sample was held, zero across message gaps."""
+    dt = np.diff(t, append=t[-1])
+    dt[dt > DUTY_MAX_GAP_SECONDS] = 0
+    return dt
+
+
+def stall_minutes(t: np.ndarray, temps: np.ndarray) -> float | None:
+    """Return the longest stall of one channel in minutes (None if none).
+
+    The channel is resampled to a fixed grid, so the trailing-window slope is
+    a shifted difference. As in the live detector a stall needs a rising
+    channel that flattens below the enter rate inside the stall band, and it
+    lasts until the slope exceeds the exit rate again.
+    """
+    valid = ~np.isnan(temps)
+    if valid.sum() < 2:
+        return None
+    grid = np.arange(t[valid][0], t[valid][-1], ANALYTICS_RESAMPLE_SECONDS)
+    window = int(STALL_WINDOW_SECONDS // ANALYTICS_RESAMPLE_SECONDS)
+    if len(grid) <= window:
+        return None
+    y = np.interp(grid, t[valid], temps[valid])
+
+    rate = np.full(len(grid), np.nan)
+    rate[window:] = (y[window:] - y[:-window]) / STALL_WINDOW_SECONDS * 60
+    with np.errstate(invalid="ignore"):
+        rising = np.maximum.accumulate(rate > STALL_EXIT_RATE)
+        in_band = (y >= STALL_MIN_TEMP - 5) & (y <= STALL_MAX_TEMP)
+        holding = rising & in_band & (rate <= STALL_EXIT_RATE)
+        entering = holding & (rate < STALL_ENTER_RATE) & (y >= STALL_MIN_TEMP)
+
+    edges = np.diff(np.concatenate(([0], holding.astype(np.int8), [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    enter_idx = np.flatnonzero(entering)
+    if not len(starts) or not len(enter_idx):
+        return None
+    # First enter sample of each run; runs without one are no stall
+    first_enter = enter_idx[np.minimum(np.searchsorted(enter_idx, starts), len(enter_idx) - 1)]
+    is_stall = (first_enter >= starts) & (first_enter < ends)
+    if not is_stall.any():
+        return None
+    # The plateau began roughly when the window started flattening
+    lengths = (ends - first_enter)[is_stall] * ANALYTICS_RESAMPLE_SECONDS + STALL_WINDOW_SECONDS
+    return round(float(lengths.max()) / 60, 1)
+
+
+def pitmaster_metrics(session: SessionArrays, pm_idx: int) -> dict[str, Any] | None:
+    """Return stability, ramp-up and fuel metrics of one pitmaster."""
+    auto = session.auto[:, pm_idx]
+    if not auto.any():
+        return None
+    channels = session.pit_channel[auto, pm_idx]
+    channel = int(np.bincount(channels).argmax())
+    if not 0 < channel <= session.temps.shape[1]:
+        return None
+
+    t = session.t
+    dt = _durations(t)
+    pit = session.temps[:, channel - 1]
+    set_temp = session.set_temp[:, pm_idx]
+    value = session.value[:, pm_idx]
+    valid = auto & ~np.isnan(pit) & ~np.isnan(set_temp)
+    if not valid.any():
+        return None
+
+    # Ramp-up ends once the pit first comes within the margin of the set temperature
+    with np.errstate(invalid="ignore"):
+        reached = valid & (pit >= set_temp - ANALYTICS_RAMP_MARGIN)
+    first_auto = int(np.argmax(auto))
+    ramp_up = None
+    if reached.any():
+        first_reached = int(np.argmax(reached))
+        ramp_up = round(float(t[first_reached] - t[first_auto]) / 60, 1)
+        holding = valid & (np.arange(len(t)) >= first_reached)
+    else:
+        holding = np.zeros_like(valid)
+
+    metrics: dict[str, Any] = {
+        "channel": channel,
+        "ramp_up_minutes": ramp_up,
+        "set_mean": None,
+        "std_dev": None,
+        "mean_abs_error": None,
+    }
+    weights = dt * holding
+    if weights.sum() > 0:
+        error = (pit - set_temp)[holding]
+        w = weights[holding]
+        mean = np.average(error, weights=w)
+        metrics["set_mean"] = round(float(np.average(set_temp[holding], weights=w)), 1)
+        metrics["std_dev"] = round(float(np.sqrt(np.average((error - mean) ** 2, weights=w))), 2)
+        metrics["mean_abs_error"] = round(float(np.average(np.abs(error), weights=w)), 2)
+
+    # Fuel proxy: output integrated over the time in auto mode
+    auto_dt = dt * (auto & ~np.isnan(value))
+    auto_hours = auto_dt.sum() / 3600
+    full_load_hours = float(np.nansum(value * auto_dt)) / 100 / 3600
+    metrics["output_mean"] = (
+        round(full_load_hours / auto_hours * 100, 1) if auto_hours > 0 else None
+    )
+    metrics["full_load_hours"] = round(full_load_hours, 3)
+    metrics["auto_hours"] = round(float(auto_hours), 2)
+    return metrics
+
+
+def analyze_session(path: str) -> dict[str, Any] | None:
+    """Compute the metrics of one session file (runs in a worker process)."""
+    session = load_session(path)
+    if session is None:
+        return None
+    channels = []
+    for idx in range(session.temps.shape[1]):
+        temps = session.temps[:, idx]
+        if np.isnan(temps).all():
+            continue
+        channels.append(
+            {
+                "channel": idx + 1,
+                "name": session.names[idx] if idx < len(session.names) else None,
+                "max_temp": round(float(np.nanmax(temps)), 1),
+                "stall_minutes": stall_minutes(session.t, temps),
+            }
+        )
+    pitmasters = []
+    for pm_idx in range(session.value.shape[1]):
+        if (metrics := pitmaster_metrics(session, pm_idx)) is not None:
+            pitmasters.append({"pitmaster": pm_idx + 1, **metrics})
+    return {
+        "file": os.path.basename(path),
+        "device": session.device,
+        "start": _iso(session.start),
+        "duration_hours": round(float(session.t[-1] - session.t[0]) / 3600, 2),
+        "channels": channels,
+        "pitmasters": pitmasters,
+    }
+
+
+def _iso(ts: float) -> str:
+    """Return a timestamp as ISO 8601 string in UTC."""
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+def _mean(values: list[float]) -> float | None:
+    """Return the rounded mean of a list (None if empty)."""
+    return round(float(np.mean(values)), 2) if values else None
+
+
+def summarize(sessions: list[dict[str, Any]]) -> dict[str, Any]:
+    """Aggregate the session metrics per cut (channel name) and over all pits."""
+    stalls: dict[str, list[float]] = {}
+    for session in sessions:
+        for channel in session["channels"]:
+            if channel["stall_minutes"] is not None:
+                stalls.setdefault(channel["name"] or f"Channel {channel['channel']}", []).append(
+                    channel["stall_minutes"]
+                )
+    pits = [pm for session in sessions for pm in session["pitmasters"]]
+
+    def values(key: str) -> list[float]:
+        return [pm[key] for pm in pits if pm[key] is not None]
+
+    fuel_rates = [
+        pm["full_load_hours"] / pm["auto_hours"] for pm in pits if pm["auto_hours"] > 0
+    ]
+    return {
+        "sessions": len(sessions),
+        "cuts": {
+            name: {"stalls": len(lengths), "stall_minutes_mean": _mean(lengths)}
+            for name, lengths in sorted(stalls.items())
+        },
+        "pit": {
+            "std_dev_mean": _mean(values("std_dev")),
+            "mean_abs_error_mean": _mean(values("mean_abs_error")),
+            "ramp_up_minutes_mean": _mean(values("ramp_up_minutes")),
+            "full_load_hours_per_hour": _mean(fuel_rates),
+        },
+    }
+
+
+def session_paths(directories: list[str], start: float | None, end: float | None) -> list[str]:
+    """Return the session files that started inside the time range."""
+    paths = []
+    for directory in directories:
+        for path in list_sessions(directory):
+            session_start = read_session_header(path).get("session")
+            if session_start is None:
+                continue
+            if start is not None and session_start < start:
+                continue
+            if end is not None and session_start > end:
+                continue
+            paths.append(path)
+    return paths
+
+
+def run_analytics(
+    directories: list[str],
+    path: str,
+    start: float | None = None,
+    end: float | None = None,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """Analyze all sessions on a process pool and write the summary file.
+
+    Blocks until done, so it must run in an executor thread.
+    """
+    paths = session_paths(directories, start, end)
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            results = list(pool.map(analyze_session, paths))
+    else:
+        # Not worth starting processes for a single session
+        results = [analyze_session(session_path) for session_path in paths]
+    sessions = [result for result in results if result is not None]
+
+    summary = {"created": _iso(datetime.now(timezone.utc).timestamp()), **summarize(sessions)}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({**summary, "session_metrics": sessions}, file, indent=2)
+    _LOGGER.info("Analyzed %s sessions into %s", len(sessions), path)
+    return summary
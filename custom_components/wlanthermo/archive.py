@@ -0,0 +1,162 @@
+"""Session archive for WLANThermo cook data."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timezone
+import json
+import logging
+import os
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+ARCHIVE_VERSION = 1
+SESSION_SUFFIX = ".jsonl"
+
+
+def session_file_name(start: float) -> str:
+    """Return the file name of a session started at the given time."""
+    return datetime.fromtimestamp(start, tz=timezone.utc).strftime("%Y%m%dT%H%M%S") + SESSION_SUFFIX
+
+
+def list_sessions(directory: str) -> list[str]:
+    """Return the session files of a device, oldest first."""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.endswith(SESSION_SUFFIX)
+    )
+
+
+def read_session_header(path: str) -> dict[str, Any]:
+    """Return the header line of a session file."""
+    with open(path, encoding="utf-8") as file:
+        line = file.readline()
+    try:
+        header = json.loads(line)
+    except json.JSONDecodeError:
+        return {}
+    return header if "session" in header else {}
+
+
+def iter_session_rows(
+    path: str, start: float | None = None, end: float | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yield the sample rows of one session file, line by line."""
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Tolerate a truncated last line after a crash
+            ts = row.get("t")
+            if ts is None:
+                continue  # Header
+            if start is not None and ts < start:
+                continue
+            if end is not None and ts > end:
+                return
+            yield row
+
+
+def iter_archive_rows(
+    directory: str, start: float | None = None, end: float | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yield the sample rows of all sessions overlapping the time range."""
+    sessions = list_sessions(directory)
+    for idx, path in enumerate(sessions):
+        # Sessions are sorted by start time, so the next one bounds this one
+        if idx + 1 < len(sessions) and start is not None:
+            next_header = read_session_header(sessions[idx + 1])
+            if next_header.get("session", float("inf")) < start:
+                continue
+        header = read_session_header(path)
+        if end is not None and header.get("session", 0) > end:
+            return
+        yield from iter_session_rows(path, start, end)
+
+
+def _append_lines(path: str, lines: list[str]) -> None:
+    """Append lines to a session file (runs in the executor)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as file:
+        file.writelines(lines)
+
+
+class SessionArchive:
+    """Append-only archive of the samples of each cook session.
+
+    Every session is one JSON-lines file: a header line followed by one
+    compact row per received data message. Rows are buffered in memory and
+    written in batches from the executor, so the event loop never blocks on
+    disk I/O and the SD card sees one write per flush interval.
+    """
+
+    def __init__(self, hass: HomeAssistant, directory: str) -> None:
+        """Initialize the archive."""
+        self.hass = hass
+        self.directory = directory
+        self._path: str | None = None
+        self._pending: list[str] = []
+
+    @callback
+    def async_start_session(self, now: float, data: dict[str, Any], device_name: str) -> None:
+        """Start a new session file."""
+        self.async_flush()
+        self._path = os.path.join(self.directory, session_file_name(now))
+        header = {
+            "session": round(now, 1),
+            "version": ARCHIVE_VERSION,
+            "device": device_name,
+            "channels": [ch.get("name") for ch in data.get("channel", [])],
+        }
+        self._pending.append(json.dumps(header) + "\n")
+        _LOGGER.debug("Started archive session %s", self._path)
+
+    @callback
+    def async_add_row(self, now: float, data: dict[str, Any]) -> None:
+        """Buffer one sample row built from the merged coordinator data."""
+        if self._path is None:
+            return
+        row: dict[str, Any] = {
+            "t": round(now, 1),
+            "channel": [
+                None if ch.get("temp") in (None, 999) else ch.get("temp")
+                for ch in data.get("channel", [])
+            ],
+        }
+        pms = data.get("pitmaster", {}).get("pm", [])
+        if pms:
+            row["pm"] = [
+                {
+                    "value": pm.get("value"),
+                    "set": pm.get("set"),
+                    "typ": pm.get("typ"),
+                    "channel": pm.get("channel"),
+                }
+                for pm in pms
+            ]
+        self._pending.append(json.dumps(row, separators=(",", ":")) + "\n")
+
+    @callback
+    def async_flush(self) -> None:
+        """Write the buffered rows in the executor."""
+        if not self._pending or self._path is None:
+            return
+        lines, self._pending = self._pending, []
+        self.hass.async_add_executor_job(_append_lines, self._path, lines)
+
+    async def async_write_pending(self) -> None:
+        """Write the buffered rows and wait for the write to finish."""
+        if self._pending and self._path is not None:
+            lines, self._pending = self._pending, []
+            await self.hass.async_add_executor_job(_append_lines, self._path, lines)
+
+    async def async_close(self) -> None:
+        """Write the remaining rows and end the session."""
+        await self.async_write_pending()
+        self._path = None
@@ -0,0 +1,234 @@
+"""PID auto-tuning from pit step responses.
+
+The model fit needs NumPy and runs in an executor thread. A step response
+is either recorded live (step test through the pitmaster's manual value) or
+taken from recorded session data.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass
+import logging
+import time
+from typing import Any
+
+import numpy as np
+
+from homeassistant.core import callback
+
+from .const import (
+    AUTOTUNE_BASELINE_SECONDS,
+    AUTOTUNE_MAX_POINTS,
+    AUTOTUNE_MAX_SAMPLES,
+    EVENT_AUTOTUNE,
+)
+from .probe_filter import NOT_CONNECTED
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class FopdtModel:
+    """First-order-plus-dead-time model of the pit: K·e^(-θs) / (τs + 1)."""
+
+    gain: float  # °C per % output
+    time_constant: float  # τ in seconds
+    dead_time: float  # θ in seconds
+    baseline: float  # Pit temperature before the step
+    rmse: float  # Fit error in °C
+
+
+@dataclass
+class PidProposal:
+    """Proposed PID parameters (output in %, error in °C, time in seconds)."""
+
+    kp: float
+    ki: float
+    kd: float
+
+
+def _downsample(t: np.ndarray, y: np.ndarray, points: int) -> tuple[np.ndarray, np.ndarray]:
+    """Average samples into at most `points` equal time bins."""
+    if len(t) <= points:
+        return t, y
+    edges = np.linspace(t[0], t[-1], points + 1)
+    idx = np.clip(np.searchsorted(edges, t, side="right") - 1, 0, points - 1)
+    counts = np.bincount(idx, minlength=points)
+    keep = counts > 0
+    t_mean = np.bincount(idx, weights=t, minlength=points)[keep] / counts[keep]
+    y_mean = np.bincount(idx, weights=y, minlength=points)[keep] / counts[keep]
+    return t_mean, y_mean
+
+
+def fit_fopdt(t: np.ndarray, y: np.ndarray, step: float) -> FopdtModel:
+    """Fit a FOPDT model to a step response.
+
+    t is in seconds relative to the step (samples before 0 give the
+    baseline), y the pit temperature and step the output change in %. For a
+    grid of dead times and time constants the gain follows from linear least
+    squares, so the whole search is a few vectorized array operations.
+    """
+    t = np.asarray(t, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if len(t) == 0:
+        raise ValueError("No samples recorded")
+    before = t < 0
+    baseline = float(y[before].mean()) if before.any() else float(y[0])
+
+    t_after, y_after = _downsample(t[~before], y[~before], AUTOTUNE_MAX_POINTS)
+    if len(t_after) < 10:
+        raise ValueError("Not enough samples after the step")
+    dy = y_after - baseline
+    duration = float(t_after[-1])
+    if duration <= 0:
+        raise ValueError("Step response has no duration")
+
+    dead_times = np.linspace(0, 0.5 * duration, 41)
+    time_constants = np.geomspace(duration / 100, 3 * duration, 60)
+
+    shifted = np.clip(t_after[None, None, :] - dead_times[:, None, None], 0, None)
+    basis = 1 - np.exp(-shifted / time_constants[None, :, None])
+    numerator = basis @ dy
+    denominator = np.einsum("ijk,ijk->ij", basis, basis)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sse = dy @ dy - np.where(denominator > 0, numerator**2 / denominator, 0)
+    i, j = np.unravel_index(np.nanargmin(sse), sse.shape)
+
+    response_gain = numerator[i, j] / denominator[i, j]
+    rmse = float(np.sqrt(max(sse[i, j], 0) / len(dy)))
+    return FopdtModel(
+        gain=float(response_gain / step),
+        time_constant=float(time_constants[j]),
+        dead_time=float(dead_times[i]),
+        baseline=baseline,
+        rmse=rmse,
+    )
+
+
+def tune_pid(model: FopdtModel) -> PidProposal:
+    """Propose PID parameters with the IMC rules for a FOPDT model.
+
+    The closed-loop time constant is kept at least as long as the dead time
+    and a quarter of the time constant, which gives the calm response a
+    smoker needs rather than the fastest possible one.
+    """
+    if model.gain <= 0:
+        raise ValueError("Pit temperature did not rise with more output")
+    tau, theta = model.time_constant, model.dead_time
+    closed_loop = max(theta, 0.25 * tau)
+    kc = (tau + theta / 2) / (model.gain * (closed_loop + theta / 2))
+    integral_time = tau + theta / 2
+    derivative_time = tau * theta / (2 * tau + theta)
+    return PidProposal(
+        kp=round(kc, 3),
+        ki=round(kc / integral_time, 5),
+        kd=round(kc * derivative_time, 2),
+    )
+
+
+def analyze_rows(
+    rows, names: list[str], temp_column: str, value_column: str
+) -> tuple[FopdtModel, PidProposal]:
+    """Fit recorded session data: find the largest output step and analyze it.
+
+    rows are (timestamp, values) pairs as produced by export.build_rows,
+    names the column names of the values.
+    """
+    temp_pos, value_pos = names.index(temp_column), names.index(value_column)
+    t, y, u = [], [], []
+    for ts, values in rows:
+        if values[temp_pos] in (None, NOT_CONNECTED) or values[value_pos] is None:
+            continue
+        t.append(ts)
+        y.append(values[temp_pos])
+        u.append(values[value_pos])
+    if len(t) < 20:
+        raise ValueError("Not enough recorded samples in the time range")
+
+    t_arr, y_arr, u_arr = np.array(t), np.array(y, dtype=float), np.array(u, dtype=float)
+    steps = np.diff(u_arr)
+    step_idx = int(np.argmax(np.abs(steps)))
+    step = float(steps[step_idx])
+    if abs(step) < 5:
+        raise ValueError("No output step of at least 5% in the time range")
+
+    # Use the response until the output changes again
+    end = step_idx + 1
+    while end < len(u_arr) and u_arr[end] == u_arr[step_idx + 1]:
+        end += 1
+    start = int(np.searchsorted(t_arr, t_arr[step_idx] - AUTOTUNE_BASELINE_SECONDS))
+    t_step = t_arr[step_idx + 1]
+    model = fit_fopdt(t_arr[start:end] - t_step, y_arr[start:end], step)
+    return model, tune_pid(model)
+
+
+class StepTest:
+    """Live step test through the pitmaster's manual value.
+
+    Holds the current output for a baseline period, steps it, records the pit
+    channel for the test duration and restores the previous pitmaster mode.
+    """
+
+    def __init__(self, coordinator, pm_idx: int, step: float, duration: float) -> None:
+        """Initialize the test."""
+        self.coordinator = coordinator
+        self.pm_idx = pm_idx
+        self.step = step
+        self.duration = duration
+        self.samples: list[tuple[float, float]] = []
+        self._step_time: float | None = None
+
+    @callback
+    def _record(self) -> None:
+        """Record the pit temperature on every coordinator update."""
+        history = self.coordinator.pit_history(self.pm_idx)
+        latest = history.latest() if history is not None else None
+        if latest is None or len(self.samples) >= AUTOTUNE_MAX_SAMPLES:
+            return
+        if not self.samples or latest[0] > self.samples[-1][0]:
+            self.samples.append(latest)
+
+    async def async_run(self) -> dict[str, Any]:
+        """Run the test and return the fitted model and proposal."""
+        hass = self.coordinator.hass
+        pm = dict(self.coordinator.data["pitmaster"]["pm"][self.pm_idx])
+        base_value = pm.get("value") or 0
+        step_value = max(0, min(100, base_value + self.step))
+        step = step_value - base_value
+        if step == 0:
+            raise ValueError("The step would leave the 0-100% output range")
+
+        unsub = self.coordinator.async_add_listener(self._record)
+        try:
+            await self.coordinator.async_publish_pitmaster(self.pm_idx, typ="manual", value=int(base_value))
+            await asyncio.sleep(AUTOTUNE_BASELINE_SECONDS)
+            self._step_time = time.time()
+            await self.coordinator.async_publish_pitmaster(self.pm_idx, typ="manual", value=int(step_value))
+            await asyncio.sleep(self.duration)
+        finally:
+            unsub()
+            await self.coordinator.async_publish_pitmaster(
+                self.pm_idx, typ=pm.get("typ", "off"), value=pm.get("value", 0)
+            )
+
+        if not self.samples:
+            raise ValueError("No samples recorded, is the device online?")
+        t = np.array([s[0] for s in self.samples]) - self._step_time
+        y = np.array([s[1] for s in self.samples])
+        model = await hass.async_add_executor_job(fit_fopdt, t, y, step)
+        proposal = tune_pid(model)
+        return result_data(model, proposal)
+
+
+def result_data(model: FopdtModel, proposal: PidProposal) -> dict[str, Any]:
+    """Return the event data of a tuning result."""
+    return {"model": asdict(model), "proposal": asdict(proposal)}
+
+
+@callback
+def async_report(coordinator, pm_idx: int, result: dict[str, Any]) -> None:
+    """Fire the result event and log the proposal."""
+    _LOGGER.info(
+        f"PID auto-tune for {coordinator.device_name} pitmaster {pm_idx + 1}: {result}"
+    )
+    coordinator.async_fire_event(EVENT_AUTOTUNE, {"pitmaster": pm_idx + 1, **result})
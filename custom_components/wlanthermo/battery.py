@@ -0,0 +1,89 @@
+"""Battery runtime prediction for portable WLANThermo units."""
+from __future__ import annotations
+
+from .const import (
+    BATTERY_MIN_CONFIDENCE,
+    BATTERY_SAMPLE_INTERVAL,
+    BATTERY_WINDOW_SECONDS,
+)
+from .eta import Eta, estimate
+from .streaming import SampleHistory
+
+REASON_THRESHOLD = "threshold"
+REASON_ETA = "eta"
+
+
+class BatteryMonitor:
+    """Runtime estimate from the discharge slope of the state of charge.
+
+    The state of charge only changes in whole percent over many minutes, so
+    one sample per interval is enough and the window regression stays small.
+    Charging (flagged or seen as a rising charge) restarts the estimate, and
+    each low-battery warning is given once per discharge.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the monitor."""
+        capacity = int(BATTERY_WINDOW_SECONDS / BATTERY_SAMPLE_INTERVAL) + 16
+        self.history = SampleHistory(capacity)
+        self.regression = self.history.window(BATTERY_WINDOW_SECONDS)
+        self.charging = False
+        self.estimate: Eta | None = None
+        self._warned: set[str] = set()
+
+    @property
+    def runtime(self) -> float | None:
+        """Return the predicted runtime in seconds."""
+        return None if self.estimate is None else self.estimate.remaining
+
+    @property
+    def discharge_rate(self) -> float | None:
+        """Return the discharge rate in %/h."""
+        slope = self.regression.slope
+        return None if slope is None else -slope * 3600
+
+    def _restart(self) -> None:
+        """Forget the discharge samples."""
+        self.history.clear()
+        self.estimate = None
+
+    def update(
+        self,
+        soc: float,
+        charging: bool,
+        cook_remaining: float | None,
+        threshold: float,
+        now: float,
+    ) -> str | None:
+        """Feed the battery state. Returns a low-battery reason once per discharge.
+
+        cook_remaining is the time until the last probe reaches its target,
+        threshold the warning threshold of the runtime, both in seconds.
+        """
+        latest = self.history.latest()
+        if charging or (latest is not None and soc > latest[1] + 1):
+            # Plugged in (or charged without the flag): no discharge to extrapolate
+            self._restart()
+            self.charging = charging
+            self._warned.clear()
+            return None
+        self.charging = False
+
+        if latest is not None and now - latest[0] < BATTERY_SAMPLE_INTERVAL:
+            return None
+        self.history.add(now, soc)
+        self.estimate = estimate(self.regression, soc, 0, now)
+
+        runtime = self.estimate.remaining
+        if runtime is None or self.estimate.confidence < BATTERY_MIN_CONFIDENCE:
+            return None
+        if runtime < threshold:
+            reason = REASON_THRESHOLD
+        elif cook_remaining is not None and runtime < cook_remaining:
+            reason = REASON_ETA
+        else:
+            return None
+        if reason in self._warned:
+            return None
+        self._warned.add(reason)
+        return reason
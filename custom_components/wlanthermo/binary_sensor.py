@@ -7,10 +7,13 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import DATA_COORDINATOR, DOMAIN
+from .const import DATA_COORDINATOR, DOMAIN, SIGNAL_CHANNEL_ALARM
 
 
 async def async_setup_entry(
@@ -49,11 +52,19 @@ async def async_setup_entry(
             ]
         )
         
+        # Add stall detection per channel
+        if "channel" in coordinator.data:
+            for idx, channel in enumerate(coordinator.data["channel"]):
+                entities.append(WLANThermoStallBinarySensor(coordinator, idx))
+                entities.append(WLANThermoChannelAlarmBinarySensor(coordinator, idx))
+
         # Add pitmaster active binary sensors (optional, if useful)
         if "pitmaster" in coordinator.data and "pm" in coordinator.data["pitmaster"]:
             for idx, pm in enumerate(coordinator.data["pitmaster"]["pm"]):
                  if pm.get("typ") != "off": # Or logic to determine if active
                      pass # Maybe not strictly a binary sensor needed if we have select/mode
+                 entities.append(WLANThermoPitEventBinarySensor(coordinator, idx, "lid_open"))
+                 entities.append(WLANThermoPitEventBinarySensor(coordinator, idx, "fire_out"))
 
         async_add_entities(entities)
 
@@ -102,3 +113,166 @@ class WLANThermoBinarySensor(CoordinatorEntity, BinarySensorEntity):
     def device_info(self):
         """Return device info."""
         return self.coordinator.device_info
+
+
+class WLANThermoStallBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """On while a channel is in a stall (temperature plateau)."""
+
+    _attr_icon = "mdi:timer-pause-outline"
+
+    def __init__(self, coordinator, channel_idx: int) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._channel_idx = channel_idx
+        self._attr_name = f"{coordinator.device_name} Channel {channel_idx + 1} Stall"
+        self._attr_unique_id = f"{coordinator.topic_prefix}_channel_{channel_idx}_stall"
+
+    def _stall(self):
+        """Return the stall detector of the channel."""
+        if self._channel_idx < len(self.coordinator.stalls):
+            return self.coordinator.stalls[self._channel_idx]
+        return None
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return true while the channel is stalled."""
+        stall = self._stall()
+        return None if stall is None else stall.active
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any] | None:
+        """Return stall start time and duration."""
+        stall = self._stall()
+        if stall is None or stall.start is None:
+            return None
+        duration = stall.duration(self.coordinator.last_update_time)
+        return {
+            "stall_start": dt_util.utc_from_timestamp(stall.start).isoformat(),
+            "duration_minutes": None if duration is None else round(duration / 60),
+        }
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, f"{self.coordinator.topic_prefix}_channel_{self._channel_idx}")},
+            name=f"{self.coordinator.device_name} Channel {self._channel_idx + 1}",
+            via_device=(DOMAIN, self.coordinator.topic_prefix),
+            manufacturer="WLANThermo",
+            model="Channel Sensor",
+        )
+
+
+class WLANThermoChannelAlarmBinarySensor(BinarySensorEntity):
+    """On while a channel is outside its alarm limits (evaluated in HA).
+
+    Not a coordinator entity: the state is only written when the alarm
+    state changes, so steady-state messages cause no state writes.
+    """
+
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_should_poll = False
+
+    def __init__(self, coordinator, channel_idx: int) -> None:
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self._channel_idx = channel_idx
+        self._attr_name = f"{coordinator.device_name} Channel {channel_idx + 1} Alarm"
+        self._attr_unique_id = f"{coordinator.topic_prefix}_channel_{channel_idx}_alarm_active"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to alarm transitions of the channel."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_CHANNEL_ALARM.format(self.coordinator.topic_prefix, self._channel_idx),
+                self.async_write_ha_state,
+            )
+        )
+
+    def _alarm(self):
+        """Return the alarm state of the channel."""
+        if self._channel_idx < len(self.coordinator.alarms):
+            return self.coordinator.alarms[self._channel_idx]
+        return None
+
+    @property
+    def is_on(self) -> bool:
+        """Return true while the channel is in alarm."""
+        alarm = self._alarm()
+        return alarm is not None and alarm.state is not None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any] | None:
+        """Return the alarm type and start time."""
+        alarm = self._alarm()
+        if alarm is None or alarm.state is None:
+            return None
+        return {
+            "alarm": alarm.state,
+            "since": dt_util.utc_from_timestamp(alarm.since).isoformat(),
+        }
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, f"{self.coordinator.topic_prefix}_channel_{self._channel_idx}")},
+            name=f"{self.coordinator.device_name} Channel {self._channel_idx + 1}",
+            via_device=(DOMAIN, self.coordinator.topic_prefix),
+            manufacturer="WLANThermo",
+            model="Channel Sensor",
+        )
+
+
+class WLANThermoPitEventBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """Lid-open or fire-out state of a pitmaster's controlled channel."""
+
+    _NAMES = {"lid_open": "Lid Open", "fire_out": "Fire Out"}
+    _DEVICE_CLASSES = {
+        "lid_open": BinarySensorDeviceClass.OPENING,
+        "fire_out": BinarySensorDeviceClass.PROBLEM,
+    }
+
+    def __init__(self, coordinator, pm_idx: int, detector: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._pm_idx = pm_idx
+        self._detector = detector
+        self._attr_name = f"{coordinator.device_name} Pitmaster {pm_idx + 1} {self._NAMES[detector]}"
+        self._attr_unique_id = f"{coordinator.topic_prefix}_pitmaster_{pm_idx}_{detector}"
+        self._attr_device_class = self._DEVICE_CLASSES[detector]
+
+    def _events(self):
+        """Return the detector of the pitmaster."""
+        if self._pm_idx < len(self.coordinator.pit_events):
+            return self.coordinator.pit_events[self._pm_idx]
+        return None
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return true while the condition is detected."""
+        events = self._events()
+        if events is None:
+            return None
+        return events.lid_open if self._detector == "lid_open" else events.fire_out
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any] | None:
+        """Return since when the condition is detected."""
+        events = self._events()
+        if events is None or not self.is_on:
+            return None
+        since = events.lid_open_since if self._detector == "lid_open" else events.fire_out_since
+        return {"since": dt_util.utc_from_timestamp(since).isoformat()}
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, f"{self.coordinator.topic_prefix}_pitmaster_{self._pm_idx}")},
+            name=f"{self.coordinator.device_name} Pitmaster {self._pm_idx + 1}",
+            via_device=(DOMAIN, self.coordinator.topic_prefix),
+            manufacturer="WLANThermo",
+            model="Pitmaster",
+        )
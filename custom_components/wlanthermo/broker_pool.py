@@ -0,0 +1,221 @@
+"""Shared connections to MQTT brokers other than the one of HA's MQTT integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+import secrets
+import time
+from urllib.parse import urlsplit
+
+import paho.mqtt.client as paho
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    BROKER_DEFAULT_PORT,
+    BROKER_KEEPALIVE,
+    BROKER_MAX_INFLIGHT,
+    BROKER_MAX_QUEUED,
+    BROKER_RECONNECT_MAX,
+    BROKER_RECONNECT_MIN,
+    DATA_BROKER_POOL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+MessageCallback = Callable[["BrokerMessage"], None]
+
+
+@dataclass(frozen=True)
+class BrokerMessage:
+    """Received message, shaped like the messages of HA's MQTT integration."""
+
+    topic: str
+    payload: str
+    qos: int
+    retain: bool
+    timestamp: float  # time.monotonic() on receipt, see latency.message_time
+
+
+def _new_client(client_id: str) -> paho.Client:
+    """Create a paho client with the version 2 callback API if available."""
+    if hasattr(paho, "CallbackAPIVersion"):
+        return paho.Client(paho.CallbackAPIVersion.VERSION2, client_id=client_id)
+    return paho.Client(client_id=client_id)
+
+
+class BrokerConnection:
+    """One MQTT session to a broker, shared by all devices publishing there.
+
+    Devices subscribe exact topics. Topics are grouped by their parent
+    level into one wildcard subscription (e.g. <prefix>/status/+ for data
+    and settings), and incoming messages are dispatched to the handlers by
+    topic. paho runs the network loop in its own thread with its own
+    reconnect backoff and in-flight/queue limits; everything else happens
+    in the event loop.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: str, url: str) -> None:
+        """Initialize the connection."""
+        self.hass = hass
+        self.key = key
+        parts = urlsplit(url if "://" in url else f"mqtt://{url}")
+        self.host = parts.hostname or ""
+        self.port = parts.port or BROKER_DEFAULT_PORT
+        self.connected = False
+        self.users = 0
+        self._handlers: dict[str, list[MessageCallback]] = {}
+        self._filters: dict[str, int] = {}  # Wildcard subscription -> topic count
+
+        self._tls = parts.scheme == "mqtts"
+        self._client = _new_client(f"wlanthermo_{secrets.token_hex(4)}")
+        if parts.username:
+            self._client.username_pw_set(parts.username, parts.password)
+        self._client.reconnect_delay_set(BROKER_RECONNECT_MIN, BROKER_RECONNECT_MAX)
+        self._client.max_inflight_messages_set(BROKER_MAX_INFLIGHT)
+        self._client.max_queued_messages_set(BROKER_MAX_QUEUED)
+        self._client.on_connect = self._on_connect
+        self._client.on_disconnect = self._on_disconnect
+        self._client.on_message = self._on_message
+
+    def start(self) -> None:
+        """Connect in the background; paho keeps reconnecting from here (blocking)."""
+        if self._tls:
+            self._client.tls_set()
+        self._client.connect_async(self.host, self.port, BROKER_KEEPALIVE)
+        self._client.loop_start()
+
+    def stop(self) -> None:
+        """Disconnect and join the network thread (blocking)."""
+        self._client.disconnect()
+        self._client.loop_stop()
+
+    @staticmethod
+    def _filter(topic: str) -> str:
+        """Return the wildcard subscription covering a topic."""
+        parent, _, _ = topic.rpartition("/")
+        return f"{parent}/+" if parent else topic
+
+    @callback
+    def async_subscribe(self, topic: str, msg_callback: MessageCallback) -> Callable[[], None]:
+        """Subscribe a handler to an exact topic, return the unsubscribe callback."""
+        self._handlers.setdefault(topic, []).append(msg_callback)
+        topic_filter = self._filter(topic)
+        self._filters[topic_filter] = self._filters.get(topic_filter, 0) + 1
+        if self._filters[topic_filter] == 1 and self.connected:
+            self._client.subscribe(topic_filter)
+
+        @callback
+        def async_unsubscribe() -> None:
+            """Remove the handler and drop the subscription once unused."""
+            self._handlers[topic].remove(msg_callback)
+            if not self._handlers[topic]:
+                del self._handlers[topic]
+            self._filters[topic_filter] -= 1
+            if not self._filters[topic_filter]:
+                del self._filters[topic_filter]
+                if self.connected:
+                    self._client.unsubscribe(topic_filter)
+
+        return async_unsubscribe
+
+    @callback
+    def async_publish(self, topic: str, payload: str, qos: int = 0, retain: bool = False) -> None:
+        """Queue a message for the network thread."""
+        info = self._client.publish(topic, payload, qos, retain)
+        if info.rc != paho.MQTT_ERR_SUCCESS:
+            _LOGGER.warning(
+                f"Could not publish to {topic} on {self.key}: {paho.error_string(info.rc)}"
+            )
+
+    # Network thread callbacks, handed over to the event loop
+
+    def _on_connect(self, client, userdata, flags, reason_code, *args) -> None:
+        """Handle a (re)connect."""
+        self.hass.loop.call_soon_threadsafe(self._async_connected, reason_code == 0)
+
+    def _on_disconnect(self, client, userdata, *args) -> None:
+        """Handle a lost connection; paho reconnects on its own."""
+        self.hass.loop.call_soon_threadsafe(self._async_disconnected)
+
+    def _on_message(self, client, userdata, msg) -> None:
+        """Hand a message over to the event loop."""
+        message = BrokerMessage(
+            msg.topic,
+            msg.payload.decode("utf-8", errors="replace"),
+            msg.qos,
+            bool(msg.retain),
+            time.monotonic(),
+        )
+        self.hass.loop.call_soon_threadsafe(self._async_dispatch, message)
+
+    @callback
+    def _async_connected(self, success: bool) -> None:
+        """Resubscribe after a (re)connect, the session isn't persistent."""
+        if not success:
+            _LOGGER.warning(f"Connection to MQTT broker {self.key} refused")
+            return
+        _LOGGER.info(f"Connected to MQTT broker {self.key}")
+        self.connected = True
+        if self._filters:
+            self._client.subscribe([(topic_filter, 0) for topic_filter in self._filters])
+
+    @callback
+    def _async_disconnected(self) -> None:
+        """Mark the connection as down."""
+        if self.connected:
+            _LOGGER.warning(f"Lost connection to MQTT broker {self.key}")
+        self.connected = False
+
+    @callback
+    def _async_dispatch(self, message: BrokerMessage) -> None:
+        """Pass a message to the handlers of its topic."""
+        for msg_callback in list(self._handlers.get(message.topic, ())):
+            msg_callback(message)
+
+
+class BrokerPool:
+    """Broker connections shared by all config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the pool."""
+        self.hass = hass
+        self.connections: dict[str, BrokerConnection] = {}
+
+    @staticmethod
+    def _key(url: str) -> str:
+        """Return the pool key of a broker URL (user included)."""
+        parts = urlsplit(url if "://" in url else f"mqtt://{url}")
+        user = f"{parts.username}@" if parts.username else ""
+        return f"{parts.scheme}://{user}{parts.hostname}:{parts.port or BROKER_DEFAULT_PORT}"
+
+    async def async_acquire(self, url: str) -> BrokerConnection:
+        """Return the connection to a broker, connecting on first use."""
+        key = self._key(url)
+        connection = self.connections.get(key)
+        if connection is not None:
+            connection.users += 1
+            return connection
+        connection = self.connections[key] = BrokerConnection(self.hass, key, url)
+        connection.users += 1
+        await self.hass.async_add_executor_job(connection.start)
+        return connection
+
+    async def async_release(self, connection: BrokerConnection) -> None:
+        """Release a connection, closing it when no entry uses it anymore."""
+        connection.users -= 1
+        if connection.users:
+            return
+        self.connections.pop(connection.key, None)
+        if not self.connections:
+            self.hass.data.pop(DATA_BROKER_POOL, None)
+        connection.connected = False
+        await self.hass.async_add_executor_job(connection.stop)
+
+
+def async_get_broker_pool(hass: HomeAssistant) -> BrokerPool:
+    """Return the broker pool, creating it on first use."""
+    if (pool := hass.data.get(DATA_BROKER_POOL)) is None:
+        pool = hass.data[DATA_BROKER_POOL] = BrokerPool(hass)
+    return pool
@@ -0,0 +1,67 @@
+"""Message gap and loss detection from the telemetry cadence."""
+from __future__ import annotations
+
+from collections import deque
+
+from .const import CADENCE_WINDOW, CADENCE_WINDOW_SECONDS
+from .latency import RollingPercentiles
+
+
+class CadenceMonitor:
+    """Missed status/data messages judged by the expected publish interval.
+
+    The expected interval is the device's iot.PMQint, or the median of the
+    observed inter-arrival times while that is unknown. A gap of n
+    intervals means n - 1 missed messages. Gaps beyond the offline timeout
+    are outages rather than losses, and a gap across an interval change
+    isn't judged at all.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the monitor."""
+        self.intervals = RollingPercentiles(CADENCE_WINDOW)
+        self.received = 0
+        self.missed = 0
+        self.outages = 0
+        self.longest_gap: float | None = None
+        self.expected: float | None = None
+        self._last: float | None = None
+        self._window: deque[tuple[float, int]] = deque()  # (arrival, missed before it)
+        self._window_missed = 0
+
+    @property
+    def median_interval(self) -> float | None:
+        """Return the median observed inter-arrival time."""
+        return self.intervals.percentile(50)
+
+    @property
+    def delivery_ratio(self) -> float | None:
+        """Return the share of expected messages received within the window."""
+        if not self._window:
+            return None
+        received = len(self._window)
+        return received / (received + self._window_missed)
+
+    def update(self, now: float, interval: int | None, offline_timeout: float) -> None:
+        """Register a status/data message received at now."""
+        expected = interval or self.median_interval
+        last, previous_expected = self._last, self.expected
+        self._last, self.expected = now, expected
+        self.received += 1
+        missed = 0
+        if last is not None:
+            gap = now - last
+            self.intervals.add(gap)
+            if gap > offline_timeout:
+                self.outages += 1
+            else:
+                self.longest_gap = gap if self.longest_gap is None else max(self.longest_gap, gap)
+                if expected and expected == previous_expected:
+                    missed = max(0, round(gap / expected) - 1)
+        self.missed += missed
+
+        window = self._window
+        window.append((now, missed))
+        self._window_missed += missed
+        while window and window[0][0] < now - CADENCE_WINDOW_SECONDS:
+            self._window_missed -= window.popleft()[1]
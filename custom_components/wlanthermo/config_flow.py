@@ -13,9 +13,33 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
 
 from .const import (
+    CONF_ADAPTIVE_RATE,
+    CONF_ALARM_HYSTERESIS,
+    CONF_ARCHIVE,
+    CONF_AVAILABILITY_HYSTERESIS,
+    CONF_BATTERY_THRESHOLD,
+    CONF_BROKER,
     CONF_DEVICE_NAME,
+    CONF_HTTP_HOST,
+    CONF_LEAN_ATTRIBUTES,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_PROBE_FILTER,
+    CONF_RATE_WINDOWS,
+    CONF_SET_BAND,
     CONF_TOPIC_PREFIX,
+    DEFAULT_ADAPTIVE_RATE,
+    DEFAULT_ALARM_HYSTERESIS,
+    DEFAULT_ARCHIVE,
+    DEFAULT_AVAILABILITY_HYSTERESIS,
+    DEFAULT_BATTERY_THRESHOLD,
+    DEFAULT_BROKER,
+    DEFAULT_HTTP_HOST,
+    DEFAULT_LEAN_ATTRIBUTES,
+    DEFAULT_LONG_TERM_STATISTICS,
     DEFAULT_NAME,
+    DEFAULT_PROBE_FILTER,
+    DEFAULT_RATE_WINDOWS,
+    DEFAULT_SET_BAND,
     DEFAULT_TOPIC_PREFIX,
     DOMAIN,
 )
@@ -103,6 +127,58 @@ class WLANThermoOptionsFlowHandler(config_entries.OptionsFlow):
                     {
                         vol.Optional(CONF_DEVICE_NAME, default=current_name): cv.string,
                         vol.Optional(CONF_TOPIC_PREFIX, default=current_topic): cv.string,
+                        vol.Optional(
+                            CONF_LONG_TERM_STATISTICS,
+                            default=options.get(
+                                CONF_LONG_TERM_STATISTICS, DEFAULT_LONG_TERM_STATISTICS
+                            ),
+                        ): cv.boolean,
+                        vol.Optional(
+                            CONF_ARCHIVE,
+                            default=options.get(CONF_ARCHIVE, DEFAULT_ARCHIVE),
+                        ): cv.boolean,
+                        vol.Optional(
+                            CONF_LEAN_ATTRIBUTES,
+                            default=options.get(CONF_LEAN_ATTRIBUTES, DEFAULT_LEAN_ATTRIBUTES),
+                        ): cv.boolean,
+                        vol.Optional(
+                            CONF_RATE_WINDOWS,
+                            default=options.get(CONF_RATE_WINDOWS, DEFAULT_RATE_WINDOWS),
+                        ): cv.string,
+                        vol.Optional(
+                            CONF_PROBE_FILTER,
+                            default=options.get(CONF_PROBE_FILTER, DEFAULT_PROBE_FILTER),
+                        ): cv.boolean,
+                        vol.Optional(
+                            CONF_AVAILABILITY_HYSTERESIS,
+                            default=options.get(
+                                CONF_AVAILABILITY_HYSTERESIS, DEFAULT_AVAILABILITY_HYSTERESIS
+                            ),
+                        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+                        vol.Optional(
+                            CONF_BATTERY_THRESHOLD,
+                            default=options.get(CONF_BATTERY_THRESHOLD, DEFAULT_BATTERY_THRESHOLD),
+                        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1440)),
+                        vol.Optional(
+                            CONF_SET_BAND,
+                            default=options.get(CONF_SET_BAND, DEFAULT_SET_BAND),
+                        ): vol.All(vol.Coerce(float), vol.Range(min=1, max=50)),
+                        vol.Optional(
+                            CONF_ALARM_HYSTERESIS,
+                            default=options.get(CONF_ALARM_HYSTERESIS, DEFAULT_ALARM_HYSTERESIS),
+                        ): vol.All(vol.Coerce(float), vol.Range(min=0, max=20)),
+                        vol.Optional(
+                            CONF_ADAPTIVE_RATE,
+                            default=options.get(CONF_ADAPTIVE_RATE, DEFAULT_ADAPTIVE_RATE),
+                        ): cv.boolean,
+                        vol.Optional(
+                            CONF_HTTP_HOST,
+                            default=options.get(CONF_HTTP_HOST, DEFAULT_HTTP_HOST),
+                        ): cv.string,
+                        vol.Optional(
+                            CONF_BROKER,
+                            default=options.get(CONF_BROKER, DEFAULT_BROKER),
+                        ): cv.string,
                     }
                 ),
             )
@@ -5,6 +5,18 @@ DOMAIN = "wlanthermo"
 # Configuration
 CONF_DEVICE_NAME = "device_name"
 CONF_TOPIC_PREFIX = "topic_prefix"
+CONF_LONG_TERM_STATISTICS = "long_term_statistics"
+CONF_ARCHIVE = "archive"
+CONF_LEAN_ATTRIBUTES = "lean_attributes"
+CONF_RATE_WINDOWS = "rate_windows"
+CONF_PROBE_FILTER = "probe_filter"
+CONF_AVAILABILITY_HYSTERESIS = "availability_hysteresis"
+CONF_BATTERY_THRESHOLD = "battery_threshold"
+CONF_SET_BAND = "set_band"
+CONF_ALARM_HYSTERESIS = "alarm_hysteresis"
+CONF_ADAPTIVE_RATE = "adaptive_rate"
+CONF_HTTP_HOST = "http_host"
+CONF_BROKER = "broker"
 
 # MQTT Topics
 TOPIC_STATUS_DATA = "status/data"
@@ -12,10 +24,162 @@ TOPIC_STATUS_SETTINGS = "status/settings"
 TOPIC_SET_CHANNELS = "set/channels"
 TOPIC_SET_PITMASTER = "set/pitmaster"
 TOPIC_SET = "set"
+TOPIC_SET_SYSTEM = "set/system"
 
 # Default values
 DEFAULT_NAME = "WLANThermo"
 DEFAULT_TOPIC_PREFIX = "WLanThermo/MINI-V3"
+DEFAULT_LONG_TERM_STATISTICS = False
+DEFAULT_ARCHIVE = False
+DEFAULT_LEAN_ATTRIBUTES = False
+DEFAULT_RATE_WINDOWS = "1, 5, 15"  # Minutes
+DEFAULT_PROBE_FILTER = False
+DEFAULT_AVAILABILITY_HYSTERESIS = 3  # Samples
+DEFAULT_BATTERY_THRESHOLD = 60  # Minutes
+DEFAULT_SET_BAND = 10  # °C around the pitmaster set temperature
+DEFAULT_ALARM_HYSTERESIS = 1.0  # °C back inside the limits that ends an alarm
+DEFAULT_ADAPTIVE_RATE = False
+DEFAULT_HTTP_HOST = ""  # Empty: no HTTP fallback
+DEFAULT_BROKER = ""  # Empty: broker of the MQTT integration
+
+# Long-term statistics
+STATISTICS_BUCKET_SECONDS = 300  # 5 minute aggregation buckets
+STATISTICS_FLUSH_INTERVAL = 300  # Check for completed hours every 5 minutes
+STATISTICS_STORAGE_KEY = f"{DOMAIN}.statistics"  # Buckets of the open hour across reloads
+
+# Session archive and export
+ARCHIVE_DIR = "wlanthermo/archive"
+ARCHIVE_FLUSH_INTERVAL = 60  # Batch archive writes to protect SD cards
+EXPORT_DIR = "wlanthermo/exports"
+EXPORT_CHUNK_SECONDS = 3600  # Recorder history is read one hour at a time
+
+# Cook presets (shared by all devices)
+PRESETS_STORAGE_KEY = f"{DOMAIN}.presets"
+
+# Per-channel sample history
+HISTORY_CAPACITY = 2048  # Samples per channel (e.g. > 30 minutes at 1 message/s)
+
+# Probe glitch filter
+PROBE_FILTER_WINDOW = 5  # Samples in the Hampel window
+PROBE_FILTER_THRESHOLD = 3.0  # Multiples of the (scaled) median absolute deviation
+PROBE_FILTER_MIN_DEVIATION = 5.0  # °C, never flag smaller deviations as spikes
+
+# Time-to-target prediction
+ETA_WINDOW_SECONDS = 600  # Trend window for the extrapolation
+ETA_UPDATE_INTERVAL = 60  # Recompute at most once per minute
+
+# Stall detection
+STALL_WINDOW_SECONDS = 1200  # Slope window (20 minutes)
+STALL_ENTER_RATE = 0.05  # °C/min, flatter than this starts a stall
+STALL_EXIT_RATE = 0.15  # °C/min, steeper than this ends it (hysteresis)
+STALL_MIN_TEMP = 55  # °C, typical stall band of large cuts
+STALL_MAX_TEMP = 85
+
+# Lid-open and fire-out detection on the pit channel
+LID_WINDOW_SECONDS = 60  # Fast slope window
+LID_DROP_RATE = -4.0  # °C/min, a faster drop means the lid was opened
+LID_RECOVERY_MARGIN = 3  # °C below the pre-drop temperature counts as recovered
+LID_MAX_SECONDS = 900  # Give up on the lid after 15 minutes
+FIRE_OUT_WINDOW_SECONDS = 300  # Slow slope window
+FIRE_OUT_DEFICIT = 15  # °C below set temperature
+FIRE_OUT_CONFIRM_SECONDS = 600  # Deficit must persist this long
+PITMASTER_SATURATION = 95  # % output that counts as saturated
+
+# Pitmaster duty-cycle statistics
+DUTY_WINDOWS = [5, 15, 60]  # Minutes of the rolling output averages
+DUTY_MAX_GAP_SECONDS = 600  # Don't integrate across longer message gaps
+
+# PID auto-tuning
+AUTOTUNE_BASELINE_SECONDS = 120  # Steady output before the step
+AUTOTUNE_MAX_POINTS = 600  # Response samples used for the model fit
+AUTOTUNE_MAX_SAMPLES = 20000  # Upper bound of samples recorded by a step test
+AUTOTUNE_DEFAULT_STEP = 20  # % output
+AUTOTUNE_DEFAULT_DURATION = 30  # Minutes
+
+# Battery runtime prediction
+BATTERY_WINDOW_SECONDS = 3600  # Regression window of the state of charge
+BATTERY_SAMPLE_INTERVAL = 30  # Seconds between state of charge samples
+BATTERY_MIN_CONFIDENCE = 0.5  # Don't warn on a poorly fitting trend
+
+# Cook summary
+SUMMARY_QUANTILES = [0.1, 0.5, 0.9]  # Streaming percentiles per channel
+SUMMARY_MAX_GAP_SECONDS = 600  # Don't count durations across longer message gaps
+SUMMARY_UPDATE_INTERVAL = 60  # Seconds between summary sensor updates
+
+# Multi-session analytics
+ANALYTICS_RESAMPLE_SECONDS = 60  # Grid of the vectorized stall detection
+ANALYTICS_RAMP_MARGIN = 5  # °C below set temperature that ends the ramp-up
+
+# Adaptive publish interval (iot.PMQint)
+RATE_MIN_INTERVAL = 10  # s, used near a target or while the pit is ramping
+RATE_MAX_INTERVAL = 120  # s, used while nothing is changing
+RATE_NEAR_TARGET = 5  # °C below a target that needs fast updates
+RATE_FLAT_RATE = 0.1  # °C/min, flatter channels count as idle
+RATE_RAMP_MARGIN = 10  # °C between pit and set temperature that counts as ramping
+RATE_FASTER_HOLDOFF = 30  # s between two interval changes towards faster
+RATE_SLOWER_DELAY = 600  # s the activity must stay low before slowing down
+
+# Software pitmaster control loop
+SOFT_PID_DEFAULT_PERIOD = 10  # s between two control steps
+SOFT_PID_DEFAULT_KP = 4.0  # %/°C
+SOFT_PID_DEFAULT_KI = 0.02  # %/(°C·s)
+SOFT_PID_DEFAULT_KD = 60.0  # %·s/°C
+SOFT_PID_STALE_PERIODS = 3  # Input older than this many periods triggers the fallback
+
+# Device time sync
+TIME_SYNC_THRESHOLD = 10  # s of clock drift that trigger a resync
+TIME_SYNC_SAMPLES = 5  # The drift is the median of this many messages
+TIME_SYNC_VERIFY_SAMPLES = 3  # Messages after a sync before judging it
+TIME_SYNC_MIN_INTERVAL = 600  # s between two resyncs
+
+# Message gap and loss detection
+CADENCE_WINDOW = 64  # Inter-arrival times for the median interval
+CADENCE_WINDOW_SECONDS = 3600  # Rolling window of the delivery ratio
+
+# HTTP fallback transport
+HTTP_CHECK_INTERVAL = 5  # s between MQTT freshness checks
+HTTP_DEFAULT_INTERVAL = 30  # s between polls while the publish interval is unknown
+HTTP_STALE_FACTOR = 1.5  # Publish intervals without MQTT data before polling
+HTTP_MIN_STALE_SECONDS = 30  # Never switch to HTTP earlier than this
+HTTP_POLL_BUDGET = 10  # s for all requests of one poll
+HTTP_TIMEOUT = 5  # s for a single request
+HTTP_SETTINGS_INTERVAL = 300  # s between settings fetches while polling
+HTTP_HYDRATE_CONCURRENCY = 4  # Devices fetching their settings at once on startup
+HTTP_HYDRATE_TIMEOUT = 3  # s for the startup settings fetch
+
+# Separate MQTT brokers
+BROKER_DEFAULT_PORT = 1883
+BROKER_KEEPALIVE = 60  # s
+BROKER_RECONNECT_MIN = 1  # s, doubled per failed attempt
+BROKER_RECONNECT_MAX = 120  # s
+BROKER_MAX_INFLIGHT = 20  # Unacknowledged QoS 1/2 messages
+BROKER_MAX_QUEUED = 100  # Outgoing messages waiting for the network thread
+
+# Ingest latency
+LATENCY_WINDOW = 256  # Messages in the rolling percentile window
+LATENCY_UPDATE_INTERVAL = 60  # Seconds between latency sensor updates
+
+# Events
+EVENT_STALL = "wlanthermo_stall"
+EVENT_LID_OPEN = "wlanthermo_lid_open"
+EVENT_FIRE_OUT = "wlanthermo_fire_out"
+EVENT_AUTOTUNE = "wlanthermo_pid_autotune"
+EVENT_BATTERY_LOW = "wlanthermo_battery_low"
+EVENT_ALARM = "wlanthermo_alarm"
+EVENT_CONNECTION = "wlanthermo_connection"
+EVENT_PROBE = "wlanthermo_probe"
+EVENT_TARGET_REACHED = "wlanthermo_target_reached"
+EVENT_SOFTWARE_PID = "wlanthermo_software_pid"
+
+# Services
+SERVICE_EXPORT_SESSION = "export_session"
+SERVICE_PID_AUTOTUNE = "pid_autotune"
+SERVICE_ANALYZE_SESSIONS = "analyze_sessions"
+SERVICE_SOFTWARE_PID_START = "software_pid_start"
+SERVICE_SOFTWARE_PID_STOP = "software_pid_stop"
+SERVICE_SAVE_PRESET = "save_preset"
+SERVICE_DELETE_PRESET = "delete_preset"
+SERVICE_APPLY_PRESET = "apply_preset"
 
 # Attributes
 ATTR_CHANNEL = "channel"
@@ -29,6 +193,12 @@ ATTR_FIXED = "fixed"
 ATTR_PID = "pid"
 ATTR_SET_TEMP = "set_temp"
 ATTR_MODE = "mode"
+ATTR_TYP = "typ"
+
+# Attributes that rarely change and are not written to the recorder
+UNRECORDED_ATTRIBUTES = frozenset(
+    {ATTR_CHANNEL, ATTR_SENSOR_TYPE, ATTR_COLOR, ATTR_PID, ATTR_TYP}
+)
 
 # Pitmaster Modes
 PITMASTER_MODES = ["manual", "auto", "off"]  # Example, needs verification
@@ -36,3 +206,13 @@ PITMASTER_MODES = ["manual", "auto", "off"]  # Example, needs verification
 # Data keys
 DATA_COORDINATOR = "coordinator"
 DATA_MQTT_UNSUBSCRIBE = "mqtt_unsubscribe"
+DATA_FLEET = f"{DOMAIN}_fleet"  # hass.data key of the integration-wide index
+DATA_PRESETS = f"{DOMAIN}_presets"  # hass.data key of the cook preset store
+DATA_HTTP_SEMAPHORE = f"{DOMAIN}_http_semaphore"  # Bounds startup HTTP fetches
+DATA_BROKER_POOL = f"{DOMAIN}_broker_pool"  # Shared connections to separate brokers
+
+# Dispatcher signals
+SIGNAL_FLEET_UPDATE = f"{DOMAIN}_fleet_update"
+SIGNAL_FLEET_OWNER = f"{DOMAIN}_fleet_owner_{{}}"  # entry_id of the new owner
+SIGNAL_CHANNEL_ALARM = f"{DOMAIN}_channel_alarm_{{}}_{{}}"  # topic_prefix, channel index
+SIGNAL_SOFTWARE_PID = f"{DOMAIN}_software_pid_{{}}_{{}}"  # topic_prefix, pitmaster index
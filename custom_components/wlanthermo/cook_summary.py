@@ -0,0 +1,171 @@
+"""Running per-channel statistics of the current cook session."""
+from __future__ import annotations
+
+from bisect import bisect_right, insort
+import math
+
+from .const import SUMMARY_MAX_GAP_SECONDS, SUMMARY_QUANTILES
+
+
+class P2Quantile:
+    """Streaming quantile estimate with the P² algorithm (Jain & Chlamtac).
+
+    Five markers track the minimum, the target quantile, the quantiles
+    halfway to it and the maximum. Each sample moves the marker positions
+    and adjusts the heights with a piecewise-parabolic fit, so memory is
+    constant however long the cook runs.
+    """
+
+    def __init__(self, p: float) -> None:
+        """Initialize the estimator for quantile p (0..1)."""
+        self.p = p
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        p = self.p
+        self._heights: list[float] = []
+        self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self._desired = [1.0, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5.0]
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    @property
+    def value(self) -> float | None:
+        """Return the current estimate."""
+        heights = self._heights
+        if not heights:
+            return None
+        if len(heights) < 5:
+            # Exact quantile of the first few samples
+            return heights[min(len(heights) - 1, int(self.p * len(heights)))]
+        return heights[2]
+
+    def add(self, x: float) -> None:
+        """Add a sample."""
+        q = self._heights
+        if len(q) < 5:
+            insort(q, x)
+            return
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = bisect_right(q, x) - 1
+
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = math.copysign(1, d)
+                parabolic = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if q[i - 1] < parabolic < q[i + 1]:
+                    q[i] = parabolic
+                else:
+                    j = i + int(d)
+                    q[i] += d * (q[j] - q[i]) / (n[j] - n[i])
+                n[i] += d
+
+
+class ChannelSummary:
+    """Session statistics of one channel, updated once per message."""
+
+    def __init__(self) -> None:
+        """Initialize the summary."""
+        self.quantiles = {p: P2Quantile(p) for p in SUMMARY_QUANTILES}
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new session."""
+        for quantile in self.quantiles.values():
+            quantile.reset()
+        self.peak: float | None = None
+        self.low: float | None = None
+        self.samples = 0
+        self._sum = 0.0
+        self.tracked_time = 0.0
+        self.time_above_max = 0.0
+        self.time_below_min = 0.0
+        self.time_in_band = 0.0
+        self.band_time = 0.0  # Time with a set temperature to compare against
+        self._last: tuple[float, bool, bool, bool | None] | None = None
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean temperature of the session."""
+        return self._sum / self.samples if self.samples else None
+
+    def update(
+        self,
+        temp: float | None,
+        alarm_min: float | None,
+        alarm_max: float | None,
+        set_temp: float | None,
+        band: float,
+        now: float,
+    ) -> None:
+        """Add the current temperature (None while disconnected).
+
+        Each state is held until the next message, so the durations are
+        time-weighted; gaps longer than the limit aren't counted.
+        """
+        if self._last is not None:
+            last_ts, above, below, in_band = self._last
+            elapsed = now - last_ts
+            if elapsed <= SUMMARY_MAX_GAP_SECONDS:
+                self.tracked_time += elapsed
+                if above:
+                    self.time_above_max += elapsed
+                if below:
+                    self.time_below_min += elapsed
+                if in_band is not None:
+                    self.band_time += elapsed
+                    if in_band:
+                        self.time_in_band += elapsed
+
+        if temp is None:
+            self._last = None
+            return
+
+        self.samples += 1
+        self._sum += temp
+        self.peak = temp if self.peak is None else max(self.peak, temp)
+        self.low = temp if self.low is None else min(self.low, temp)
+        for quantile in self.quantiles.values():
+            quantile.add(temp)
+        self._last = (
+            now,
+            alarm_max is not None and temp > alarm_max,
+            alarm_min is not None and temp < alarm_min,
+            None if set_temp is None else abs(temp - set_temp) <= band,
+        )
+
+    def as_dict(self) -> dict[str, float | None]:
+        """Return the statistics for the summary sensor."""
+        mean = self.mean
+        summary: dict[str, float | None] = {
+            "peak": None if self.peak is None else round(self.peak, 1),
+            "min": None if self.low is None else round(self.low, 1),
+            "mean": None if mean is None else round(mean, 1),
+        }
+        for p, quantile in self.quantiles.items():
+            value = quantile.value
+            summary[f"p{round(p * 100)}"] = None if value is None else round(value, 1)
+        summary["minutes_tracked"] = round(self.tracked_time / 60)
+        summary["minutes_above_max"] = round(self.time_above_max / 60)
+        summary["minutes_below_min"] = round(self.time_below_min / 60)
+        summary["minutes_in_set_band"] = (
+            round(self.time_in_band / 60) if self.band_time else None
+        )
+        return summary
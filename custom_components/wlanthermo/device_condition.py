@@ -0,0 +1,133 @@
+"""Device conditions for WLANThermo devices.
+
+The conditions read the coordinator state directly instead of entity
+states, so they also work for channels without an entity in the condition.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import (
+    CONF_CONDITION,
+    CONF_DEVICE_ID,
+    CONF_DOMAIN,
+    CONF_TYPE,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.condition import ConditionCheckerType
+from homeassistant.helpers.typing import ConfigType, TemplateVarsType
+
+from .const import DOMAIN
+from .services import get_coordinator
+
+CONF_CHANNEL = "channel"
+CONF_PITMASTER = "pitmaster"
+
+CHANNEL_CONDITIONS = {"in_alarm", "probe_connected", "probe_disconnected", "target_reached", "stalled"}
+PITMASTER_CONDITIONS = {"lid_open", "fire_out"}
+DEVICE_CONDITIONS = {"is_online", "is_offline", "is_charging"}
+CONDITION_TYPES = CHANNEL_CONDITIONS | PITMASTER_CONDITIONS | DEVICE_CONDITIONS
+
+CONDITION_SCHEMA = cv.DEVICE_CONDITION_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_TYPE): vol.In(CONDITION_TYPES),
+        vol.Optional(CONF_CHANNEL): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_PITMASTER): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+
+async def async_get_conditions(hass: HomeAssistant, device_id: str) -> list[dict[str, Any]]:
+    """List the conditions of a WLANThermo main device."""
+    try:
+        get_coordinator(hass, device_id)
+    except HomeAssistantError:
+        return []
+    return [
+        {
+            CONF_CONDITION: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: condition_type,
+        }
+        for condition_type in sorted(CONDITION_TYPES)
+    ]
+
+
+async def async_get_condition_capabilities(
+    hass: HomeAssistant, config: ConfigType
+) -> dict[str, vol.Schema]:
+    """Offer the channel or pitmaster number as optional field (default any)."""
+    if config[CONF_TYPE] in CHANNEL_CONDITIONS:
+        field = CONF_CHANNEL
+    elif config[CONF_TYPE] in PITMASTER_CONDITIONS:
+        field = CONF_PITMASTER
+    else:
+        return {}
+    return {
+        "extra_fields": vol.Schema(
+            {vol.Optional(field): vol.All(vol.Coerce(int), vol.Range(min=1))}
+        )
+    }
+
+
+def _channel_state(coordinator, condition_type: str, idx: int) -> bool:
+    """Evaluate a channel condition."""
+    if condition_type == "in_alarm":
+        return idx < len(coordinator.alarms) and coordinator.alarms[idx].state is not None
+    if condition_type == "probe_connected":
+        return idx < len(coordinator.probe_connected) and bool(coordinator.probe_connected[idx])
+    if condition_type == "probe_disconnected":
+        return idx < len(coordinator.probe_connected) and coordinator.probe_connected[idx] is False
+    if condition_type == "target_reached":
+        return idx in coordinator.targets_reached
+    return idx < len(coordinator.stalls) and coordinator.stalls[idx].active
+
+
+def _pitmaster_state(coordinator, condition_type: str, idx: int) -> bool:
+    """Evaluate a pitmaster condition."""
+    if idx >= len(coordinator.pit_events):
+        return False
+    detector = coordinator.pit_events[idx]
+    return detector.lid_open if condition_type == "lid_open" else detector.fire_out
+
+
+@callback
+def async_condition_from_config(
+    hass: HomeAssistant, config: ConfigType
+) -> ConditionCheckerType:
+    """Create a condition checker."""
+    condition_type = config[CONF_TYPE]
+    device_id = config[CONF_DEVICE_ID]
+    channel = config.get(CONF_CHANNEL)
+    pitmaster = config.get(CONF_PITMASTER)
+
+    @callback
+    def test_condition(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Test the condition against the current coordinator state."""
+        try:
+            # Look up on every test, the coordinator is replaced on reload
+            coordinator = get_coordinator(hass, device_id)
+        except HomeAssistantError:
+            return False
+        system = coordinator.data.get("system", {})
+
+        if condition_type == "is_online":
+            return system.get("online") is True
+        if condition_type == "is_offline":
+            return system.get("online") is False
+        if condition_type == "is_charging":
+            return bool(system.get("charge"))
+        if condition_type in PITMASTER_CONDITIONS:
+            count = len(coordinator.pit_events)
+            indexes = [pitmaster - 1] if pitmaster else range(count)
+            return any(_pitmaster_state(coordinator, condition_type, idx) for idx in indexes)
+        count = len(coordinator.channel_history)
+        indexes = [channel - 1] if channel else range(count)
+        return any(_channel_state(coordinator, condition_type, idx) for idx in indexes)
+
+    return test_condition
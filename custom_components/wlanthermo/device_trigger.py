@@ -0,0 +1,133 @@
+"""Device triggers for WLANThermo devices.
+
+The triggers attach to the events the coordinator fires on transitions,
+so an automation only runs when its event happens instead of on every
+temperature update.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.components.homeassistant.triggers import event as event_trigger
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    DOMAIN,
+    EVENT_ALARM,
+    EVENT_BATTERY_LOW,
+    EVENT_CONNECTION,
+    EVENT_FIRE_OUT,
+    EVENT_LID_OPEN,
+    EVENT_PROBE,
+    EVENT_SOFTWARE_PID,
+    EVENT_STALL,
+    EVENT_TARGET_REACHED,
+)
+from .services import get_coordinator
+
+CONF_CHANNEL = "channel"
+CONF_PITMASTER = "pitmaster"
+
+# Trigger type: (event type, event data to match)
+TRIGGERS: dict[str, tuple[str, dict[str, Any]]] = {
+    "alarm_high": (EVENT_ALARM, {"type": "start", "alarm": "high"}),
+    "alarm_low": (EVENT_ALARM, {"type": "start", "alarm": "low"}),
+    "alarm_cleared": (EVENT_ALARM, {"type": "end"}),
+    "target_reached": (EVENT_TARGET_REACHED, {}),
+    "probe_connected": (EVENT_PROBE, {"type": "connected"}),
+    "probe_disconnected": (EVENT_PROBE, {"type": "disconnected"}),
+    "stall_started": (EVENT_STALL, {"type": "start"}),
+    "stall_ended": (EVENT_STALL, {"type": "end"}),
+    "lid_opened": (EVENT_LID_OPEN, {"type": "start"}),
+    "fire_out": (EVENT_FIRE_OUT, {"type": "start"}),
+    "online": (EVENT_CONNECTION, {"type": "online"}),
+    "offline": (EVENT_CONNECTION, {"type": "offline"}),
+    "battery_low": (EVENT_BATTERY_LOW, {}),
+    "software_pid_fallback": (EVENT_SOFTWARE_PID, {"type": "fallback"}),
+}
+
+CHANNEL_TRIGGERS = {
+    "alarm_high",
+    "alarm_low",
+    "alarm_cleared",
+    "target_reached",
+    "probe_connected",
+    "probe_disconnected",
+    "stall_started",
+    "stall_ended",
+}
+PITMASTER_TRIGGERS = {"lid_opened", "fire_out", "software_pid_fallback"}
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_TYPE): vol.In(TRIGGERS),
+        vol.Optional(CONF_CHANNEL): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_PITMASTER): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+
+async def async_get_triggers(hass: HomeAssistant, device_id: str) -> list[dict[str, Any]]:
+    """List the triggers of a WLANThermo main device."""
+    try:
+        get_coordinator(hass, device_id)
+    except HomeAssistantError:
+        return []
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: trigger_type,
+        }
+        for trigger_type in TRIGGERS
+    ]
+
+
+async def async_get_trigger_capabilities(
+    hass: HomeAssistant, config: ConfigType
+) -> dict[str, vol.Schema]:
+    """Offer the channel or pitmaster number as optional field."""
+    if config[CONF_TYPE] in CHANNEL_TRIGGERS:
+        field = CONF_CHANNEL
+    elif config[CONF_TYPE] in PITMASTER_TRIGGERS:
+        field = CONF_PITMASTER
+    else:
+        return {}
+    return {
+        "extra_fields": vol.Schema(
+            {vol.Optional(field): vol.All(vol.Coerce(int), vol.Range(min=1))}
+        )
+    }
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Attach an event trigger for the device."""
+    event_type, event_data = TRIGGERS[config[CONF_TYPE]]
+    event_data = {CONF_DEVICE_ID: config[CONF_DEVICE_ID], **event_data}
+    for field in (CONF_CHANNEL, CONF_PITMASTER):
+        if field in config:
+            event_data[field] = config[field]
+
+    event_config = event_trigger.TRIGGER_SCHEMA(
+        {
+            event_trigger.CONF_PLATFORM: "event",
+            event_trigger.CONF_EVENT_TYPE: event_type,
+            event_trigger.CONF_EVENT_DATA: event_data,
+        }
+    )
+    return await event_trigger.async_attach_trigger(
+        hass, event_config, action, trigger_info, platform_type="device"
+    )
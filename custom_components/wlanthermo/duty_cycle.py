@@ -0,0 +1,119 @@
+"""Pitmaster duty-cycle and actuator statistics."""
+from __future__ import annotations
+
+from collections import deque
+
+from .const import DUTY_MAX_GAP_SECONDS
+
+
+class TimeWeightedAverage:
+    """Rolling time-weighted average of a piecewise-constant signal.
+
+    Each value is held until the next sample. Closed segments are kept with
+    a running integral and covered duration, so gaps longer than
+    DUTY_MAX_GAP_SECONDS count neither way; consecutive samples with the same value extend the
+    last segment instead of adding one, which keeps the deque short for a
+    mostly steady fan.
+    """
+
+    def __init__(self, window: float) -> None:
+        """Initialize the average."""
+        self.window = window
+        self._segments: deque[list[float]] = deque()  # [start, end, value]
+        self._integral = 0.0
+        self._covered = 0.0
+        self._last: tuple[float, float] | None = None  # Open segment (start, value)
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self._segments.clear()
+        self._integral = 0.0
+        self._covered = 0.0
+        self._last = None
+
+    def add(self, ts: float, value: float) -> None:
+        """Add a sample."""
+        if self._last is not None:
+            start, last_value = self._last
+            if ts - start <= DUTY_MAX_GAP_SECONDS:
+                if self._segments and self._segments[-1][1] == start and self._segments[-1][2] == last_value:
+                    self._segments[-1][1] = ts
+                else:
+                    self._segments.append([start, ts, last_value])
+                self._integral += last_value * (ts - start)
+                self._covered += ts - start
+        self._last = (ts, value)
+
+        cutoff = ts - self.window
+        while self._segments and self._segments[0][1] <= cutoff:
+            start, end, seg_value = self._segments.popleft()
+            self._integral -= seg_value * (end - start)
+            self._covered -= end - start
+
+    def average(self, now: float) -> float | None:
+        """Return the average over the window ending now."""
+        cutoff = now - self.window
+        integral = self._integral
+        duration = self._covered
+        # Clip the parts of the oldest segments that left the window
+        for start, end, value in self._segments:
+            if start >= cutoff:
+                break
+            clipped = min(end, cutoff) - start
+            integral -= value * clipped
+            duration -= clipped
+        if self._last is not None:
+            start, value = self._last
+            open_start = max(start, cutoff)
+            if now - start <= DUTY_MAX_GAP_SECONDS and now > open_start:
+                integral += value * (now - open_start)
+                duration += now - open_start
+        if duration <= 0:
+            return None
+        return integral / duration
+
+
+class DutyCycleTracker:
+    """Actuator statistics of one pitmaster for the current session."""
+
+    def __init__(self, windows: list[int]) -> None:
+        """Initialize the tracker with rolling windows in minutes."""
+        self.averages = {minutes: TimeWeightedAverage(minutes * 60) for minutes in windows}
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new session."""
+        for average in self.averages.values():
+            average.reset()
+        self.time_at_min = 0.0
+        self.time_at_max = 0.0
+        self.fan_on_time = 0.0
+        self.transitions = 0
+        self._last: tuple[float, float] | None = None
+
+    def update(self, value: float | None, active: bool, now: float) -> None:
+        """Add the current output in % (active is False while the pitmaster is off)."""
+        if value is None or not active:
+            self._last = None
+            return
+        for average in self.averages.values():
+            average.add(now, value)
+
+        if self._last is not None:
+            last_ts, last_value = self._last
+            elapsed = now - last_ts
+            if elapsed <= DUTY_MAX_GAP_SECONDS:
+                if last_value <= 0:
+                    self.time_at_min += elapsed
+                elif last_value >= 100:
+                    self.time_at_max += elapsed
+                if last_value > 0:
+                    self.fan_on_time += elapsed
+            if (last_value > 0) != (value > 0):
+                self.transitions += 1
+        self._last = (now, value)
+
+    def average(self, minutes: int, now: float) -> float | None:
+        """Return the time-weighted average output over a window."""
+        average = self.averages.get(minutes)
+        return None if average is None else average.average(now)
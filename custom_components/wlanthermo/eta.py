@@ -0,0 +1,90 @@
+"""Time-to-target estimation for WLANThermo channels and pitmasters."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .streaming import WindowedRegression
+
+# Don't predict further ahead than this, the trend is meaningless there
+MAX_ETA_SECONDS = 24 * 3600
+
+
+@dataclass
+class Eta:
+    """Predicted arrival at a target temperature."""
+
+    target: float
+    remaining: float | None  # Seconds until the target is reached, None if not approaching
+    confidence: float  # 0..1
+    computed: float  # Timestamp of the prediction
+
+    @property
+    def arrival(self) -> float | None:
+        """Return the predicted arrival timestamp."""
+        if self.remaining is None:
+            return None
+        return self.computed + self.remaining
+
+
+def estimate(
+    regression: WindowedRegression, current: float, target: float, now: float
+) -> Eta:
+    """Extrapolate the windowed trend of a signal to a target value.
+
+    The confidence combines how well a line fits the window (R²) with how
+    much of the window is covered by samples yet.
+    """
+    slope = regression.slope
+    r_squared = regression.r_squared or 0.0
+    coverage = min(1.0, regression.span / regression.window)
+    confidence = round(r_squared * coverage, 2)
+
+    delta = target - current
+    if abs(delta) < 0.5:
+        return Eta(target, 0.0, confidence, now)
+    if not slope or (delta > 0) != (slope > 0):
+        return Eta(target, None, confidence, now)
+
+    remaining = delta / slope
+    if remaining > MAX_ETA_SECONDS:
+        return Eta(target, None, confidence, now)
+    return Eta(target, remaining, confidence, now)
+
+
+class EtaTracker:
+    """Throttled ETA predictions keyed by channel or pitmaster.
+
+    Each message only checks a timestamp; the prediction itself (O(1) on the
+    running regression sums) is refreshed at most once per interval, so the
+    ETA state doesn't change on every message.
+    """
+
+    def __init__(self, interval: float) -> None:
+        """Initialize the tracker."""
+        self.interval = interval
+        self._etas: dict[tuple[str, int], Eta] = {}
+
+    def get(self, key: tuple[str, int]) -> Eta | None:
+        """Return the last prediction."""
+        return self._etas.get(key)
+
+    def update(
+        self,
+        key: tuple[str, int],
+        regression: WindowedRegression,
+        current: float,
+        target: float | None,
+        now: float,
+    ) -> None:
+        """Refresh the prediction of a key if it is due or the target changed."""
+        if target is None:
+            self._etas.pop(key, None)
+            return
+        eta = self._etas.get(key)
+        if eta is not None and eta.target == target and now - eta.computed < self.interval:
+            return
+        self._etas[key] = estimate(regression, current, target, now)
+
+    def clear(self, key: tuple[str, int]) -> None:
+        """Forget the prediction of a key."""
+        self._etas.pop(key, None)
@@ -0,0 +1,187 @@
+"""Streaming export of WLANThermo cook data."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import csv
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import heapq
+import json
+import logging
+import os
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .archive import iter_archive_rows
+from .const import EXPORT_CHUNK_SECONDS
+
+_LOGGER = logging.getLogger(__name__)
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+
+
+@dataclass
+class ExportColumns:
+    """Columns selected for an export."""
+
+    channels: list[int] = field(default_factory=list)  # 0-based channel indexes
+    pitmasters: list[int] = field(default_factory=list)  # 0-based pitmaster indexes
+    pitmaster_value: bool = True
+    set_temp: bool = True
+
+    @property
+    def names(self) -> list[str]:
+        """Return the column names in output order."""
+        names = [f"channel_{idx + 1}" for idx in self.channels]
+        for idx in self.pitmasters:
+            if self.pitmaster_value:
+                names.append(f"pitmaster_{idx + 1}_value")
+            if self.set_temp:
+                names.append(f"pitmaster_{idx + 1}_set")
+        return names
+
+
+def archive_updates(
+    directory: str, columns: ExportColumns, start: float, end: float
+) -> Iterator[tuple[float, str, Any]]:
+    """Yield (timestamp, column, value) updates from the session archive."""
+    for row in iter_archive_rows(directory, start, end):
+        ts = row["t"]
+        temps = row.get("channel", [])
+        for idx in columns.channels:
+            yield ts, f"channel_{idx + 1}", temps[idx] if idx < len(temps) else None
+        pms = row.get("pm", [])
+        for idx in columns.pitmasters:
+            pm = pms[idx] if idx < len(pms) else {}
+            if columns.pitmaster_value:
+                yield ts, f"pitmaster_{idx + 1}_value", pm.get("value")
+            if columns.set_temp:
+                yield ts, f"pitmaster_{idx + 1}_set", pm.get("set")
+
+
+def recorder_updates(
+    hass: HomeAssistant, entity_columns: dict[str, str], start: float, end: float
+) -> Iterator[tuple[float, str, Any]]:
+    """Yield (timestamp, column, value) updates from the recorder.
+
+    Must run in the recorder's executor. History is queried one chunk at a
+    time, so only a single chunk of states is held in memory at once.
+    """
+    from homeassistant.components.recorder import history
+
+    if not entity_columns:
+        return
+
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + EXPORT_CHUNK_SECONDS, end)
+        states = history.get_significant_states(
+            hass,
+            datetime.fromtimestamp(chunk_start, tz=timezone.utc),
+            datetime.fromtimestamp(chunk_end, tz=timezone.utc),
+            list(entity_columns),
+            significant_changes_only=False,
+            minimal_response=True,
+            no_attributes=True,
+            include_start_time_state=chunk_start == start,
+        )
+        streams = [
+            _state_updates(entity_columns[entity_id], entity_states, chunk_start)
+            for entity_id, entity_states in states.items()
+        ]
+        yield from heapq.merge(*streams, key=lambda update: update[0])
+        chunk_start = chunk_end
+
+
+def _state_updates(
+    column: str, states: Iterable[Any], not_before: float
+) -> Iterator[tuple[float, str, Any]]:
+    """Convert recorder states (full or minimal) to column updates."""
+    for state in states:
+        if isinstance(state, dict):
+            value, changed = state["state"], state["last_changed"]
+            ts = changed.timestamp() if isinstance(changed, datetime) else _parse_ts(changed)
+        else:
+            value, ts = state.state, state.last_changed.timestamp()
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            value = None  # unavailable / unknown
+        yield max(ts, not_before), column, value
+
+
+def _parse_ts(value: Any) -> float:
+    """Parse a minimal-response timestamp."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return datetime.fromisoformat(value).timestamp()
+
+
+def build_rows(
+    updates: Iterator[tuple[float, str, Any]],
+    names: list[str],
+    resample: float | None = None,
+    start: float | None = None,
+) -> Iterator[tuple[float, list[Any]]]:
+    """Fold time-ordered column updates into output rows.
+
+    Values are held until the next update of the same column. Without
+    resampling one row is emitted per distinct timestamp; with resampling one
+    row is emitted per interval carrying the last known values.
+    """
+    positions = {name: pos for pos, name in enumerate(names)}
+    values: list[Any] = [None] * len(names)
+    current_ts: float | None = None
+    next_tick = start
+
+    for ts, column, value in updates:
+        if resample:
+            if next_tick is None:
+                next_tick = ts - ts % resample
+            while next_tick < ts:
+                if current_ts is not None:
+                    yield next_tick, list(values)
+                next_tick += resample
+        elif current_ts is not None and ts != current_ts:
+            yield current_ts, list(values)
+        current_ts = ts
+        values[positions[column]] = value
+
+    if current_ts is None:
+        return
+    if not resample:
+        yield current_ts, list(values)
+    elif next_tick <= current_ts:
+        yield next_tick, list(values)
+
+
+def write_export(
+    path: str,
+    rows: Iterator[tuple[float, list[Any]]],
+    names: list[str],
+    output_format: str,
+) -> int:
+    """Write rows to a file one at a time. Returns the number of rows."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        if output_format == FORMAT_CSV:
+            writer = csv.writer(file)
+            writer.writerow(["time", *names])
+            for ts, values in rows:
+                writer.writerow([_iso(ts), *("" if v is None else v for v in values)])
+                count += 1
+        else:
+            for ts, values in rows:
+                record = {"time": _iso(ts), **dict(zip(names, values))}
+                file.write(json.dumps(record) + "\n")
+                count += 1
+    _LOGGER.info("Exported %s rows to %s", count, path)
+    return count
+
+
+def _iso(ts: float) -> str:
+    """Format a timestamp as ISO 8601 in UTC."""
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat(timespec="seconds")
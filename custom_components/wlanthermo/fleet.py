@@ -0,0 +1,133 @@
+"""Integration-wide aggregates over all WLANThermo devices."""
+from __future__ import annotations
+
+import heapq
+from itertools import count
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import DATA_FLEET, SIGNAL_FLEET_OWNER, SIGNAL_FLEET_UPDATE
+
+# (topic_prefix, channel or pitmaster index)
+FleetKey = tuple[str, int]
+
+
+class FleetIndex:
+    """Incrementally maintained aggregates across all loaded devices.
+
+    Coordinators report changes of single pits, probes and devices. The
+    hottest pit comes from a max-heap with lazy deletion: an update pushes a
+    new entry with a fresh version and outdated entries are dropped once
+    they reach the top, so an update costs O(log n) and nothing iterates
+    all devices and channels. Alarm and offline counts are plain sets.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self.owner: str | None = None  # Config entry that provides the fleet sensors
+        self._entries: list[str] = []  # Loaded config entries, in load order
+        self.devices: dict[str, str] = {}  # topic_prefix -> device name
+        self._pit_heap: list[tuple[float, int, FleetKey]] = []
+        self._pits: dict[FleetKey, tuple[float, int]] = {}  # key -> (temp, version)
+        self._versions = count()
+        self.alarms: dict[FleetKey, str] = {}  # key -> probe name
+        self.offline: set[str] = set()
+        self._changed = False
+
+    @callback
+    def async_add_device(self, topic_prefix: str, device_name: str, entry_id: str) -> None:
+        """Register a device (the first entry provides the fleet sensors)."""
+        self.devices[topic_prefix] = device_name
+        self._entries.append(entry_id)
+        if self.owner is None:
+            self.owner = entry_id
+        self._changed = True
+
+    @callback
+    def async_remove_device(self, topic_prefix: str, entry_id: str) -> None:
+        """Drop everything a device reported.
+
+        If the device's entry provided the fleet sensors, the next loaded
+        entry is signalled to take them over.
+        """
+        self.devices.pop(topic_prefix, None)
+        if entry_id in self._entries:
+            self._entries.remove(entry_id)
+        for key in [key for key in self._pits if key[0] == topic_prefix]:
+            del self._pits[key]
+        for key in [key for key in self.alarms if key[0] == topic_prefix]:
+            del self.alarms[key]
+        self.offline.discard(topic_prefix)
+        self._changed = True
+        self.async_notify()
+        if self.owner == entry_id:
+            self.owner = self._entries[0] if self._entries else None
+            if self.owner is not None:
+                async_dispatcher_send(self.hass, SIGNAL_FLEET_OWNER.format(self.owner))
+
+    def set_pit(self, key: FleetKey, temp: float | None) -> None:
+        """Set the pit temperature of a pitmaster (None if unknown)."""
+        current = self._pits.get(key)
+        if temp is None:
+            if current is not None:
+                del self._pits[key]
+                self._changed = True
+            return
+        if current is not None and current[0] == temp:
+            return
+        version = next(self._versions)
+        self._pits[key] = (temp, version)
+        heapq.heappush(self._pit_heap, (-temp, version, key))
+        self._changed = True
+        # Bound the stale entries once they outnumber the live ones
+        if len(self._pit_heap) > 2 * len(self._pits) + 64:
+            self._pit_heap = [(-t, v, k) for k, (t, v) in self._pits.items()]
+            heapq.heapify(self._pit_heap)
+
+    def hottest_pit(self) -> tuple[float, FleetKey] | None:
+        """Return the hottest pit temperature and its pitmaster."""
+        heap = self._pit_heap
+        while heap:
+            neg_temp, version, key = heap[0]
+            current = self._pits.get(key)
+            if current is not None and current[1] == version:
+                return -neg_temp, key
+            heapq.heappop(heap)
+        return None
+
+    def set_alarm(self, key: FleetKey, name: str, active: bool) -> None:
+        """Set if a probe is in alarm."""
+        if active == (key in self.alarms):
+            return
+        if active:
+            self.alarms[key] = name
+        else:
+            del self.alarms[key]
+        self._changed = True
+
+    def set_offline(self, topic_prefix: str, offline: bool) -> None:
+        """Set if a device is offline."""
+        if offline == (topic_prefix in self.offline):
+            return
+        if offline:
+            self.offline.add(topic_prefix)
+        else:
+            self.offline.discard(topic_prefix)
+        self._changed = True
+
+    @callback
+    def async_notify(self) -> None:
+        """Tell the fleet sensors about changes since the last call."""
+        if self._changed:
+            self._changed = False
+            async_dispatcher_send(self.hass, SIGNAL_FLEET_UPDATE)
+
+
+@callback
+def async_get_fleet(hass: HomeAssistant) -> FleetIndex:
+    """Return the fleet index, creating it on first use."""
+    if (fleet := hass.data.get(DATA_FLEET)) is None:
+        fleet = hass.data[DATA_FLEET] = FleetIndex(hass)
+    return fleet
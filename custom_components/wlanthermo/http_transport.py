@@ -0,0 +1,181 @@
+"""Local HTTP API of the device as fallback transport for MQTT."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    DATA_HTTP_SEMAPHORE,
+    HTTP_DEFAULT_INTERVAL,
+    HTTP_HYDRATE_CONCURRENCY,
+    HTTP_HYDRATE_TIMEOUT,
+    HTTP_MIN_STALE_SECONDS,
+    HTTP_POLL_BUDGET,
+    HTTP_SETTINGS_INTERVAL,
+    HTTP_STALE_FACTOR,
+    HTTP_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+PATH_DATA = "/data"
+PATH_SETTINGS = "/settings"
+
+SOURCE_MQTT = "mqtt"
+SOURCE_HTTP = "http"
+
+
+class HttpTransport:
+    """Poll /data and /settings while MQTT is stale.
+
+    Requests go through HA's shared aiohttp session, so connections are
+    pooled with everything else. ETag/Last-Modified are sent back for
+    conditional requests, and an unchanged settings body isn't passed on,
+    which would otherwise rewrite the settings store. Both requests of a
+    poll share one time budget, and a new poll only starts once the last
+    one finished.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator, host: str) -> None:
+        """Initialize the transport."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.base_url = (host if "://" in host else f"http://{host}").rstrip("/")
+        self.active = False
+        self.polls = 0
+        self.errors = 0
+        self.not_modified = 0
+        self._session = async_get_clientsession(hass)
+        self._validators: dict[str, dict[str, str]] = {}
+        self._bodies: dict[str, bytes] = {}
+        self._last_poll = 0.0
+        self._last_settings = 0.0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def source(self) -> str:
+        """Return the transport currently feeding the coordinator."""
+        return SOURCE_HTTP if self.active else SOURCE_MQTT
+
+    def _interval(self) -> float:
+        """Return the expected interval between two messages."""
+        return self.coordinator.publish_interval or HTTP_DEFAULT_INTERVAL
+
+    @callback
+    def async_check(self, now: float) -> None:
+        """Switch transports by MQTT freshness and poll if HTTP is active."""
+        interval = self._interval()
+        mqtt_age = now - self.coordinator.last_mqtt_update
+        stale = mqtt_age > max(HTTP_MIN_STALE_SECONDS, HTTP_STALE_FACTOR * interval)
+        if stale and not self.active:
+            _LOGGER.warning(
+                f"WLANThermo {self.coordinator.device_name}: no MQTT data for "
+                f"{round(mqtt_age)}s, polling {self.base_url}"
+            )
+            self.active = True
+            self._last_settings = 0.0
+            self.coordinator.async_update_listeners()
+        elif not stale and self.active:
+            _LOGGER.info(f"WLANThermo {self.coordinator.device_name}: MQTT is back")
+            self.active = False
+            self.coordinator.async_update_listeners()
+
+        if (
+            self.active
+            and (self._task is None or self._task.done())
+            and now - self._last_poll >= interval
+        ):
+            self._last_poll = now
+            self._task = self.hass.async_create_task(self.async_poll(now))
+
+    async def async_poll(self, now: float) -> None:
+        """Fetch the data (and periodically the settings) once."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + HTTP_POLL_BUDGET
+        self.polls += 1
+        try:
+            if now - self._last_settings >= HTTP_SETTINGS_INTERVAL:
+                settings = await self._async_fetch(PATH_SETTINGS, deadline)
+                self._last_settings = now
+                if settings is not None:
+                    self.coordinator.async_set_settings(settings)
+            data = await self._async_fetch(PATH_DATA, deadline)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+            self.errors += 1
+            _LOGGER.debug(f"HTTP poll of {self.base_url} failed: {err!r}")
+            return
+        if not self.active:
+            # MQTT came back while the request was running
+            return
+        if data is None:
+            # Not modified, but the device answered
+            self.coordinator.last_update_time = time.time()
+            return
+        self.coordinator.async_set_data(data, source=SOURCE_HTTP)
+
+    async def async_hydrate(self) -> None:
+        """Fetch the settings once on startup.
+
+        Saves the wait for the "get" round trip over MQTT, so selects and
+        numbers get their option lists right away. All devices share one
+        semaphore, so a restart doesn't hit every device at once.
+        """
+        semaphore = self.hass.data.setdefault(
+            DATA_HTTP_SEMAPHORE, asyncio.Semaphore(HTTP_HYDRATE_CONCURRENCY)
+        )
+        async with semaphore:
+            deadline = asyncio.get_running_loop().time() + HTTP_HYDRATE_TIMEOUT
+            try:
+                settings = await self._async_fetch(PATH_SETTINGS, deadline)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+                _LOGGER.debug(f"Could not fetch settings from {self.base_url}: {err!r}")
+                return
+        if settings is not None:
+            self.coordinator.async_set_settings(settings)
+
+    async def _async_fetch(self, path: str, deadline: float) -> dict[str, Any] | None:
+        """GET a JSON document, None if it didn't change since the last fetch."""
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            raise asyncio.TimeoutError(f"No time left for {path}")
+        validators = self._validators.get(path, {})
+        headers = {}
+        if "ETag" in validators:
+            headers["If-None-Match"] = validators["ETag"]
+        if "Last-Modified" in validators:
+            headers["If-Modified-Since"] = validators["Last-Modified"]
+
+        async with self._session.get(
+            f"{self.base_url}{path}",
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=min(HTTP_TIMEOUT, remaining)),
+        ) as response:
+            if response.status == 304:
+                self.not_modified += 1
+                return None
+            response.raise_for_status()
+            body = await response.read()
+            self._validators[path] = {
+                key: response.headers[key]
+                for key in ("ETag", "Last-Modified")
+                if key in response.headers
+            }
+
+        if path == PATH_SETTINGS and body == self._bodies.get(path):
+            self.not_modified += 1
+            return None
+        self._bodies[path] = body
+        return json.loads(body)
+
+    async def async_stop(self) -> None:
+        """Cancel a running poll."""
+        if self._task is not None:
+            self._task.cancel()
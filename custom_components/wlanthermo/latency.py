@@ -0,0 +1,103 @@
+"""End-to-end ingest latency of WLANThermo messages."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+import time
+from typing import Any
+
+from .const import LATENCY_WINDOW
+
+STAGE_TRANSPORT = "transport"  # Device sample -> broker -> HA MQTT client
+STAGE_DISPATCH = "dispatch"  # HA MQTT client -> coordinator callback
+STAGE_PROCESSING = "processing"  # Coordinator callback -> states written
+STAGE_TOTAL = "total"
+STAGES = (STAGE_TRANSPORT, STAGE_DISPATCH, STAGE_PROCESSING, STAGE_TOTAL)
+
+
+class RollingPercentiles:
+    """Percentiles over the latest samples.
+
+    A sorted copy of the window is kept next to the arrival order, so
+    adding a sample is a bisect and reading a percentile is an index.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the window."""
+        self._window: deque[float] = deque(maxlen=size)
+        self._sorted: list[float] = []
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._window)
+
+    def add(self, value: float) -> None:
+        """Add a sample, dropping the oldest once the window is full."""
+        if len(self._window) == self._window.maxlen:
+            del self._sorted[bisect_left(self._sorted, self._window[0])]
+        self._window.append(value)
+        insort(self._sorted, value)
+
+    def percentile(self, p: float) -> float | None:
+        """Return the p-th percentile (0..100, nearest rank)."""
+        if not self._sorted:
+            return None
+        rank = min(len(self._sorted) - 1, max(0, math.ceil(p / 100 * len(self._sorted)) - 1))
+        return self._sorted[rank]
+
+
+def message_time(msg) -> float | None:
+    """Return when HA's MQTT client received a message (epoch seconds).
+
+    Depending on the HA version the timestamp is a datetime or a
+    time.monotonic() value.
+    """
+    timestamp = getattr(msg, "timestamp", None)
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    if isinstance(timestamp, (int, float)):
+        return time.time() - (time.monotonic() - timestamp)
+    return None
+
+
+class IngestLatency:
+    """Latency of each message split into the ingest stages.
+
+    The transport stage needs the device clock (system.time, whole
+    seconds) and can't tell network delay from clock offset, so it is only
+    meaningful for a device in sync (see the clock drift sensor).
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.stages = {stage: RollingPercentiles(LATENCY_WINDOW) for stage in STAGES}
+
+    def add(
+        self,
+        device_time: float | None,
+        received: float | None,
+        callback_time: float,
+        written: float,
+    ) -> None:
+        """Add the timestamps of one message (epoch seconds)."""
+        received = callback_time if received is None else min(received, callback_time)
+        if device_time is not None:
+            self.stages[STAGE_TRANSPORT].add(received - device_time)
+        self.stages[STAGE_DISPATCH].add(callback_time - received)
+        self.stages[STAGE_PROCESSING].add(written - callback_time)
+        self.stages[STAGE_TOTAL].add(written - (received if device_time is None else device_time))
+
+    def percentile(self, stage: str, p: float) -> float | None:
+        """Return a percentile of a stage in seconds."""
+        return self.stages[stage].percentile(p)
+
+    def as_dict(self, p: float) -> dict[str, Any]:
+        """Return a percentile of every stage in milliseconds."""
+        result: dict[str, Any] = {}
+        for stage, window in self.stages.items():
+            value = window.percentile(p)
+            result[f"{stage}_ms"] = None if value is None else round(value * 1000, 1)
+        result["samples"] = len(self.stages[STAGE_TOTAL])
+        return result
@@ -0,0 +1,173 @@
+"""Long-term statistics aggregation for WLANThermo channel temperatures."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import logging
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
+
+from .const import DOMAIN, STATISTICS_BUCKET_SECONDS, STATISTICS_STORAGE_KEY
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR_SECONDS = 3600
+
+
+class _Bucket:
+    """Running min/mean/max of one channel for one time bucket."""
+
+    __slots__ = ("start", "count", "total", "min", "max")
+
+    def __init__(self, start: int, value: float) -> None:
+        """Initialize the bucket with its first sample."""
+        self.start = start
+        self.count = 1
+        self.total = value
+        self.min = value
+        self.max = value
+
+    def add(self, value: float) -> None:
+        """Add a sample to the bucket."""
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def as_list(self) -> list[float]:
+        """Return the bucket for storage."""
+        return [self.start, self.count, self.total, self.min, self.max]
+
+    @classmethod
+    def from_list(cls, values: list[float]) -> _Bucket:
+        """Restore a stored bucket."""
+        bucket = cls(int(values[0]), values[3])
+        bucket.count, bucket.total, bucket.max = int(values[1]), values[2], values[4]
+        return bucket
+
+
+class LongTermStatisticsAggregator:
+    """Aggregate channel temperatures into buckets and push them as statistics.
+
+    Samples are folded into 5 minute buckets as they arrive, so memory per
+    channel is bounded by the buckets of the current hour. The recorder's
+    external statistics API only accepts rows starting at the top of the hour,
+    so completed hours are combined from their buckets and imported in one
+    batch per hour.
+
+    The recorder replaces a row with the same start, so the buckets of the
+    open hour are stored on unload and restored on setup; otherwise an
+    entry reload would re-import that hour from the later samples only.
+    """
+
+    def __init__(self, hass: HomeAssistant, device_name: str, topic_prefix: str) -> None:
+        """Initialize the aggregator."""
+        self.hass = hass
+        self.device_name = device_name
+        self._object_prefix = slugify(topic_prefix)
+        self._open: dict[int, _Bucket] = {}
+        self._closed: dict[int, list[_Bucket]] = {}
+        self._store = Store(hass, 1, f"{STATISTICS_STORAGE_KEY}.{self._object_prefix}")
+
+    def statistic_id(self, channel_idx: int) -> str:
+        """Return the external statistic id of a channel."""
+        return f"{DOMAIN}:{self._object_prefix}_channel_{channel_idx + 1}_temperature"
+
+    @callback
+    def async_add_sample(self, channel_idx: int, value: float, now: float) -> None:
+        """Add a temperature sample of a channel."""
+        start = int(now) - int(now) % STATISTICS_BUCKET_SECONDS
+        bucket = self._open.get(channel_idx)
+        if bucket is not None and bucket.start == start:
+            bucket.add(value)
+            return
+
+        if bucket is not None:
+            self._closed.setdefault(channel_idx, []).append(bucket)
+        self._open[channel_idx] = _Bucket(start, value)
+
+    async def async_load(self) -> None:
+        """Restore the buckets of the hour that was open on the last unload."""
+        if (stored := await self._store.async_load()) is None:
+            return
+        for channel_idx, buckets in stored.get("buckets", {}).items():
+            self._closed.setdefault(int(channel_idx), []).extend(
+                _Bucket.from_list(values) for values in buckets
+            )
+        # Restored once; a start without a clean unload mustn't merge them again
+        await self._store.async_remove()
+
+    async def async_close(self, now: float) -> None:
+        """Import everything and keep the open hour's buckets for a restart."""
+        current_hour = int(now) - int(now) % HOUR_SECONDS
+        buckets: dict[int, list[list[float]]] = {}
+        for channel_idx in self._open.keys() | self._closed.keys():
+            channel_buckets = list(self._closed.get(channel_idx, []))
+            if channel_idx in self._open:
+                channel_buckets.append(self._open[channel_idx])
+            buckets[channel_idx] = [
+                bucket.as_list() for bucket in channel_buckets if bucket.start >= current_hour
+            ]
+        self.async_flush(now, final=True)
+        await self._store.async_save({"buckets": buckets})
+
+    @callback
+    def async_flush(self, now: float, final: bool = False) -> None:
+        """Import all completed hours, or everything if this is the final flush."""
+        current_hour = int(now) - int(now) % HOUR_SECONDS
+
+        if final:
+            for channel_idx, bucket in self._open.items():
+                self._closed.setdefault(channel_idx, []).append(bucket)
+            self._open.clear()
+
+        for channel_idx, buckets in self._closed.items():
+            hours: dict[int, list[_Bucket]] = {}
+            remaining: list[_Bucket] = []
+            for bucket in buckets:
+                hour = bucket.start - bucket.start % HOUR_SECONDS
+                if final or hour < current_hour:
+                    hours.setdefault(hour, []).append(bucket)
+                else:
+                    remaining.append(bucket)
+            self._closed[channel_idx] = remaining
+
+            if hours:
+                self._async_import(channel_idx, hours)
+
+    @callback
+    def _async_import(self, channel_idx: int, hours: dict[int, list[_Bucket]]) -> None:
+        """Import one batch of hourly rows for a channel."""
+        statistics: list[StatisticData] = []
+        for hour, buckets in sorted(hours.items()):
+            count = sum(b.count for b in buckets)
+            statistics.append(
+                StatisticData(
+                    start=datetime.fromtimestamp(hour, tz=timezone.utc),
+                    mean=sum(b.total for b in buckets) / count,
+                    min=min(b.min for b in buckets),
+                    max=max(b.max for b in buckets),
+                )
+            )
+
+        metadata = StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=f"{self.device_name} Channel {channel_idx + 1}",
+            source=DOMAIN,
+            statistic_id=self.statistic_id(channel_idx),
+            unit_of_measurement=UnitOfTemperature.CELSIUS,
+        )
+        _LOGGER.debug(
+            "Importing %s hourly statistics for %s", len(statistics), metadata["statistic_id"]
+        )
+        try:
+            async_add_external_statistics(self.hass, metadata, statistics)
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.warning(f"Could not import statistics for {metadata['statistic_id']}: {e}")
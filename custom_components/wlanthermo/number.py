@@ -4,8 +4,7 @@ from __future__ import annotations
 import json
 import logging
 
-from homeassistant.components import mqtt
-from homeassistant.components.number import NumberEntity, NumberMode
+from homeassistant.components.number import NumberEntity, NumberMode, RestoreNumber
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, PERCENTAGE
 from homeassistant.core import HomeAssistant, callback
@@ -42,6 +41,7 @@ async def async_setup_entry(
             for idx, channel in enumerate(coordinator.data["channel"]):
                 entities.append(WLANThermoAlarmMinNumber(coordinator, idx))
                 entities.append(WLANThermoAlarmMaxNumber(coordinator, idx))
+                entities.append(WLANThermoChannelTargetNumber(coordinator, idx))
 
         # Add pitmaster set temperature and manual value
         if "pitmaster" in coordinator.data and "pm" in coordinator.data["pitmaster"]:
@@ -119,7 +119,7 @@ class WLANThermoAlarmMinNumber(CoordinatorEntity, NumberEntity):
         topic = f"{self.coordinator.topic_prefix}/{TOPIC_SET_CHANNELS}"
         
         _LOGGER.debug(f"Setting Alarm Min for channel {self._channel_idx + 1} to {value} on topic {topic} with payload {payload}")
-        await mqtt.async_publish(self.hass, topic, json.dumps(payload))
+        await self.coordinator.async_mqtt_publish(topic, json.dumps(payload))
 
         # Update coordinator data optimistically
         self.coordinator.data["channel"][self._channel_idx]["min"] = int(value)
@@ -184,7 +184,7 @@ class WLANThermoAlarmMaxNumber(CoordinatorEntity, NumberEntity):
         topic = f"{self.coordinator.topic_prefix}/{TOPIC_SET_CHANNELS}"
         
         _LOGGER.debug(f"Setting Alarm Max for channel {self._channel_idx + 1} to {value} on topic {topic} with payload {payload}")
-        await mqtt.async_publish(self.hass, topic, json.dumps(payload))
+        await self.coordinator.async_mqtt_publish(topic, json.dumps(payload))
 
         # Update coordinator data optimistically
         self.coordinator.data["channel"][self._channel_idx]["max"] = int(value)
@@ -200,6 +200,55 @@ class WLANThermoAlarmMaxNumber(CoordinatorEntity, NumberEntity):
         return {}
 
 
+class WLANThermoChannelTargetNumber(CoordinatorEntity, RestoreNumber):
+    """User target temperature for the ETA prediction of a channel (HA-side only).
+
+    0 means "no target", the ETA then predicts the alarm max.
+    """
+
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_mode = NumberMode.BOX
+    _attr_native_min_value = 0
+    _attr_native_max_value = 300
+    _attr_native_step = 1
+    _attr_icon = "mdi:target"
+
+    def __init__(self, coordinator, channel_idx: int) -> None:
+        """Initialize the number entity."""
+        super().__init__(coordinator)
+        self._channel_idx = channel_idx
+        self._attr_unique_id = (
+            f"{coordinator.topic_prefix}_channel_{channel_idx}_target"
+        )
+        self._attr_name = f"{coordinator.device_name} Channel {channel_idx + 1} Target"
+        self._attr_native_value = 0
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last target."""
+        await super().async_added_to_hass()
+        if (last := await self.async_get_last_number_data()) is not None:
+            if last.native_value is not None:
+                self._attr_native_value = last.native_value
+        self.coordinator.async_set_eta_target(self._channel_idx, self._attr_native_value)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, f"{self.coordinator.topic_prefix}_channel_{self._channel_idx}")},
+            name=f"{self.coordinator.device_name} Channel {self._channel_idx + 1}",
+            via_device=(DOMAIN, self.coordinator.topic_prefix),
+            manufacturer="WLANThermo",
+            model="Channel Sensor",
+        )
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Update the target."""
+        self._attr_native_value = value
+        self.coordinator.async_set_eta_target(self._channel_idx, value)
+        self.async_write_ha_state()
+
+
 class WLANThermoPitmasterSetTempNumber(CoordinatorEntity, NumberEntity):
     """Representation of a WLANThermo Pitmaster Set Temperature."""
 
@@ -261,7 +310,7 @@ class WLANThermoPitmasterSetTempNumber(CoordinatorEntity, NumberEntity):
         payload = [payload_obj]
         topic = f"{self.coordinator.topic_prefix}/{TOPIC_SET_PITMASTER}"
         _LOGGER.debug(f"Setting Pitmaster {self._pm_idx} Set Temp to {value}. Payload: {payload}")
-        await mqtt.async_publish(self.hass, topic, json.dumps(payload))
+        await self.coordinator.async_mqtt_publish(topic, json.dumps(payload))
         
         # Optimistic update
         self.coordinator.data["pitmaster"]["pm"][self._pm_idx]["set"] = int(value)
@@ -343,7 +392,7 @@ class WLANThermoPitmasterManualValueNumber(CoordinatorEntity, NumberEntity):
         payload = [payload_obj]
         topic = f"{self.coordinator.topic_prefix}/{TOPIC_SET_PITMASTER}"
         _LOGGER.debug(f"Writing Pitmaster {self._pm_idx} Manual Value to {value}. Payload: {payload}")
-        await mqtt.async_publish(self.hass, topic, json.dumps(payload))
+        await self.coordinator.async_mqtt_publish(topic, json.dumps(payload))
         
         # Optimistic update (might be overwritten by next status update)
         self.coordinator.data["pitmaster"]["pm"][self._pm_idx]["value"] = int(value)
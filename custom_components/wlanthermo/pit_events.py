@@ -0,0 +1,119 @@
+"""Lid-open and fire-out detection on the pitmaster's controlled channel."""
+from __future__ import annotations
+
+from .const import (
+    FIRE_OUT_CONFIRM_SECONDS,
+    FIRE_OUT_DEFICIT,
+    LID_DROP_RATE,
+    LID_MAX_SECONDS,
+    LID_RECOVERY_MARGIN,
+    PITMASTER_SATURATION,
+)
+from .streaming import WindowedRegression
+
+EVENT_START = "start"
+EVENT_END = "end"
+
+# Weight of a new sample in the slow pit temperature baseline
+BASELINE_ALPHA = 0.05
+
+
+class PitEventDetector:
+    """Tell a lid opening apart from the fire going out.
+
+    A lid opening is a fast drop of the pit temperature that recovers to the
+    temperature before the drop within a few minutes. A fire out (or fuel
+    exhaustion) is a sustained deficit below the set temperature while the
+    pitmaster output is saturated and the pit is not recovering. Only a
+    handful of scalars are kept, so memory is constant.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the detector."""
+        self._clear()
+
+    def _clear(self) -> None:
+        """Forget all state."""
+        self.lid_open = False
+        self.lid_open_since: float | None = None
+        self.fire_out = False
+        self.fire_out_since: float | None = None
+        self.baseline: float | None = None
+        self._pre_drop_temp: float | None = None
+        self._fire_candidate_since: float | None = None
+
+    def reset(self) -> list[tuple[str, str]]:
+        """Reset when the pit channel is lost. Returns the ended events."""
+        ended = []
+        if self.lid_open:
+            ended.append(("lid_open", EVENT_END))
+        if self.fire_out:
+            ended.append(("fire_out", EVENT_END))
+        self._clear()
+        return ended
+
+    def update(
+        self,
+        fast: WindowedRegression,
+        slow: WindowedRegression,
+        temp: float,
+        pm: dict,
+        now: float,
+    ) -> list[tuple[str, str]]:
+        """Feed one message. Returns (detector, start/end) transitions."""
+        transitions: list[tuple[str, str]] = []
+        fast_slope = fast.slope
+        slow_slope = slow.slope
+        fast_rate = None if fast_slope is None else fast_slope * 60
+        slow_rate = None if slow_slope is None else slow_slope * 60
+
+        # Lid open: fast drop, ends when the temperature recovers
+        if self.lid_open:
+            recovered = temp >= (self._pre_drop_temp or temp) - LID_RECOVERY_MARGIN
+            if recovered or now - self.lid_open_since > LID_MAX_SECONDS:
+                self.lid_open = False
+                transitions.append(("lid_open", EVENT_END))
+        elif (
+            fast_rate is not None
+            and fast_rate < LID_DROP_RATE
+            and self.baseline is not None
+        ):
+            self.lid_open = True
+            self.lid_open_since = now
+            self._pre_drop_temp = self.baseline
+            transitions.append(("lid_open", EVENT_START))
+
+        if not self.lid_open:
+            self.baseline = (
+                temp
+                if self.baseline is None
+                else self.baseline + BASELINE_ALPHA * (temp - self.baseline)
+            )
+
+        # Fire out: sustained deficit while the output is saturated
+        set_temp = pm.get("set")
+        value = pm.get("value")
+        saturated = isinstance(value, (int, float)) and value >= PITMASTER_SATURATION
+        deficit = (
+            isinstance(set_temp, (int, float))
+            and pm.get("typ") == "auto"
+            and temp < set_temp - FIRE_OUT_DEFICIT
+        )
+        not_recovering = slow_rate is not None and slow_rate <= 0.1
+
+        if self.fire_out:
+            if not (deficit and saturated) or (slow_rate is not None and slow_rate > 0.5):
+                self.fire_out = False
+                self._fire_candidate_since = None
+                transitions.append(("fire_out", EVENT_END))
+        elif deficit and saturated and not_recovering and not self.lid_open:
+            if self._fire_candidate_since is None:
+                self._fire_candidate_since = now
+            elif now - self._fire_candidate_since >= FIRE_OUT_CONFIRM_SECONDS:
+                self.fire_out = True
+                self.fire_out_since = self._fire_candidate_since
+                transitions.append(("fire_out", EVENT_START))
+        else:
+            self._fire_candidate_since = None
+
+        return transitions
@@ -0,0 +1,122 @@
+"""Stored cook presets and their minimal diff against a device."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DATA_PRESETS, PRESETS_STORAGE_KEY
+
+# Alarm modes as offered by the channel alarm select
+ALARM_MODES = {"off": 0, "push": 1, "beeper": 2, "both": 3}
+
+CHANNEL_KEYS = ("name", "typ", "min", "max", "alarm", "color")
+PITMASTER_KEYS = ("channel", "pid", "set", "typ", "value")
+
+
+class PresetStore:
+    """Cook presets shared by all devices, persisted in .storage."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store = Store(hass, 1, PRESETS_STORAGE_KEY)
+        self.presets: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored presets."""
+        self.presets = await self._store.async_load() or {}
+
+    async def async_set(self, name: str, preset: dict[str, Any]) -> None:
+        """Add or replace a preset."""
+        self.presets[name] = preset
+        await self._store.async_save(self.presets)
+
+    async def async_remove(self, name: str) -> bool:
+        """Remove a preset, return if it existed."""
+        if self.presets.pop(name, None) is None:
+            return False
+        await self._store.async_save(self.presets)
+        return True
+
+
+async def async_get_presets(hass: HomeAssistant) -> PresetStore:
+    """Return the preset store, loading it on first use."""
+    if (presets := hass.data.get(DATA_PRESETS)) is None:
+        presets = PresetStore(hass)
+        await presets.async_load()
+        hass.data[DATA_PRESETS] = presets
+    return presets
+
+
+def snapshot(data: dict[str, Any]) -> dict[str, Any]:
+    """Return a preset with the current settings of a device."""
+    channels = [
+        {"number": idx + 1, **{key: channel[key] for key in CHANNEL_KEYS if key in channel}}
+        for idx, channel in enumerate(data.get("channel", []))
+    ]
+    pitmasters = []
+    for idx, pm in enumerate(data.get("pitmaster", {}).get("pm", [])):
+        keys = PITMASTER_KEYS if pm.get("typ") == "manual" else PITMASTER_KEYS[:-1]
+        pitmasters.append({"number": idx + 1, **{key: pm[key] for key in keys if key in pm}})
+    return {"channels": channels, "pitmasters": pitmasters}
+
+
+def _lookup(value: Any, entries: list[dict[str, Any]], id_key: str, what: str) -> int:
+    """Resolve a sensor type or PID profile given by name to its id."""
+    if isinstance(value, int):
+        return value
+    for entry in entries:
+        if entry.get("name") == value:
+            return entry.get(id_key)
+    raise ValueError(f"Unknown {what}: {value}")
+
+
+def resolve(
+    preset: dict[str, Any], data: dict[str, Any]
+) -> tuple[dict[int, dict[str, Any]], dict[int, dict[str, Any]]]:
+    """Translate a preset to device values per channel and pitmaster index.
+
+    Sensor types, alarm modes and PID profiles may be given by name.
+    """
+    channel_count = len(data.get("channel", []))
+    pm_count = len(data.get("pitmaster", {}).get("pm", []))
+
+    channels: dict[int, dict[str, Any]] = {}
+    for entry in preset.get("channels", []):
+        idx = entry["number"] - 1
+        if idx >= channel_count:
+            raise ValueError(f"Unknown channel: {idx + 1}")
+        values = {key: entry[key] for key in CHANNEL_KEYS if key in entry}
+        if "typ" in values:
+            values["typ"] = _lookup(values["typ"], data.get("sensors", []), "type", "sensor type")
+        if isinstance(values.get("alarm"), str):
+            if values["alarm"] not in ALARM_MODES:
+                raise ValueError(f"Unknown alarm mode: {values['alarm']}")
+            values["alarm"] = ALARM_MODES[values["alarm"]]
+        channels[idx] = values
+
+    pitmasters: dict[int, dict[str, Any]] = {}
+    for entry in preset.get("pitmasters", []):
+        idx = entry["number"] - 1
+        if idx >= pm_count:
+            raise ValueError(f"Unknown pitmaster: {idx + 1}")
+        values = {key: entry[key] for key in PITMASTER_KEYS if key in entry}
+        if "pid" in values:
+            values["pid"] = _lookup(values["pid"], data.get("pid", []), "id", "PID profile")
+        if not 0 < values.get("channel", 1) <= channel_count:
+            raise ValueError(f"Unknown pitmaster channel: {values['channel']}")
+        pitmasters[idx] = values
+    return channels, pitmasters
+
+
+def diff(
+    current: list[dict[str, Any]], wanted: dict[int, dict[str, Any]]
+) -> dict[int, dict[str, Any]]:
+    """Return only the values that differ from the current ones."""
+    changes = {}
+    for idx, values in wanted.items():
+        changed = {key: value for key, value in values.items() if current[idx].get(key) != value}
+        if changed:
+            changes[idx] = changed
+    return changes
@@ -0,0 +1,87 @@
+"""Glitch filtering and availability hysteresis for WLANThermo probes."""
+from __future__ import annotations
+
+from collections import deque
+
+from .const import PROBE_FILTER_MIN_DEVIATION, PROBE_FILTER_THRESHOLD, PROBE_FILTER_WINDOW
+
+NOT_CONNECTED = 999  # Sentinel the device reports for an unplugged probe
+
+
+def _median(values: list[float]) -> float:
+    """Return the median of a short list."""
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) / 2
+
+
+class ProbeFilter:
+    """Filter stage for the raw temperatures of one channel.
+
+    Spikes are caught with a causal Hampel filter: a sample further from the
+    median of the last few samples than a multiple of their median absolute
+    deviation is replaced by that median. Flips to the 999 "not connected"
+    sentinel are only passed on after N consecutive samples, and so is a
+    reconnect, so a bad connector doesn't make the entity flap.
+    """
+
+    def __init__(self, hysteresis: int) -> None:
+        """Initialize the filter."""
+        self.hysteresis = max(1, hysteresis)
+        self._window: deque[float] = deque(maxlen=PROBE_FILTER_WINDOW)
+        self._connected: bool | None = None  # None until the first sample
+        self._last_good: float | None = None
+        self._invalid_run = 0
+        self._valid_run = 0
+        self.spikes = 0
+        self.dropouts_suppressed = 0
+        self.reconnects_delayed = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return the filter statistics."""
+        return {
+            "spikes": self.spikes,
+            "dropouts_suppressed": self.dropouts_suppressed,
+            "reconnects_delayed": self.reconnects_delayed,
+        }
+
+    def filter(self, raw):
+        """Return the filtered temperature for a raw sample."""
+        if raw is None or raw == NOT_CONNECTED:
+            self._valid_run = 0
+            if not self._connected:
+                self._connected = False
+                return raw
+            self._invalid_run += 1
+            if self._invalid_run < self.hysteresis:
+                self.dropouts_suppressed += 1
+                return self._last_good
+            self._connected = False
+            self._window.clear()
+            return raw
+
+        self._invalid_run = 0
+        if self._connected is False:
+            self._valid_run += 1
+            if self._valid_run < self.hysteresis:
+                self.reconnects_delayed += 1
+                return NOT_CONNECTED
+        self._connected = True
+
+        value = raw
+        if len(self._window) >= 3:
+            window = list(self._window)
+            median = _median(window)
+            mad = _median([abs(x - median) for x in window])
+            limit = max(PROBE_FILTER_THRESHOLD * 1.4826 * mad, PROBE_FILTER_MIN_DEVIATION)
+            if abs(raw - median) > limit:
+                self.spikes += 1
+                value = median
+        # Keep the raw sample in the window, so a genuine step is accepted
+        # once it makes up the majority of the window
+        self._window.append(raw)
+        self._last_good = value
+        return value
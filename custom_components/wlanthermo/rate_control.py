@@ -0,0 +1,87 @@
+"""Adaptive MQTT publish interval (iot.PMQint) of a WLANThermo."""
+from __future__ import annotations
+
+from typing import Any
+
+from .const import (
+    RATE_FASTER_HOLDOFF,
+    RATE_MAX_INTERVAL,
+    RATE_MIN_INTERVAL,
+    RATE_SLOWER_DELAY,
+)
+
+ACTIVITY_FAST = "fast"  # A probe nears its target or the pit is ramping
+ACTIVITY_NORMAL = "normal"
+ACTIVITY_IDLE = "idle"  # Nothing is changing
+
+
+class TelemetryRateController:
+    """Choose the publish interval from the current activity.
+
+    The interval the device reported first is the normal one; fast and idle
+    phases use the bounds. A faster interval is applied right away (at most
+    once per holdoff), a slower one only after the activity stayed low for
+    a while, so a short plateau doesn't make the device toggle.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the controller."""
+        self.base: int | None = None  # Interval configured on the device
+        self.interval: int | None = None  # Interval currently set
+        self._last_change: float | None = None
+        self._slower_since: float | None = None
+
+    def as_dict(self) -> dict[str, int | None]:
+        """Return the intervals to keep across restarts."""
+        return {"base": self.base, "interval": self.interval}
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Restore the intervals of a previous run.
+
+        After a restart the device may still run at an interval set here;
+        reported again, it is recognized as such and not taken as the new
+        normal interval.
+        """
+        self.base = stored.get("base")
+        self.interval = stored.get("interval")
+
+    def set_reported(self, interval: int) -> bool:
+        """Take over an interval reported by the device settings.
+
+        A value that differs from the one set here was changed on the device
+        and becomes the new normal interval. Returns if it did.
+        """
+        if interval == self.interval:
+            return False
+        self.base = interval
+        self.interval = interval
+        return True
+
+    def update(self, activity: str, now: float) -> int | None:
+        """Return a new interval to set, None to keep the current one."""
+        if self.base is None:
+            return None
+        if activity == ACTIVITY_FAST:
+            target = min(self.base, RATE_MIN_INTERVAL)
+        elif activity == ACTIVITY_IDLE:
+            target = max(self.base, RATE_MAX_INTERVAL)
+        else:
+            target = self.base
+
+        if target == self.interval:
+            self._slower_since = None
+            return None
+        if target < self.interval:
+            self._slower_since = None
+            if self._last_change is not None and now - self._last_change < RATE_FASTER_HOLDOFF:
+                return None
+        else:
+            if self._slower_since is None:
+                self._slower_since = now
+            if now - self._slower_since < RATE_SLOWER_DELAY:
+                return None
+
+        self.interval = target
+        self._last_change = now
+        self._slower_since = None
+        return target
@@ -0,0 +1,12 @@
+"""Recorder platform for WLANThermo integration."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import UNRECORDED_ATTRIBUTES
+
+
+@callback
+def exclude_attributes(hass: HomeAssistant) -> set[str]:
+    """Exclude static attributes from being recorded in the database."""
+    return set(UNRECORDED_ATTRIBUTES)
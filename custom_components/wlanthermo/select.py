@@ -4,7 +4,6 @@ from __future__ import annotations
 import json
 import logging
 
-from homeassistant.components import mqtt
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
@@ -129,7 +128,7 @@ class WLANThermoPitmasterModeSelect(CoordinatorEntity, SelectEntity):
         
         topic = f"{self.coordinator.topic_prefix}/{TOPIC_SET_PITMASTER}"
         _LOGGER.debug(f"Writing Pitmaster {self._pm_idx} Mode to {option}. Topic: {topic}, Payload: {payload}")
-        await mqtt.async_publish(self.hass, topic, json.dumps(payload))
+        await self.coordinator.async_mqtt_publish(topic, json.dumps(payload))
         
         # Optimistic update
         self.coordinator.data["pitmaster"]["pm"][self._pm_idx]["typ"] = option
@@ -221,7 +220,7 @@ class WLANThermoPitmasterChannelSelect(CoordinatorEntity, SelectEntity):
         topic = f"{self.coordinator.topic_prefix}/{TOPIC_SET_PITMASTER}"
         
         _LOGGER.debug(f"Setting Pitmaster {self._pm_idx} Channel to {channel_num} ({option}) on topic {topic}. Payload: {payload}")
-        await mqtt.async_publish(self.hass, topic, json.dumps(payload))
+        await self.coordinator.async_mqtt_publish(topic, json.dumps(payload))
         
         # Optimistic update
         self.coordinator.data["pitmaster"]["pm"][self._pm_idx]["channel"] = channel_num
@@ -339,7 +338,7 @@ class WLANThermoPitmasterProfileSelect(CoordinatorEntity, SelectEntity):
         topic = f"{self.coordinator.topic_prefix}/{TOPIC_SET_PITMASTER}"
         
         _LOGGER.debug(f"Setting Pitmaster {self._pm_idx} Profile to {pid_num} ({option}) on topic {topic}. Payload: {payload}")
-        await mqtt.async_publish(self.hass, topic, json.dumps(payload))
+        await self.coordinator.async_mqtt_publish(topic, json.dumps(payload))
         
         # Optimistic update
         self.coordinator.data["pitmaster"]["pm"][self._pm_idx]["pid"] = pid_num
@@ -421,7 +420,7 @@ class WLANThermoChannelAlarmSelect(CoordinatorEntity, SelectEntity):
         topic = f"{self.coordinator.topic_prefix}/set/channels"
         
         _LOGGER.debug(f"Setting Channel {self._channel_idx + 1} Alarm to {alarm_val} ({option}). Payload: {payload}")
-        await mqtt.async_publish(self.hass, topic, json.dumps(payload))
+        await self.coordinator.async_mqtt_publish(topic, json.dumps(payload))
         
         # Optimistic update
         self.coordinator.data["channel"][self._channel_idx]["alarm"] = alarm_val
@@ -522,7 +521,7 @@ class WLANThermoChannelSensorTypeSelect(CoordinatorEntity, SelectEntity):
         topic = f"{self.coordinator.topic_prefix}/set/channels"
         
         _LOGGER.debug(f"Setting Channel {self._channel_idx + 1} Sensor Type to {typ_val} ({option}). Payload: {payload}")
-        await mqtt.async_publish(self.hass, topic, json.dumps(payload))
+        await self.coordinator.async_mqtt_publish(topic, json.dumps(payload))
         
         # Optimistic update
         self.coordinator.data["channel"][self._channel_idx]["typ"] = typ_val
@@ -1,6 +1,8 @@
 """Sensor platform for WLANThermo integration."""
 from __future__ import annotations
 
+import time
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -8,14 +10,19 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    MATCH_ALL,
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    EntityCategory,
     UnitOfTemperature,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ATTR_ALARM_MAX,
@@ -24,10 +31,23 @@ from .const import (
     ATTR_COLOR,
     ATTR_MAX_TEMP,
     ATTR_MIN_TEMP,
+    ATTR_PID,
     ATTR_SENSOR_TYPE,
+    ATTR_TYP,
+    CONF_LEAN_ATTRIBUTES,
     DATA_COORDINATOR,
+    DEFAULT_LEAN_ATTRIBUTES,
     DOMAIN,
+    DUTY_WINDOWS,
+    LATENCY_UPDATE_INTERVAL,
+    SIGNAL_FLEET_OWNER,
+    SIGNAL_FLEET_UPDATE,
+    SIGNAL_SOFTWARE_PID,
+    SUMMARY_UPDATE_INTERVAL,
+    UNRECORDED_ATTRIBUTES,
 )
+from .http_transport import SOURCE_HTTP, SOURCE_MQTT
+from .latency import STAGE_TOTAL
 
 
 async def async_setup_entry(
@@ -40,6 +60,27 @@ async def async_setup_entry(
 
     entities: list[SensorEntity] = []
 
+    # The first loaded device provides the integration-wide sensors
+    @callback
+    def _add_fleet_entities() -> None:
+        """Add the integration-wide sensors."""
+        async_add_entities(
+            [
+                WLANThermoFleetHottestPitSensor(coordinator.fleet),
+                WLANThermoFleetAlarmSensor(coordinator.fleet),
+                WLANThermoFleetOfflineSensor(coordinator.fleet),
+            ]
+        )
+
+    if coordinator.fleet.owner == entry.entry_id:
+        _add_fleet_entities()
+    # Take them over when the owning entry is unloaded
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_FLEET_OWNER.format(entry.entry_id), _add_fleet_entities
+        )
+    )
+
     @callback
     def _create_entities():
         """Create entities when data is available."""
@@ -54,18 +95,40 @@ async def async_setup_entry(
                 entities.append(WLANThermoSystemSensor(coordinator, "cpu", "CPU Temperature"))
             if "soc" in sys_data:
                  entities.append(WLANThermoSystemSensor(coordinator, "soc", "Battery"))
+                 entities.append(WLANThermoBatteryRuntimeSensor(coordinator))
             if "rssi" in sys_data:
                  entities.append(WLANThermoSystemSensor(coordinator, "rssi", "WiFi Signal"))
+            if "time" in sys_data:
+                entities.append(WLANThermoClockDriftSensor(coordinator))
+
+        if coordinator.probe_filters is not None:
+            entities.append(WLANThermoProbeFilterSensor(coordinator))
+        entities.append(WLANThermoCookSummarySensor(coordinator))
+        for percentile in WLANThermoIngestLatencySensor.PERCENTILES:
+            entities.append(WLANThermoIngestLatencySensor(coordinator, percentile))
+        for stat in WLANThermoCadenceSensor.STATS:
+            entities.append(WLANThermoCadenceSensor(coordinator, stat))
+        if coordinator.http is not None:
+            entities.append(WLANThermoDataSourceSensor(coordinator))
 
         # Add channel temperature sensors
         if "channel" in coordinator.data:
             for idx, channel in enumerate(coordinator.data["channel"]):
                 entities.append(WLANThermoTemperatureSensor(coordinator, idx))
+                for minutes in coordinator.rate_windows:
+                    entities.append(WLANThermoTemperatureRateSensor(coordinator, idx, minutes))
+                entities.append(WLANThermoEtaSensor(coordinator, "channel", idx))
 
         # Add Pitmaster sensors
         if "pitmaster" in coordinator.data and "pm" in coordinator.data["pitmaster"]:
             for idx, pm in enumerate(coordinator.data["pitmaster"]["pm"]):
                 entities.append(WLANThermoPitmasterValueSensor(coordinator, idx))
+                entities.append(WLANThermoEtaSensor(coordinator, "pitmaster", idx))
+                for minutes in DUTY_WINDOWS:
+                    entities.append(WLANThermoPitmasterAverageSensor(coordinator, idx, minutes))
+                for stat in WLANThermoPitmasterDutySensor.STATS:
+                    entities.append(WLANThermoPitmasterDutySensor(coordinator, idx, stat))
+                entities.append(WLANThermoSoftwarePidSensor(coordinator, idx))
 
         async_add_entities(entities)
 
@@ -86,12 +149,18 @@ async def async_setup_entry(
         unsub = coordinator.async_add_listener(_data_received)
 
 
+def _lean_attributes(coordinator) -> bool:
+    """Return if the recorder-lean attribute mode is enabled."""
+    return coordinator.options.get(CONF_LEAN_ATTRIBUTES, DEFAULT_LEAN_ATTRIBUTES)
+
+
 class WLANThermoTemperatureSensor(CoordinatorEntity, SensorEntity):
     """Representation of a WLANThermo temperature sensor."""
 
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
 
     def __init__(self, coordinator, channel_idx: int) -> None:
         """Initialize the sensor."""
@@ -100,6 +169,10 @@ class WLANThermoTemperatureSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = (
             f"{coordinator.topic_prefix}_channel_{channel_idx}_temp"
         )
+        if coordinator.statistics is not None:
+            # Long-term statistics are imported by the coordinator in 5 minute
+            # buckets, so don't let the recorder compile them a second time
+            self._attr_state_class = None
 
     @property
     def name(self) -> str:
@@ -123,6 +196,10 @@ class WLANThermoTemperatureSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, any]:
         """Return the state attributes."""
+        if _lean_attributes(self.coordinator):
+            # Limits, type and color have their own number/select/text entities
+            return {ATTR_CHANNEL: self._channel_idx + 1}
+
         channel = self._get_channel_data()
         return {
             ATTR_CHANNEL: self._channel_idx + 1,
@@ -159,6 +236,333 @@ class WLANThermoTemperatureSensor(CoordinatorEntity, SensorEntity):
         return {}
 
 
+class WLANThermoTemperatureRateSensor(CoordinatorEntity, SensorEntity):
+    """Rate of change of a channel temperature over a sliding window."""
+
+    _attr_native_unit_of_measurement = f"{UnitOfTemperature.CELSIUS}/min"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:chart-line-variant"
+
+    def __init__(self, coordinator, channel_idx: int, minutes: int) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._channel_idx = channel_idx
+        self._minutes = minutes
+        self._attr_unique_id = (
+            f"{coordinator.topic_prefix}_channel_{channel_idx}_rate_{minutes}m"
+        )
+        self._attr_name = (
+            f"{coordinator.device_name} Channel {channel_idx + 1} Rate {minutes} min"
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the rate in °C/min."""
+        rate = self.coordinator.channel_rate(self._channel_idx, self._minutes)
+        return None if rate is None else round(rate, 2)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, f"{self.coordinator.topic_prefix}_channel_{self._channel_idx}")},
+            name=f"{self.coordinator.device_name} Channel {self._channel_idx + 1}",
+            via_device=(DOMAIN, self.coordinator.topic_prefix),
+            manufacturer="WLANThermo",
+            model="Channel Sensor",
+        )
+
+
+class WLANThermoEtaSensor(CoordinatorEntity, SensorEntity):
+    """Predicted time a channel reaches its target (or a pitmaster its set temp)."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:timer-sand"
+
+    def __init__(self, coordinator, kind: str, idx: int) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._kind = kind
+        self._idx = idx
+        self._attr_unique_id = f"{coordinator.topic_prefix}_{kind}_{idx}_eta"
+        self._attr_name = f"{coordinator.device_name} {kind.capitalize()} {idx + 1} ETA"
+
+    @property
+    def native_value(self):
+        """Return the predicted arrival, rounded to the minute."""
+        eta = self.coordinator.eta.get((self._kind, self._idx))
+        if eta is None or eta.arrival is None:
+            return None
+        return dt_util.utc_from_timestamp(round(eta.arrival / 60) * 60)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any] | None:
+        """Return remaining time, confidence and target."""
+        eta = self.coordinator.eta.get((self._kind, self._idx))
+        if eta is None:
+            return None
+        return {
+            "remaining_minutes": None if eta.remaining is None else round(eta.remaining / 60),
+            "confidence": eta.confidence,
+            "target": eta.target,
+        }
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        if self._kind == "pitmaster":
+            return DeviceInfo(
+                identifiers={(DOMAIN, f"{self.coordinator.topic_prefix}_pitmaster_{self._idx}")},
+                name=f"{self.coordinator.device_name} Pitmaster {self._idx + 1}",
+                via_device=(DOMAIN, self.coordinator.topic_prefix),
+                manufacturer="WLANThermo",
+                model="Pitmaster",
+            )
+        return DeviceInfo(
+            identifiers={(DOMAIN, f"{self.coordinator.topic_prefix}_channel_{self._idx}")},
+            name=f"{self.coordinator.device_name} Channel {self._idx + 1}",
+            via_device=(DOMAIN, self.coordinator.topic_prefix),
+            manufacturer="WLANThermo",
+            model="Channel Sensor",
+        )
+
+
+class WLANThermoProbeFilterSensor(CoordinatorEntity, SensorEntity):
+    """Number of samples corrected by the probe glitch filter."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:filter-outline"
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_name = f"{coordinator.device_name} Probe Filter Corrections"
+        self._attr_unique_id = f"{coordinator.topic_prefix}_probe_filter"
+
+    @property
+    def native_value(self) -> int:
+        """Return the total number of corrected samples."""
+        return sum(
+            f.spikes + f.dropouts_suppressed + f.reconnects_delayed
+            for f in self.coordinator.probe_filters
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return the statistics per channel."""
+        return {
+            f"channel_{idx + 1}": f.stats
+            for idx, f in enumerate(self.coordinator.probe_filters)
+        }
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return self.coordinator.device_info
+
+
+class WLANThermoCookSummarySensor(CoordinatorEntity, SensorEntity):
+    """Running statistics of the current cook session per channel.
+
+    The statistics are updated with every message, but the entity state is
+    only written once per interval.
+    """
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:clipboard-text-clock"
+    # The per-channel statistics are only useful live
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_name = f"{coordinator.device_name} Cook Summary"
+        self._attr_unique_id = f"{coordinator.topic_prefix}_cook_summary"
+        self._last_write = 0.0
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state at low frequency."""
+        now = time.monotonic()
+        if now - self._last_write < SUMMARY_UPDATE_INTERVAL:
+            return
+        self._last_write = now
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self):
+        """Return the start of the session."""
+        if self.coordinator.session_start is None:
+            return None
+        return dt_util.utc_from_timestamp(round(self.coordinator.session_start))
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return the statistics of all channels with samples."""
+        channels = self.coordinator.data.get("channel", [])
+        attributes = {}
+        for idx, summary in enumerate(self.coordinator.summaries):
+            if not summary.samples:
+                continue
+            name = channels[idx].get("name") if idx < len(channels) else None
+            attributes[f"channel_{idx + 1}"] = {"name": name, **summary.as_dict()}
+        return attributes
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return self.coordinator.device_info
+
+
+class WLANThermoIngestLatencySensor(CoordinatorEntity, SensorEntity):
+    """Rolling percentile of the end-to-end ingest latency.
+
+    End to end is from the device sample (or the MQTT receive time if the
+    device sends no timestamp) to the written states; the attributes split
+    it into transport, dispatch and processing. Written at low frequency.
+    """
+
+    PERCENTILES = (50, 95)
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:timer-sand"
+    # The stage breakdown is only useful live
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
+    def __init__(self, coordinator, percentile: int) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._percentile = percentile
+        self._attr_name = f"{coordinator.device_name} Ingest Latency p{percentile}"
+        self._attr_unique_id = f"{coordinator.topic_prefix}_ingest_latency_p{percentile}"
+        self._last_write = 0.0
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state at low frequency."""
+        now = time.monotonic()
+        if now - self._last_write < LATENCY_UPDATE_INTERVAL:
+            return
+        self._last_write = now
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the end-to-end latency percentile in ms."""
+        value = self.coordinator.latency.percentile(STAGE_TOTAL, self._percentile)
+        return None if value is None else round(value * 1000, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return the percentile of every ingest stage."""
+        return self.coordinator.latency.as_dict(self._percentile)
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return self.coordinator.device_info
+
+
+class WLANThermoCadenceSensor(CoordinatorEntity, SensorEntity):
+    """Message loss statistic from the telemetry cadence."""
+
+    # stat: (name, icon)
+    STATS = {
+        "missed": ("Missed Messages", "mdi:email-remove-outline"),
+        "longest_gap": ("Longest Message Gap", "mdi:timer-alert-outline"),
+        "delivery_ratio": ("Message Delivery Ratio", "mdi:email-check-outline"),
+    }
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator, stat: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._stat = stat
+        name, icon = self.STATS[stat]
+        self._attr_name = f"{coordinator.device_name} {name}"
+        self._attr_unique_id = f"{coordinator.topic_prefix}_{stat}"
+        self._attr_icon = icon
+        if stat == "missed":
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        elif stat == "longest_gap":
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
+        else:
+            self._attr_native_unit_of_measurement = PERCENTAGE
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic."""
+        cadence = self.coordinator.cadence
+        if self._stat == "missed":
+            return cadence.missed
+        if self._stat == "longest_gap":
+            return None if cadence.longest_gap is None else round(cadence.longest_gap, 1)
+        ratio = cadence.delivery_ratio
+        return None if ratio is None else round(ratio * 100, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any] | None:
+        """Return the cadence the statistics are judged by."""
+        if self._stat != "delivery_ratio":
+            return None
+        cadence = self.coordinator.cadence
+        median = cadence.median_interval
+        return {
+            "expected_interval": cadence.expected,
+            "median_interval": None if median is None else round(median, 1),
+            "received": cadence.received,
+            "outages": cadence.outages,
+        }
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return self.coordinator.device_info
+
+
+class WLANThermoDataSourceSensor(CoordinatorEntity, SensorEntity):
+    """Transport currently feeding the device data (MQTT or HTTP fallback)."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [SOURCE_MQTT, SOURCE_HTTP]
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:swap-horizontal"
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_name = f"{coordinator.device_name} Data Source"
+        self._attr_unique_id = f"{coordinator.topic_prefix}_data_source"
+
+    @property
+    def native_value(self) -> str:
+        """Return the active transport."""
+        return self.coordinator.http.source
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return the HTTP poll counters."""
+        http = self.coordinator.http
+        return {
+            "url": http.base_url,
+            "polls": http.polls,
+            "errors": http.errors,
+            "not_modified": http.not_modified,
+        }
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return self.coordinator.device_info
+
+
 class WLANThermoSystemSensor(CoordinatorEntity, SensorEntity):
     """Representation of a WLANThermo system sensor."""
 
@@ -195,11 +599,89 @@ class WLANThermoSystemSensor(CoordinatorEntity, SensorEntity):
         """Return device info."""
         return self.coordinator.device_info
 
+
+class WLANThermoBatteryRuntimeSensor(CoordinatorEntity, SensorEntity):
+    """Predicted remaining battery runtime of a portable unit."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_icon = "mdi:battery-clock"
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_name = f"{coordinator.device_name} Battery Runtime"
+        self._attr_unique_id = f"{coordinator.topic_prefix}_battery_runtime"
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the predicted runtime in minutes."""
+        runtime = self.coordinator.battery.runtime
+        return None if runtime is None else round(runtime / 60)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return confidence, charging state and discharge rate."""
+        battery = self.coordinator.battery
+        rate = battery.discharge_rate
+        return {
+            "confidence": None if battery.estimate is None else battery.estimate.confidence,
+            "charging": battery.charging,
+            "discharge_rate": None if rate is None else round(rate, 1),
+        }
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return self.coordinator.device_info
+
+class WLANThermoClockDriftSensor(CoordinatorEntity, SensorEntity):
+    """Offset of the device clock against the receive time of its messages."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:clock-alert-outline"
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_name = f"{coordinator.device_name} Clock Drift"
+        self._attr_unique_id = f"{coordinator.topic_prefix}_clock_drift"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the drift in seconds (positive = device ahead)."""
+        drift = self.coordinator.time_sync.drift
+        return None if drift is None else round(drift, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return the sync state."""
+        time_sync = self.coordinator.time_sync
+        return {
+            "sync_format": time_sync.format,
+            "syncs": time_sync.syncs,
+            "last_sync": (
+                None
+                if time_sync.last_sync is None
+                else dt_util.utc_from_timestamp(time_sync.last_sync).isoformat()
+            ),
+        }
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return self.coordinator.device_info
+
+
 class WLANThermoPitmasterValueSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Pitmaster Value Sensor (%)."""
 
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
 
     def __init__(self, coordinator, pm_idx: int) -> None:
         """Initialize the sensor."""
@@ -215,14 +697,18 @@ class WLANThermoPitmasterValueSensor(CoordinatorEntity, SensorEntity):
         return self._get_pm_data().get("value")
 
     @property
-    def extra_state_attributes(self) -> dict[str, any]:
+    def extra_state_attributes(self) -> dict[str, any] | None:
         """Attributes."""
+        if _lean_attributes(self.coordinator):
+            # Profile, set temp, mode and channel have their own select/number entities
+            return None
+
         pm = self._get_pm_data()
         return {
-            "pid": pm.get("pid"),
+            ATTR_PID: pm.get("pid"),
             "set": pm.get("set"),
-            "typ": pm.get("typ"),
-            "channel": pm.get("channel"),
+            ATTR_TYP: pm.get("typ"),
+            ATTR_CHANNEL: pm.get("channel"),
         }
 
     @property
@@ -244,3 +730,240 @@ class WLANThermoPitmasterValueSensor(CoordinatorEntity, SensorEntity):
         if self._pm_idx < len(pms):
             return pms[self._pm_idx]
         return {}
+
+
+class _PitmasterStatisticSensor(CoordinatorEntity, SensorEntity):
+    """Base for statistics sensors on the pitmaster device."""
+
+    def __init__(self, coordinator, pm_idx: int) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._pm_idx = pm_idx
+
+    def _duty_cycle(self):
+        """Return the actuator statistics of the pitmaster."""
+        if self._pm_idx < len(self.coordinator.duty_cycles):
+            return self.coordinator.duty_cycles[self._pm_idx]
+        return None
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, f"{self.coordinator.topic_prefix}_pitmaster_{self._pm_idx}")},
+            name=f"{self.coordinator.device_name} Pitmaster {self._pm_idx + 1}",
+            via_device=(DOMAIN, self.coordinator.topic_prefix),
+            manufacturer="WLANThermo",
+            model="Pitmaster",
+        )
+
+
+class WLANThermoPitmasterAverageSensor(_PitmasterStatisticSensor):
+    """Time-weighted average pitmaster output over a rolling window."""
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:fan-clock"
+
+    def __init__(self, coordinator, pm_idx: int, minutes: int) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, pm_idx)
+        self._minutes = minutes
+        self._attr_unique_id = f"{coordinator.topic_prefix}_pitmaster_{pm_idx}_avg_{minutes}m"
+        self._attr_name = f"{coordinator.device_name} Pitmaster {pm_idx + 1} Output Avg {minutes} min"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the average output in %."""
+        duty_cycle = self._duty_cycle()
+        if duty_cycle is None:
+            return None
+        average = duty_cycle.average(self._minutes, self.coordinator.last_update_time)
+        return None if average is None else round(average, 1)
+
+
+class WLANThermoPitmasterDutySensor(_PitmasterStatisticSensor):
+    """Session statistic of a pitmaster actuator."""
+
+    # stat: (name, icon)
+    STATS = {
+        "time_at_max": ("Time at 100%", "mdi:fan-chevron-up"),
+        "time_at_min": ("Time at 0%", "mdi:fan-off"),
+        "fan_on_time": ("Fan On Time", "mdi:fan"),
+        "transitions": ("On/Off Transitions", "mdi:swap-vertical"),
+    }
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator, pm_idx: int, stat: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, pm_idx)
+        self._stat = stat
+        name, icon = self.STATS[stat]
+        self._attr_unique_id = f"{coordinator.topic_prefix}_pitmaster_{pm_idx}_{stat}"
+        self._attr_name = f"{coordinator.device_name} Pitmaster {pm_idx + 1} {name}"
+        self._attr_icon = icon
+        if stat != "transitions":
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic for the current session."""
+        duty_cycle = self._duty_cycle()
+        if duty_cycle is None:
+            return None
+        value = getattr(duty_cycle, self._stat)
+        if self._stat == "transitions":
+            return value
+        return round(value / 60, 1)
+
+
+class WLANThermoSoftwarePidSensor(_PitmasterStatisticSensor):
+    """Loop timing of the HA-side software PID of a pitmaster.
+
+    The state is the 95th percentile of the tick lateness, so it shows if
+    the loop holds its period under load; the attributes carry the loop
+    state and the remaining timing statistics.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:timer-cog-outline"
+
+    def __init__(self, coordinator, pm_idx: int) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, pm_idx)
+        self._attr_unique_id = f"{coordinator.topic_prefix}_pitmaster_{pm_idx}_software_pid"
+        self._attr_name = f"{coordinator.device_name} Pitmaster {pm_idx + 1} Software PID Jitter"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the loop ticks."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_SOFTWARE_PID.format(self.coordinator.topic_prefix, self._pm_idx),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the 95th percentile of the tick lateness in ms."""
+        loop = self.coordinator.software_pitmasters.get(self._pm_idx)
+        if loop is None:
+            return None
+        lateness = loop.timing.lateness(0.95)
+        return None if lateness is None else round(lateness * 1000, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any] | None:
+        """Return the loop state and timing statistics."""
+        loop = self.coordinator.software_pitmasters.get(self._pm_idx)
+        if loop is None:
+            return None
+        return {
+            "status": loop.status,
+            "source": loop.source,
+            "setpoint": loop.setpoint,
+            "measurement": loop.measurement,
+            "output": None if loop.output is None else round(loop.output, 1),
+            **loop.timing.as_dict(),
+        }
+
+
+class _FleetSensor(SensorEntity):
+    """Base for integration-wide aggregates over all devices."""
+
+    _attr_should_poll = False
+
+    def __init__(self, fleet, key: str, name: str) -> None:
+        """Initialize the sensor."""
+        self._fleet = fleet
+        self._attr_name = f"WLANThermo {name}"
+        self._attr_unique_id = f"{DOMAIN}_fleet_{key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to index changes."""
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_FLEET_UPDATE, self.async_write_ha_state)
+        )
+
+
+class WLANThermoFleetHottestPitSensor(_FleetSensor):
+    """Hottest pit temperature across all devices."""
+
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:grill"
+
+    def __init__(self, fleet) -> None:
+        """Initialize the sensor."""
+        super().__init__(fleet, "hottest_pit", "Hottest Pit")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the hottest pit temperature."""
+        hottest = self._fleet.hottest_pit()
+        return None if hottest is None else hottest[0]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any] | None:
+        """Return the device and pitmaster of the hottest pit."""
+        hottest = self._fleet.hottest_pit()
+        if hottest is None:
+            return None
+        topic_prefix, pm_idx = hottest[1]
+        return {
+            "device": self._fleet.devices.get(topic_prefix),
+            "pitmaster": pm_idx + 1,
+        }
+
+
+class WLANThermoFleetAlarmSensor(_FleetSensor):
+    """Number of probes outside their alarm limits across all devices."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:thermometer-alert"
+
+    def __init__(self, fleet) -> None:
+        """Initialize the sensor."""
+        super().__init__(fleet, "probes_in_alarm", "Probes in Alarm")
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of probes in alarm."""
+        return len(self._fleet.alarms)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return the probes in alarm."""
+        return {"probes": sorted(self._fleet.alarms.values())}
+
+
+class WLANThermoFleetOfflineSensor(_FleetSensor):
+    """Number of offline devices."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:lan-disconnect"
+
+    def __init__(self, fleet) -> None:
+        """Initialize the sensor."""
+        super().__init__(fleet, "devices_offline", "Devices Offline")
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of offline devices."""
+        return len(self._fleet.offline)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return the offline devices."""
+        return {
+            "devices": sorted(self._fleet.devices.get(prefix, prefix) for prefix in self._fleet.offline),
+            "total": len(self._fleet.devices),
+        }
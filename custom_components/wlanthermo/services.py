@@ -0,0 +1,561 @@
+"""Services for the WLANThermo integration."""
+from __future__ import annotations
+
+import logging
+import os
+import time
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID, CONF_DEVICE_ID, Platform
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import (
+    AUTOTUNE_BASELINE_SECONDS,
+    AUTOTUNE_DEFAULT_DURATION,
+    AUTOTUNE_DEFAULT_STEP,
+    DATA_COORDINATOR,
+    DOMAIN,
+    EXPORT_DIR,
+    SERVICE_ANALYZE_SESSIONS,
+    SERVICE_APPLY_PRESET,
+    SERVICE_DELETE_PRESET,
+    SERVICE_EXPORT_SESSION,
+    SERVICE_PID_AUTOTUNE,
+    SERVICE_SAVE_PRESET,
+    SERVICE_SOFTWARE_PID_START,
+    SERVICE_SOFTWARE_PID_STOP,
+    SOFT_PID_DEFAULT_KD,
+    SOFT_PID_DEFAULT_KI,
+    SOFT_PID_DEFAULT_KP,
+    SOFT_PID_DEFAULT_PERIOD,
+)
+from .export import (
+    FORMAT_CSV,
+    FORMAT_JSONL,
+    ExportColumns,
+    archive_updates,
+    build_rows,
+    recorder_updates,
+    write_export,
+)
+from .presets import ALARM_MODES, async_get_presets, diff, resolve, snapshot
+from .software_pid import PidController, SoftwarePitmaster
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_SOURCE = "source"
+ATTR_FORMAT = "format"
+ATTR_CHANNELS = "channels"
+ATTR_PITMASTER_VALUE = "pitmaster_value"
+ATTR_SET_TEMP = "set_temp"
+ATTR_RESAMPLE = "resample"
+ATTR_FILENAME = "filename"
+ATTR_PITMASTER = "pitmaster"
+ATTR_MODE = "mode"
+ATTR_STEP = "step"
+ATTR_DURATION = "duration"
+ATTR_CHANNEL = "channel"
+ATTR_KP = "kp"
+ATTR_KI = "ki"
+ATTR_KD = "kd"
+ATTR_PERIOD = "period"
+ATTR_NAME = "name"
+ATTR_PRESET = "preset"
+ATTR_PITMASTERS = "pitmasters"
+
+SOURCE_ARCHIVE = "archive"
+SOURCE_RECORDER = "recorder"
+
+MODE_STEP_TEST = "step_test"
+MODE_RECORDED = "recorded"
+
+# Resample interval of recorded data for the model fit in seconds
+AUTOTUNE_RESAMPLE = 10
+
+EXPORT_SESSION_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): cv.string,
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_SOURCE): vol.In([SOURCE_ARCHIVE, SOURCE_RECORDER]),
+        vol.Optional(ATTR_FORMAT, default=FORMAT_CSV): vol.In([FORMAT_CSV, FORMAT_JSONL]),
+        vol.Optional(ATTR_CHANNELS): vol.All(cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1))]),
+        vol.Optional(ATTR_PITMASTER_VALUE, default=True): cv.boolean,
+        vol.Optional(ATTR_SET_TEMP, default=True): cv.boolean,
+        vol.Optional(ATTR_RESAMPLE): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_FILENAME): cv.string,
+    }
+)
+
+PID_AUTOTUNE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_PITMASTER, default=1): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_MODE, default=MODE_STEP_TEST): vol.In([MODE_STEP_TEST, MODE_RECORDED]),
+        vol.Optional(ATTR_STEP, default=AUTOTUNE_DEFAULT_STEP): vol.All(
+            vol.Coerce(float), vol.Range(min=-100, max=100)
+        ),
+        vol.Optional(ATTR_DURATION, default=AUTOTUNE_DEFAULT_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=5, max=240)
+        ),
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_SOURCE): vol.In([SOURCE_ARCHIVE, SOURCE_RECORDER]),
+        vol.Optional(ATTR_CHANNEL): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+ANALYZE_SESSIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_FILENAME): cv.string,
+    }
+)
+
+
+SOFTWARE_PID_START_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(CONF_DEVICE_ID): cv.string,
+            vol.Optional(ATTR_PITMASTER, default=1): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Required(ATTR_SET_TEMP): vol.All(vol.Coerce(float), vol.Range(min=0, max=400)),
+            vol.Optional(ATTR_CHANNEL): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(ATTR_ENTITY_ID): cv.entity_id,
+            vol.Optional(ATTR_KP, default=SOFT_PID_DEFAULT_KP): vol.Coerce(float),
+            vol.Optional(ATTR_KI, default=SOFT_PID_DEFAULT_KI): vol.Coerce(float),
+            vol.Optional(ATTR_KD, default=SOFT_PID_DEFAULT_KD): vol.Coerce(float),
+            vol.Optional(ATTR_PERIOD, default=SOFT_PID_DEFAULT_PERIOD): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=300)
+            ),
+        }
+    ),
+    cv.has_at_most_one_key(ATTR_CHANNEL, ATTR_ENTITY_ID),
+)
+
+SOFTWARE_PID_STOP_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_PITMASTER, default=1): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+
+PRESET_CHANNEL_SCHEMA = vol.Schema(
+    {
+        vol.Required("number"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("name"): cv.string,
+        vol.Optional("typ"): vol.Any(int, cv.string),
+        vol.Optional("min"): vol.Coerce(float),
+        vol.Optional("max"): vol.Coerce(float),
+        vol.Optional("alarm"): vol.Any(vol.In(list(ALARM_MODES)), vol.All(int, vol.Range(min=0, max=3))),
+        vol.Optional("color"): cv.string,
+    }
+)
+
+PRESET_PITMASTER_SCHEMA = vol.Schema(
+    {
+        vol.Required("number"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("channel"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("pid"): vol.Any(int, cv.string),
+        vol.Optional("set"): vol.Coerce(float),
+        vol.Optional("typ"): vol.In(["off", "manual", "auto"]),
+        vol.Optional("value"): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+    }
+)
+
+SAVE_PRESET_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_NAME): cv.string,
+        vol.Optional(CONF_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_CHANNELS): vol.All(cv.ensure_list, [PRESET_CHANNEL_SCHEMA]),
+        vol.Optional(ATTR_PITMASTERS): vol.All(cv.ensure_list, [PRESET_PITMASTER_SCHEMA]),
+    }
+)
+
+DELETE_PRESET_SCHEMA = vol.Schema({vol.Required(ATTR_NAME): cv.string})
+
+APPLY_PRESET_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): cv.string,
+        vol.Required(ATTR_PRESET): cv.string,
+    }
+)
+
+
+def get_coordinator(hass: HomeAssistant, device_id: str):
+    """Return the coordinator of a WLANThermo device."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        raise HomeAssistantError(f"Unknown device: {device_id}")
+
+    prefixes = {ident for domain, ident in device.identifiers if domain == DOMAIN}
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        coordinator = entry_data.get(DATA_COORDINATOR)
+        if coordinator is not None and coordinator.topic_prefix in prefixes:
+            return coordinator
+
+    raise HomeAssistantError(f"Device {device.name} is not a loaded WLANThermo device")
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+    if hass.services.has_service(DOMAIN, SERVICE_EXPORT_SESSION):
+        return
+
+    async def async_export_session(call: ServiceCall) -> None:
+        """Stream the samples of a device to a file in the config dir."""
+        coordinator = get_coordinator(hass, call.data[CONF_DEVICE_ID])
+
+        start = dt_util.as_utc(call.data[ATTR_START]).timestamp()
+        end = (
+            dt_util.as_utc(call.data[ATTR_END]).timestamp()
+            if ATTR_END in call.data
+            else time.time()
+        )
+        if end <= start:
+            raise HomeAssistantError("The end of the export must be after its start")
+
+        channel_count = len(coordinator.data.get("channel", []))
+        pm_count = len(coordinator.data.get("pitmaster", {}).get("pm", []))
+        columns = ExportColumns(
+            channels=[
+                number - 1
+                for number in call.data.get(ATTR_CHANNELS, range(1, channel_count + 1))
+                if number <= channel_count
+            ],
+            pitmasters=list(range(pm_count)),
+            pitmaster_value=call.data[ATTR_PITMASTER_VALUE],
+            set_temp=call.data[ATTR_SET_TEMP],
+        )
+        names = columns.names
+
+        output_format = call.data[ATTR_FORMAT]
+        filename = call.data.get(ATTR_FILENAME) or (
+            f"{slugify(coordinator.device_name)}_"
+            f"{dt_util.utc_from_timestamp(start):%Y%m%d%H%M}_"
+            f"{dt_util.utc_from_timestamp(end):%Y%m%d%H%M}"
+        )
+        # Only ever write into our own export directory
+        filename = os.path.basename(filename)
+        if not filename.endswith(f".{output_format}"):
+            filename = f"{filename}.{output_format}"
+        path = hass.config.path(EXPORT_DIR, filename)
+
+        source = call.data.get(ATTR_SOURCE) or (
+            SOURCE_ARCHIVE if coordinator.archive is not None else SOURCE_RECORDER
+        )
+        resample = call.data.get(ATTR_RESAMPLE)
+
+        if source == SOURCE_ARCHIVE:
+            if coordinator.archive is not None:
+                # Include the rows of the running session
+                await coordinator.archive.async_write_pending()
+            directory = coordinator.archive_directory
+            updates = archive_updates(directory, columns, start, end)
+            rows = build_rows(updates, names, resample, start if resample else None)
+            await hass.async_add_executor_job(write_export, path, rows, names, output_format)
+            return
+
+        from homeassistant.components.recorder import get_instance
+
+        entity_columns = _recorder_entity_columns(hass, coordinator.topic_prefix, columns)
+        updates = recorder_updates(hass, entity_columns, start, end)
+        rows = build_rows(updates, names, resample, start if resample else None)
+        await get_instance(hass).async_add_executor_job(
+            write_export, path, rows, names, output_format
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_EXPORT_SESSION, async_export_session, schema=EXPORT_SESSION_SCHEMA
+    )
+
+    async def async_pid_autotune(call: ServiceCall) -> None:
+        """Fit a pit model from a step response and propose PID parameters."""
+        try:
+            from . import autotune
+        except ImportError as err:
+            raise HomeAssistantError(f"PID auto-tuning needs NumPy: {err}") from err
+
+        coordinator = get_coordinator(hass, call.data[CONF_DEVICE_ID])
+        pms = coordinator.data.get("pitmaster", {}).get("pm", [])
+        pm_idx = call.data[ATTR_PITMASTER] - 1
+        if pm_idx >= len(pms):
+            raise HomeAssistantError(f"Unknown pitmaster: {pm_idx + 1}")
+
+        if call.data[ATTR_MODE] == MODE_STEP_TEST:
+            if coordinator.autotune_task is not None and not coordinator.autotune_task.done():
+                raise HomeAssistantError("A step test is already running on this device")
+            if (loop := coordinator.software_pitmasters.get(pm_idx)) is not None and loop.running:
+                raise HomeAssistantError("A software PID loop is running on this pitmaster")
+            if coordinator.pit_history(pm_idx) is None:
+                raise HomeAssistantError("The pitmaster has no valid channel")
+            test = autotune.StepTest(
+                coordinator, pm_idx, call.data[ATTR_STEP], call.data[ATTR_DURATION] * 60
+            )
+
+            async def async_run_step_test() -> None:
+                try:
+                    result = await test.async_run()
+                except ValueError as err:
+                    _LOGGER.warning(
+                        f"PID auto-tune for {coordinator.device_name} pitmaster {pm_idx + 1} failed: {err}"
+                    )
+                    return
+                autotune.async_report(coordinator, pm_idx, result)
+
+            _LOGGER.info(
+                f"Starting PID step test on {coordinator.device_name} pitmaster {pm_idx + 1}"
+            )
+            coordinator.autotune_task = hass.async_create_task(async_run_step_test())
+            return
+
+        # Recorded data: fit the largest output step in the time range
+        end = (
+            dt_util.as_utc(call.data[ATTR_END]).timestamp()
+            if ATTR_END in call.data
+            else time.time()
+        )
+        start = (
+            dt_util.as_utc(call.data[ATTR_START]).timestamp()
+            if ATTR_START in call.data
+            else coordinator.session_start or end - 6 * 3600
+        )
+        if end <= start:
+            raise HomeAssistantError("The end of the time range must be after its start")
+
+        channel = call.data.get(ATTR_CHANNEL) or pms[pm_idx].get("channel")
+        channel_count = len(coordinator.data.get("channel", []))
+        if not isinstance(channel, int) or not 0 < channel <= channel_count:
+            raise HomeAssistantError("The pitmaster has no valid channel")
+        columns = ExportColumns(
+            channels=[channel - 1],
+            pitmasters=[pm_idx],
+            pitmaster_value=True,
+            set_temp=False,
+        )
+        names = columns.names
+        temp_column, value_column = f"channel_{channel}", f"pitmaster_{pm_idx + 1}_value"
+        # Leave room for the baseline before the first step
+        rows_start = start - AUTOTUNE_BASELINE_SECONDS
+
+        def analyze(updates):
+            rows = build_rows(updates, names, AUTOTUNE_RESAMPLE, rows_start)
+            model, proposal = autotune.analyze_rows(rows, names, temp_column, value_column)
+            return autotune.result_data(model, proposal)
+
+        source = call.data.get(ATTR_SOURCE) or (
+            SOURCE_ARCHIVE if coordinator.archive is not None else SOURCE_RECORDER
+        )
+        try:
+            if source == SOURCE_ARCHIVE:
+                if coordinator.archive is not None:
+                    # The step may have just been recorded
+                    await coordinator.archive.async_write_pending()
+                updates = archive_updates(coordinator.archive_directory, columns, rows_start, end)
+                result = await hass.async_add_executor_job(analyze, updates)
+            else:
+                from homeassistant.components.recorder import get_instance
+
+                entity_columns = _recorder_entity_columns(hass, coordinator.topic_prefix, columns)
+                updates = recorder_updates(hass, entity_columns, rows_start, end)
+                result = await get_instance(hass).async_add_executor_job(analyze, updates)
+        except ValueError as err:
+            raise HomeAssistantError(f"PID auto-tune failed: {err}") from err
+        autotune.async_report(coordinator, pm_idx, result)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PID_AUTOTUNE, async_pid_autotune, schema=PID_AUTOTUNE_SCHEMA
+    )
+
+    async def async_analyze_sessions(call: ServiceCall) -> None:
+        """Compute cook metrics over the archived sessions of one or more devices."""
+        try:
+            from .analytics import run_analytics
+        except ImportError as err:
+            raise HomeAssistantError(f"Session analytics needs NumPy: {err}") from err
+
+        if CONF_DEVICE_ID in call.data:
+            coordinators = [
+                get_coordinator(hass, device_id) for device_id in call.data[CONF_DEVICE_ID]
+            ]
+        else:
+            coordinators = [
+                entry_data[DATA_COORDINATOR] for entry_data in hass.data.get(DOMAIN, {}).values()
+            ]
+        for coordinator in coordinators:
+            if coordinator.archive is not None:
+                # Include the rows of the running session
+                await coordinator.archive.async_write_pending()
+
+        start = dt_util.as_utc(call.data[ATTR_START]).timestamp() if ATTR_START in call.data else None
+        end = dt_util.as_utc(call.data[ATTR_END]).timestamp() if ATTR_END in call.data else None
+        filename = os.path.basename(
+            call.data.get(ATTR_FILENAME) or f"analytics_{dt_util.utcnow():%Y%m%d%H%M}"
+        )
+        if not filename.endswith(".json"):
+            filename = f"{filename}.json"
+        path = hass.config.path(EXPORT_DIR, filename)
+
+        directories = [coordinator.archive_directory for coordinator in coordinators]
+        await hass.async_add_executor_job(run_analytics, directories, path, start, end)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_ANALYZE_SESSIONS, async_analyze_sessions, schema=ANALYZE_SESSIONS_SCHEMA
+    )
+
+    async def async_software_pid_start(call: ServiceCall) -> None:
+        """Run an HA-side control loop driving the pitmaster's manual value."""
+        coordinator = get_coordinator(hass, call.data[CONF_DEVICE_ID])
+        pms = coordinator.data.get("pitmaster", {}).get("pm", [])
+        pm_idx = call.data[ATTR_PITMASTER] - 1
+        if pm_idx >= len(pms):
+            raise HomeAssistantError(f"Unknown pitmaster: {pm_idx + 1}")
+        if coordinator.autotune_task is not None and not coordinator.autotune_task.done():
+            raise HomeAssistantError("A step test is running on this device")
+
+        entity_id = call.data.get(ATTR_ENTITY_ID)
+        channel_idx = None
+        if entity_id is None:
+            channel = call.data.get(ATTR_CHANNEL) or pms[pm_idx].get("channel")
+            channel_count = len(coordinator.data.get("channel", []))
+            if not isinstance(channel, int) or not 0 < channel <= channel_count:
+                raise HomeAssistantError("The pitmaster has no valid channel")
+            channel_idx = channel - 1
+
+        # A running loop is replaced without handing control back in between
+        if (previous := coordinator.software_pitmasters.get(pm_idx)) is not None:
+            await previous.async_stop(hand_back=False)
+        loop = SoftwarePitmaster(
+            coordinator,
+            pm_idx,
+            call.data[ATTR_SET_TEMP],
+            call.data[ATTR_PERIOD],
+            PidController(call.data[ATTR_KP], call.data[ATTR_KI], call.data[ATTR_KD]),
+            channel_idx=channel_idx,
+            entity_id=entity_id,
+        )
+        coordinator.software_pitmasters[pm_idx] = loop
+        _LOGGER.info(
+            f"Starting software PID on {coordinator.device_name} pitmaster {pm_idx + 1} "
+            f"from {loop.source}"
+        )
+        loop.start()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SOFTWARE_PID_START,
+        async_software_pid_start,
+        schema=SOFTWARE_PID_START_SCHEMA,
+    )
+
+    async def async_software_pid_stop(call: ServiceCall) -> None:
+        """Stop the control loop and return the pitmaster to auto mode."""
+        coordinator = get_coordinator(hass, call.data[CONF_DEVICE_ID])
+        loop = coordinator.software_pitmasters.get(call.data[ATTR_PITMASTER] - 1)
+        if loop is not None:
+            await loop.async_stop()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SOFTWARE_PID_STOP,
+        async_software_pid_stop,
+        schema=SOFTWARE_PID_STOP_SCHEMA,
+    )
+
+    async def async_save_preset(call: ServiceCall) -> None:
+        """Store a cook preset, from a device's current settings and/or explicit values."""
+        preset = {"channels": [], "pitmasters": []}
+        if CONF_DEVICE_ID in call.data:
+            preset = snapshot(get_coordinator(hass, call.data[CONF_DEVICE_ID]).data)
+        for key in (ATTR_CHANNELS, ATTR_PITMASTERS):
+            if key in call.data:
+                preset[key] = call.data[key]
+        presets = await async_get_presets(hass)
+        await presets.async_set(call.data[ATTR_NAME], preset)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SAVE_PRESET, async_save_preset, schema=SAVE_PRESET_SCHEMA
+    )
+
+    async def async_delete_preset(call: ServiceCall) -> None:
+        """Delete a stored cook preset."""
+        presets = await async_get_presets(hass)
+        if not await presets.async_remove(call.data[ATTR_NAME]):
+            raise HomeAssistantError(f"Unknown preset: {call.data[ATTR_NAME]}")
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_DELETE_PRESET, async_delete_preset, schema=DELETE_PRESET_SCHEMA
+    )
+
+    async def async_apply_preset(call: ServiceCall) -> None:
+        """Write the settings of a cook preset that differ from the device."""
+        coordinator = get_coordinator(hass, call.data[CONF_DEVICE_ID])
+        presets = await async_get_presets(hass)
+        preset = presets.presets.get(call.data[ATTR_PRESET])
+        if preset is None:
+            raise HomeAssistantError(f"Unknown preset: {call.data[ATTR_PRESET]}")
+        try:
+            channels, pitmasters = resolve(preset, coordinator.data)
+        except ValueError as err:
+            raise HomeAssistantError(f"Preset does not fit {coordinator.device_name}: {err}") from err
+
+        channel_changes = diff(coordinator.data.get("channel", []), channels)
+        pm_changes = diff(coordinator.data.get("pitmaster", {}).get("pm", []), pitmasters)
+        _LOGGER.info(
+            f"Applying preset {call.data[ATTR_PRESET]} to {coordinator.device_name}: "
+            f"{len(channel_changes)} channels, {len(pm_changes)} pitmasters changed"
+        )
+        await coordinator.async_apply_changes(channel_changes, pm_changes)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_APPLY_PRESET, async_apply_preset, schema=APPLY_PRESET_SCHEMA
+    )
+
+
+def _recorder_entity_columns(
+    hass: HomeAssistant, topic_prefix: str, columns: ExportColumns
+) -> dict[str, str]:
+    """Map the recorded entity ids of a device to export columns."""
+    registry = er.async_get(hass)
+    unique_ids: dict[tuple[str, str], str] = {}
+    for idx in columns.channels:
+        unique_ids[(Platform.SENSOR, f"{topic_prefix}_channel_{idx}_temp")] = f"channel_{idx + 1}"
+    for idx in columns.pitmasters:
+        if columns.pitmaster_value:
+            unique_ids[(Platform.SENSOR, f"{topic_prefix}_pitmaster_{idx}_value")] = (
+                f"pitmaster_{idx + 1}_value"
+            )
+        if columns.set_temp:
+            unique_ids[(Platform.NUMBER, f"{topic_prefix}_pitmaster_{idx}_set_temp")] = (
+                f"pitmaster_{idx + 1}_set"
+            )
+
+    entity_columns: dict[str, str] = {}
+    for (platform, unique_id), column in unique_ids.items():
+        if entity_id := registry.async_get_entity_id(platform, DOMAIN, unique_id):
+            entity_columns[entity_id] = column
+    return entity_columns
+
+
+async def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the integration services once the last entry is unloaded."""
+    if hass.data.get(DOMAIN):
+        return
+    hass.services.async_remove(DOMAIN, SERVICE_EXPORT_SESSION)
+    hass.services.async_remove(DOMAIN, SERVICE_PID_AUTOTUNE)
+    hass.services.async_remove(DOMAIN, SERVICE_ANALYZE_SESSIONS)
+    hass.services.async_remove(DOMAIN, SERVICE_SOFTWARE_PID_START)
+    hass.services.async_remove(DOMAIN, SERVICE_SOFTWARE_PID_STOP)
+    hass.services.async_remove(DOMAIN, SERVICE_SAVE_PRESET)
+    hass.services.async_remove(DOMAIN, SERVICE_DELETE_PRESET)
+    hass.services.async_remove(DOMAIN, SERVICE_APPLY_PRESET)
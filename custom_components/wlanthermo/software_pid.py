@@ -0,0 +1,281 @@
+"""HA-side software control loop for a pitmaster."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import (
+    EVENT_SOFTWARE_PID,
+    SIGNAL_SOFTWARE_PID,
+    SOFT_PID_STALE_PERIODS,
+)
+from .cook_summary import P2Quantile
+
+_LOGGER = logging.getLogger(__name__)
+
+STATUS_RUNNING = "running"
+STATUS_STOPPED = "stopped"
+STATUS_FALLBACK = "fallback"
+
+
+class PidController:
+    """PID controller with anti-windup (output in %, error in °C, time in s).
+
+    The derivative acts on the measurement, so a setpoint change doesn't
+    kick the output. The integral only accumulates while the output isn't
+    saturated in the direction of the error (conditional integration) and
+    stays within the output range, so it doesn't wind up while the fire
+    can't keep up.
+    """
+
+    def __init__(
+        self, kp: float, ki: float, kd: float, output_min: float = 0, output_max: float = 100
+    ) -> None:
+        """Initialize the controller."""
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self.output_min = output_min
+        self.output_max = output_max
+        self.reset()
+
+    def reset(self, output: float = 0) -> None:
+        """Start over, holding the given output (bumpless start)."""
+        self.integral = min(max(output, self.output_min), self.output_max)
+        self._last_measurement: float | None = None
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.output_min), self.output_max)
+
+    def update(self, setpoint: float, measurement: float, dt: float) -> float:
+        """Return the output for a new measurement dt seconds after the last."""
+        error = setpoint - measurement
+        proportional = self.kp * error
+        derivative = 0.0
+        if self._last_measurement is not None and dt > 0:
+            derivative = -self.kd * (measurement - self._last_measurement) / dt
+        self._last_measurement = measurement
+
+        integral = self.integral + self.ki * error * dt
+        unclamped = proportional + integral + derivative
+        saturated = (unclamped > self.output_max and error > 0) or (
+            unclamped < self.output_min and error < 0
+        )
+        if not saturated:
+            self.integral = self._clamp(integral)
+        return self._clamp(proportional + self.integral + derivative)
+
+
+class LoopTiming:
+    """Timing statistics of a periodic loop.
+
+    Lateness is the delay of a tick behind its scheduled deadline (the
+    jitter the event loop adds); ticks that are more than a whole period
+    late are skipped and counted as missed.
+    """
+
+    def __init__(self, period: float) -> None:
+        """Initialize the statistics."""
+        self.period = period
+        self.ticks = 0
+        self.missed = 0
+        self.max_lateness = 0.0
+        self.max_duration = 0.0
+        self._lateness = {p: P2Quantile(p) for p in (0.5, 0.95)}
+
+    def add(self, lateness: float, duration: float) -> None:
+        """Add a tick."""
+        self.ticks += 1
+        self.max_lateness = max(self.max_lateness, lateness)
+        self.max_duration = max(self.max_duration, duration)
+        for quantile in self._lateness.values():
+            quantile.add(lateness)
+
+    def lateness(self, p: float) -> float | None:
+        """Return a lateness quantile (0.5 or 0.95) in seconds."""
+        return self._lateness[p].value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in milliseconds."""
+        def ms(value: float | None) -> float | None:
+            return None if value is None else round(value * 1000, 1)
+
+        return {
+            "period": self.period,
+            "ticks": self.ticks,
+            "missed_ticks": self.missed,
+            "lateness_p50_ms": ms(self.lateness(0.5)),
+            "lateness_p95_ms": ms(self.lateness(0.95)),
+            "lateness_max_ms": ms(self.max_lateness),
+            "step_max_ms": ms(self.max_duration),
+        }
+
+
+class SoftwarePitmaster:
+    """Control loop over a channel or HA entity driving a pitmaster's manual value.
+
+    Ticks are scheduled on absolute deadlines of the event loop clock, so
+    lateness of one tick doesn't shift the following ones. Without fresh
+    input data or while the device is offline the loop hands control back
+    to the device's auto mode.
+    """
+
+    def __init__(
+        self,
+        coordinator,
+        pm_idx: int,
+        setpoint: float,
+        period: float,
+        controller: PidController,
+        channel_idx: int | None = None,
+        entity_id: str | None = None,
+    ) -> None:
+        """Initialize the loop."""
+        self.coordinator = coordinator
+        self.pm_idx = pm_idx
+        self.setpoint = setpoint
+        self.period = period
+        self.controller = controller
+        self.channel_idx = channel_idx
+        self.entity_id = entity_id
+        self.timing = LoopTiming(period)
+        self.status = STATUS_STOPPED
+        self.measurement: float | None = None
+        self.output: float | None = None
+        self._task: asyncio.Task | None = None
+        self._last_step: float | None = None
+
+    @property
+    def source(self) -> str:
+        """Return a description of the input."""
+        return self.entity_id or f"channel {self.channel_idx + 1}"
+
+    @property
+    def running(self) -> bool:
+        """Return if the loop is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the loop from the current pitmaster output."""
+        pm = self.coordinator.data["pitmaster"]["pm"][self.pm_idx]
+        value = pm.get("value")
+        self.controller.reset(value if isinstance(value, (int, float)) else 0)
+        self.status = STATUS_RUNNING
+        self._task = self.coordinator.hass.async_create_task(self._async_run())
+
+    async def async_stop(self, hand_back: bool = True) -> None:
+        """Stop the loop and optionally return the pitmaster to auto mode."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.status == STATUS_RUNNING:
+            self.status = STATUS_STOPPED
+            if hand_back:
+                await self._async_hand_back()
+            self._notify()
+
+    def _read_input(self) -> tuple[float, float] | None:
+        """Return the latest (timestamp, temperature) of the input."""
+        if self.entity_id is not None:
+            state = self.coordinator.hass.states.get(self.entity_id)
+            if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                return None
+            try:
+                temp = float(state.state)
+            except ValueError:
+                return None
+            # last_reported also moves when an unchanged value is written
+            reported = getattr(state, "last_reported", state.last_updated)
+            return reported.timestamp(), temp
+        if self.channel_idx >= len(self.coordinator.channel_history):
+            return None
+        return self.coordinator.channel_history[self.channel_idx].latest()
+
+    async def _async_run(self) -> None:
+        """Run the loop on fixed deadlines."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            deadline += self.period
+            await asyncio.sleep(deadline - loop.time())
+            started = loop.time()
+            lateness = started - deadline
+            if lateness >= self.period:
+                skipped = int(lateness // self.period)
+                self.timing.missed += skipped
+                deadline += skipped * self.period
+                lateness -= skipped * self.period
+            if not await self._async_step(time.time()):
+                return
+            self.timing.add(lateness, loop.time() - started)
+            self._notify()
+
+    async def _async_step(self, now: float) -> bool:
+        """Compute and write a new output, False after falling back."""
+        coordinator = self.coordinator
+        sample = self._read_input()
+        period = self.period
+        if self.entity_id is None:
+            # Channel data can't be fresher than the device publishes it
+            period = max(period, coordinator.publish_interval or 0)
+        reason = None
+        if coordinator.data.get("system", {}).get("online") is False:
+            reason = "offline"
+        elif sample is None:
+            reason = "no_data"
+        elif now - sample[0] > SOFT_PID_STALE_PERIODS * period:
+            reason = "stale_data"
+        if reason is not None:
+            await self._async_fall_back(reason)
+            return False
+
+        self.measurement = sample[1]
+        dt = self.period if self._last_step is None else now - self._last_step
+        self._last_step = now
+        self.output = self.controller.update(self.setpoint, sample[1], dt)
+
+        pm = coordinator.data["pitmaster"]["pm"][self.pm_idx]
+        value = round(self.output)
+        if pm.get("typ") != "manual" or pm.get("value") != value:
+            await coordinator.async_publish_pitmaster(self.pm_idx, typ="manual", value=value)
+        return True
+
+    async def _async_fall_back(self, reason: str) -> None:
+        """Hand control back to the device after losing the input."""
+        coordinator = self.coordinator
+        _LOGGER.warning(
+            f"Software PID on {coordinator.device_name} pitmaster {self.pm_idx + 1} "
+            f"falls back to auto mode ({reason})"
+        )
+        self.status = STATUS_FALLBACK
+        await self._async_hand_back()
+        coordinator.async_fire_event(
+            EVENT_SOFTWARE_PID,
+            {
+                "type": "fallback",
+                "reason": reason,
+                "pitmaster": self.pm_idx + 1,
+                "source": self.source,
+            },
+        )
+        self._notify()
+
+    async def _async_hand_back(self) -> None:
+        """Return the pitmaster to auto mode at the loop's setpoint."""
+        await self.coordinator.async_publish_pitmaster(self.pm_idx, typ="auto", set=self.setpoint)
+
+    def _notify(self) -> None:
+        """Tell the timing sensor about a new tick."""
+        async_dispatcher_send(
+            self.coordinator.hass,
+            SIGNAL_SOFTWARE_PID.format(self.coordinator.topic_prefix, self.pm_idx),
+        )
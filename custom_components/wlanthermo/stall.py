@@ -0,0 +1,76 @@
+"""Streaming stall (temperature plateau) detection for WLANThermo channels."""
+from __future__ import annotations
+
+from .const import (
+    STALL_ENTER_RATE,
+    STALL_EXIT_RATE,
+    STALL_MAX_TEMP,
+    STALL_MIN_TEMP,
+)
+from .streaming import WindowedRegression
+
+STALL_START = "start"
+STALL_END = "end"
+
+
+class StallDetector:
+    """Detect the plateau of a meat probe from its windowed slope.
+
+    A stall starts once a channel that has been rising flattens below the
+    enter rate over a fully covered window, inside the typical stall
+    temperature band. It only ends once the slope climbs above the (higher)
+    exit rate again or the probe leaves the band, so noise around the
+    threshold doesn't toggle the state.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the detector."""
+        self.active = False
+        self.start: float | None = None
+        self.end: float | None = None
+        self._was_rising = False
+
+    def duration(self, now: float) -> float | None:
+        """Return the duration of the current (or last) stall in seconds."""
+        if self.start is None:
+            return None
+        return (now if self.active else self.end or now) - self.start
+
+    def reset(self, now: float) -> str | None:
+        """Reset when the probe is disconnected. Returns STALL_END if a stall ended."""
+        was_active = self.active
+        self.active = False
+        self._was_rising = False
+        if was_active:
+            self.end = now
+            return STALL_END
+        return None
+
+    def update(self, regression: WindowedRegression, temp: float, now: float) -> str | None:
+        """Feed the current state. Returns STALL_START/STALL_END on transitions."""
+        slope = regression.slope
+        if slope is None or regression.span < regression.window * 0.9:
+            return None
+        rate = slope * 60  # °C/min
+
+        if rate > STALL_EXIT_RATE:
+            self._was_rising = True
+
+        if self.active:
+            if rate > STALL_EXIT_RATE or not STALL_MIN_TEMP - 5 <= temp <= STALL_MAX_TEMP:
+                self.active = False
+                self.end = now
+                return STALL_END
+            return None
+
+        if (
+            self._was_rising
+            and rate < STALL_ENTER_RATE
+            and STALL_MIN_TEMP <= temp <= STALL_MAX_TEMP
+        ):
+            self.active = True
+            # The plateau began roughly when the window started flattening
+            self.start = now - regression.window
+            self.end = None
+            return STALL_START
+        return None
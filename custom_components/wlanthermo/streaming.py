@@ -0,0 +1,225 @@
+"""Streaming sample buffers and estimators for WLANThermo data.
+
+Everything in here is updated in O(1) (amortized) per sample and uses a
+fixed amount of memory, so it can run on every received MQTT message.
+"""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+
+# Timestamps are stored relative to a base to keep the running sums of
+# t and t² numerically stable. The base is moved forward (and the sums
+# recomputed from the buffer) once samples get this far away from it.
+REBASE_SECONDS = 6 * 3600
+
+
+class SampleRingBuffer:
+    """Fixed-capacity ring buffer of (timestamp, value) samples.
+
+    Samples are addressed by a monotonically increasing sequence number;
+    the buffer holds the sequence numbers ``first_seq .. next_seq - 1``.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the buffer."""
+        self.capacity = capacity
+        self._ts = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self.next_seq = 0
+        self._start_seq = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored samples."""
+        return min(self.next_seq - self._start_seq, self.capacity)
+
+    @property
+    def first_seq(self) -> int:
+        """Return the sequence number of the oldest stored sample."""
+        return self.next_seq - len(self)
+
+    @property
+    def full(self) -> bool:
+        """Return if the next append overwrites the oldest sample."""
+        return len(self) == self.capacity
+
+    def append(self, ts: float, value: float) -> int:
+        """Append a sample and return its sequence number."""
+        seq = self.next_seq
+        pos = seq % self.capacity
+        self._ts[pos] = ts
+        self._values[pos] = value
+        self.next_seq += 1
+        return seq
+
+    def timestamp(self, seq: int) -> float:
+        """Return the timestamp of a stored sample."""
+        return self._ts[seq % self.capacity]
+
+    def value(self, seq: int) -> float:
+        """Return the value of a stored sample."""
+        return self._values[seq % self.capacity]
+
+    def latest(self) -> tuple[float, float] | None:
+        """Return the newest sample."""
+        if not len(self):
+            return None
+        seq = self.next_seq - 1
+        return self.timestamp(seq), self.value(seq)
+
+    def samples(self, first_seq: int | None = None) -> Iterator[tuple[float, float]]:
+        """Yield the stored samples from first_seq (or the oldest) on, oldest first."""
+        seq = self.first_seq if first_seq is None else max(first_seq, self.first_seq)
+        while seq < self.next_seq:
+            yield self.timestamp(seq), self.value(seq)
+            seq += 1
+
+    def clear(self) -> None:
+        """Drop all samples (sequence numbers keep counting)."""
+        self._start_seq = self.next_seq
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        """Yield all stored samples, oldest first."""
+        return self.samples()
+
+
+class WindowedRegression:
+    """Least-squares line over the samples of a sliding time window.
+
+    Keeps running sums of t, y, t², ty and y² over the samples in the
+    window. Each new sample is added and samples that left the window are
+    subtracted again, so slope and fit quality cost O(1) per sample instead
+    of a scan over the history.
+    """
+
+    def __init__(self, buffer: SampleRingBuffer, window: float) -> None:
+        """Initialize the regression over a buffer."""
+        self.buffer = buffer
+        self.window = window
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self.tail = self.buffer.next_seq
+        self._base: float | None = None
+        self.count = 0
+        self._st = self._sy = self._stt = self._sty = self._syy = 0.0
+
+    def _accumulate(self, seq: int, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a sample from the sums."""
+        t = self.buffer.timestamp(seq) - self._base
+        y = self.buffer.value(seq)
+        self.count += sign
+        self._st += sign * t
+        self._sy += sign * y
+        self._stt += sign * t * t
+        self._sty += sign * t * y
+        self._syy += sign * y * y
+
+    def add(self, seq: int) -> None:
+        """Add the sample with the given sequence number and slide the window."""
+        ts = self.buffer.timestamp(seq)
+        if self._base is None:
+            self._base = ts
+        elif ts - self._base > REBASE_SECONDS:
+            self._rebase(ts)
+        self._accumulate(seq, 1)
+
+        # Evict samples that fell out of the window (always keep the newest)
+        cutoff = ts - self.window
+        while self.tail < seq and self.buffer.timestamp(self.tail) < cutoff:
+            self._accumulate(self.tail, -1)
+            self.tail += 1
+
+    def evict_through(self, seq: int) -> None:
+        """Remove samples up to seq, before the buffer overwrites them."""
+        while self.tail <= seq and self.count:
+            self._accumulate(self.tail, -1)
+            self.tail += 1
+
+    def _rebase(self, ts: float) -> None:
+        """Move the time base and recompute the sums from the buffer."""
+        tail, end = self.tail, self.buffer.next_seq
+        self.reset()
+        self._base = ts
+        self.tail = tail
+        for seq in range(tail, end - 1):
+            self._accumulate(seq, 1)
+
+    @property
+    def span(self) -> float:
+        """Return the time covered by the samples in the window."""
+        if self.count < 2:
+            return 0.0
+        return self.buffer.timestamp(self.buffer.next_seq - 1) - self.buffer.timestamp(self.tail)
+
+    @property
+    def slope(self) -> float | None:
+        """Return the slope in units per second."""
+        if self.count < 2:
+            return None
+        denominator = self.count * self._stt - self._st * self._st
+        if denominator <= 0:
+            return None
+        return (self.count * self._sty - self._st * self._sy) / denominator
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean value in the window."""
+        if not self.count:
+            return None
+        return self._sy / self.count
+
+    @property
+    def r_squared(self) -> float | None:
+        """Return the coefficient of determination of the fit (0..1)."""
+        if self.count < 3:
+            return None
+        n = self.count
+        stt = n * self._stt - self._st * self._st
+        syy = n * self._syy - self._sy * self._sy
+        sty = n * self._sty - self._st * self._sy
+        if stt <= 0:
+            return None
+        if syy <= 1e-9:
+            return 1.0  # Perfectly flat
+        return max(0.0, min(1.0, sty * sty / (stt * syy)))
+
+
+class SampleHistory:
+    """Recent samples of one signal plus sliding-window regressions over them."""
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the history."""
+        self.buffer = SampleRingBuffer(capacity)
+        self._windows: dict[float, WindowedRegression] = {}
+
+    def window(self, seconds: float) -> WindowedRegression:
+        """Return the regression over a window, creating it on first use."""
+        regression = self._windows.get(seconds)
+        if regression is None:
+            regression = self._windows[seconds] = WindowedRegression(self.buffer, seconds)
+        return regression
+
+    def add(self, ts: float, value: float) -> None:
+        """Add a sample. Samples must arrive in time order."""
+        latest = self.buffer.latest()
+        if latest is not None and ts <= latest[0]:
+            return
+        if self.buffer.full:
+            oldest = self.buffer.first_seq
+            for regression in self._windows.values():
+                regression.evict_through(oldest)
+        seq = self.buffer.append(ts, value)
+        for regression in self._windows.values():
+            regression.add(seq)
+
+    def latest(self) -> tuple[float, float] | None:
+        """Return the newest sample."""
+        return self.buffer.latest()
+
+    def clear(self) -> None:
+        """Drop all samples, e.g. when a probe is unplugged."""
+        self.buffer.clear()
+        for regression in self._windows.values():
+            regression.reset()
@@ -5,7 +5,6 @@ import json
 import logging
 from typing import Any
 
-from homeassistant.components import mqtt
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
@@ -107,7 +106,7 @@ class WLANThermoChannelAlarmSwitch(CoordinatorEntity, SwitchEntity):
         topic = f"{self.coordinator.topic_prefix}/{TOPIC_SET_CHANNELS}"
         
         _LOGGER.debug(f"Setting Alarm for channel {self._channel_idx + 1} to {state} on topic {topic}")
-        await mqtt.async_publish(self.hass, topic, json.dumps(payload))
+        await self.coordinator.async_mqtt_publish(topic, json.dumps(payload))
 
         # Optimistic update
         self.coordinator.data["channel"][self._channel_idx]["alarm"] = state
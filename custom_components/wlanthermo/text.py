@@ -4,7 +4,6 @@ from __future__ import annotations
 import json
 import logging
 
-from homeassistant.components import mqtt
 from homeassistant.components.text import TextEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
@@ -102,7 +101,7 @@ class WLANThermoChannelNameText(CoordinatorEntity, TextEntity):
         payload = {"number": self._channel_idx + 1, "name": value}
         
         _LOGGER.debug(f"Setting Name for channel {self._channel_idx + 1} to '{value}' on topic {topic}")
-        await mqtt.async_publish(self.hass, topic, json.dumps(payload))
+        await self.coordinator.async_mqtt_publish(topic, json.dumps(payload))
 
         # Optimistic update
         self.coordinator.data["channel"][self._channel_idx]["name"] = value
@@ -161,7 +160,7 @@ class WLANThermoChannelColorText(CoordinatorEntity, TextEntity):
         payload = {"number": self._channel_idx + 1, "color": value}
         
         _LOGGER.debug(f"Setting Color for channel {self._channel_idx + 1} to '{value}' on topic {topic}")
-        await mqtt.async_publish(self.hass, topic, json.dumps(payload))
+        await self.coordinator.async_mqtt_publish(topic, json.dumps(payload))
 
         # Optimistic update
         self.coordinator.data["channel"][self._channel_idx]["color"] = value
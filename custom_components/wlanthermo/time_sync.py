@@ -0,0 +1,86 @@
+"""Device clock drift measurement and time sync scheduling."""
+from __future__ import annotations
+
+from collections import deque
+from statistics import median
+
+from .const import (
+    TIME_SYNC_MIN_INTERVAL,
+    TIME_SYNC_SAMPLES,
+    TIME_SYNC_THRESHOLD,
+    TIME_SYNC_VERIFY_SAMPLES,
+)
+
+FORMAT_NESTED = "nested"  # {"system": {"time": ...}} to set
+FORMAT_FLAT = "flat"  # {"time": ...} to set/system
+FORMATS = (FORMAT_NESTED, FORMAT_FLAT)
+
+
+class TimeSync:
+    """Drift of the device clock against the receive time of its messages.
+
+    The drift is the median over the latest samples, which hides single
+    delayed messages. A resync is due once it exceeds the threshold. One
+    payload format is tried at a time and judged by the drift afterwards,
+    so the scheduler learns which format the device honors; if neither
+    works, both are sent.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._samples: deque[float] = deque(maxlen=TIME_SYNC_SAMPLES)
+        self._last_drift: float | None = None
+        self.format: str | None = None  # Learned format
+        self.failed: set[str] = set()
+        self.pending: tuple[str, ...] | None = None  # Formats of the last sync, unverified
+        self.last_sync: float | None = None
+        self.syncs = 0
+
+    @property
+    def drift(self) -> float | None:
+        """Return the device clock offset in seconds (positive = ahead).
+
+        Until new messages arrive after a sync, this is the drift before it.
+        """
+        return median(self._samples) if self._samples else self._last_drift
+
+    def observe(self, device_time: float, now: float) -> tuple[str, ...] | None:
+        """Add a device timestamp, return the formats to send if a sync is due."""
+        self._samples.append(device_time - now)
+        if len(self._samples) < TIME_SYNC_VERIFY_SAMPLES:
+            return None
+        in_sync = abs(self.drift) <= TIME_SYNC_THRESHOLD
+
+        retry = False
+        if self.pending is not None:
+            if len(self.pending) == 1:
+                if in_sync:
+                    self.format = self.pending[0]
+                else:
+                    self.failed.add(self.pending[0])
+                    if self.format == self.pending[0]:
+                        # The learned format stopped working (e.g. new firmware)
+                        self.format = None
+                    retry = True
+            self.pending = None
+
+        if in_sync:
+            return None
+        if not retry and self.last_sync is not None and now - self.last_sync < TIME_SYNC_MIN_INTERVAL:
+            return None
+
+        if self.format is not None:
+            formats: tuple[str, ...] = (self.format,)
+        else:
+            untried = [fmt for fmt in FORMATS if fmt not in self.failed]
+            formats = (untried[0],) if untried else FORMATS
+        self.sent(formats, now)
+        return formats
+
+    def sent(self, formats: tuple[str, ...], now: float) -> None:
+        """Record a sync; the drift is measured anew from here."""
+        self.pending = formats
+        self.last_sync = now
+        self.syncs += 1
+        self._last_drift = self.drift
+        self._samples.clear()